@@ -6,7 +6,7 @@
 
 from celery import Celery
 
-from config import redis_settings, timezone_settings
+from config import middleware_settings, redis_settings, timezone_settings
 
 celery_app = Celery(
     "project",
@@ -24,3 +24,10 @@ celery_app.conf.update(
     enable_utc=False,
     beat_schedule={},
 )
+
+# 접속 로그 통계 집계 테이블 주기 갱신 (0 이면 등록하지 않음)
+if middleware_settings.ACCESS_LOG_STATS_REFRESH_SECONDS > 0:
+    celery_app.conf.beat_schedule["home.aggregate_access_stats"] = {
+        "task": "home.aggregate_access_stats",
+        "schedule": middleware_settings.ACCESS_LOG_STATS_REFRESH_SECONDS,
+    }
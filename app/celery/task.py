@@ -6,7 +6,7 @@ into that sync context by reusing a single, long-lived event loop **per worker
 process**.
 
 이전 구현은 매 호출 ``asyncio.run()`` 으로 이벤트 루프를 새로 열고 닫았다.
-그러나 async DB 커넥션(aiomysql)은 자신을 생성한 루프에 바인딩되고,
+그러나 async DB 커넥션(asyncmy)은 자신을 생성한 루프에 바인딩되고,
 ``background_engine`` 의 커넥션 풀은 그 커넥션을 태스크 간 캐시·재사용한다.
 루프가 매번 닫히면 두 번째 태스크가 '종료된 루프에 묶인' 커넥션을 재사용하며
 ``RuntimeError: Event loop is closed`` 로 확정 실패한다(검수 C1/REQ-008).
@@ -15,11 +15,17 @@ from app.domains.home.services.user_access_log_service import UserAccessLogServi
 
 @celery_app.task(name="home.aggregate_access_stats")
 def aggregate_access_stats() -> dict[str, Any]:
-    """접속 로그 통계를 집계하여 반환한다(예시 태스크)."""
+    """접속 로그 통계 집계 테이블을 갱신하고 전체 건수를 반환한다.
+
+    /access-logs/stats 는 이 집계 테이블을 읽으므로, beat 주기
+    (ACCESS_LOG_STATS_REFRESH_SECONDS)만큼 늦게 반영된다.
+    """
 
     async def _run() -> dict[str, Any]:
         async with background_session() as session:
-            stats = await UserAccessLogService(session).get_stats()
+            service = UserAccessLogService(session)
+            await service.refresh_stats()
+            stats = await service.get_stats()
             return {"total": stats.total_count}
 
     result: dict[str, Any] = run_async(_run())
@@ -0,0 +1,106 @@
+"""
+커넥션 풀 생존 확인 (idle 기반 ping) · 반납 시 조건부 롤백
+
+``pool_pre_ping=True`` 는 체크아웃마다 ping 을 보내므로 요청마다 DB 왕복이
+하나씩 늘어난다. 방금 반납된 커넥션은 살아 있다고 보고(HikariCP 의
+``aliveBypassWindowMs`` 와 같은 방식), 일정 시간 이상 놀던 커넥션만 체크아웃 시
+ping 한다. ping 이 실패하면 ``DisconnectionError`` 로 알려 SQLAlchemy 가 해당
+커넥션을 폐기하고 새 커넥션으로 다시 체크아웃하게 한다.
+
+사용 예시:
+    engine = create_async_engine(url, pool_pre_ping=False, pool_recycle=280)
+    install_idle_ping(engine, idle_seconds=0.5)
+
+Note:
+    오래된 커넥션 교체는 ``pool_recycle`` 이 담당하고, 이 모듈은 그 사이에
+    서버가 끊은 커넥션(재시작, 네트워크 단절 등)을 걸러낸다.
+
+``pool_reset_on_return="rollback"`` 은 커밋을 마친 커넥션에도 반납 때마다
+``ROLLBACK`` 을 한 번 더 보낸다. ``install_conditional_reset`` 은 드라이버가 알고
+있는 트랜잭션 상태(asyncmy: 서버 상태 플래그, 추가 왕복 없음)를 보고 트랜잭션이
+열려 있을 때만 롤백한다.
+
+사용 예시:
+    engine = create_async_engine(url, pool_reset_on_return=None)
+    install_conditional_reset(engine)
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import DisconnectionError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# 커넥션 레코드 info 에 마지막 반납 시각(monotonic)을 기록하는 키
+_LAST_CHECKIN = "_idle_ping_last_checkin"
+
+
+def install_idle_ping(engine: AsyncEngine, idle_seconds: float) -> None:
+    """
+    엔진 풀에 idle 기반 생존 확인 리스너를 등록합니다.
+
+    Args:
+        engine: 대상 비동기 엔진 (``pool_pre_ping=False`` 로 생성)
+        idle_seconds: 이 시간(초)보다 오래 놀던 커넥션만 체크아웃 시 ping
+    """
+    dialect = engine.dialect
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _stamp_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+        if connection_record is not None:
+            connection_record.info[_LAST_CHECKIN] = time.monotonic()
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _ping_if_idle(dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        last_checkin = connection_record.info.get(_LAST_CHECKIN)
+        # 새로 연결된 커넥션(반납 이력 없음)이나 최근에 쓴 커넥션은 그대로 사용
+        if last_checkin is None or time.monotonic() - last_checkin <= idle_seconds:
+            return
+        try:
+            alive = dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            raise DisconnectionError(f"idle 커넥션 ping 실패: {e}") from e
+        if not alive:
+            raise DisconnectionError("idle 커넥션 ping 실패")
+
+
+def install_conditional_reset(engine: AsyncEngine) -> None:
+    """
+    반납 시 트랜잭션이 열려 있을 때만 롤백하는 reset 리스너를 등록합니다.
+
+    트랜잭션 상태를 알려주지 않는 드라이버(``get_transaction_status`` 없음)는
+    기존 ``"rollback"`` 과 같이 항상 롤백합니다.
+
+    Args:
+        engine: 대상 비동기 엔진 (``pool_reset_on_return=None`` 으로 생성)
+    """
+
+    @event.listens_for(engine.sync_engine, "reset")
+    def _rollback_if_in_transaction(
+        dbapi_connection: Any, connection_record: Any, reset_state: Any
+    ) -> None:
+        # Connection.close() 가 이미 트랜잭션을 정리했거나, IO 를 할 수 없는 GC 정리 단계
+        if reset_state.transaction_was_reset or not reset_state.asyncio_safe:
+            return
+        driver_connection = getattr(dbapi_connection, "driver_connection", dbapi_connection)
+        in_transaction = getattr(driver_connection, "get_transaction_status", None)
+        if in_transaction is None or in_transaction():
+            dbapi_connection.rollback()
+
+
+def pool_status(engine: AsyncEngine) -> dict[str, int]:
+    """
+    풀 크기 튜닝용 현재 상태를 반환합니다.
+
+    Returns:
+        size(기본 유지 수), checked_out(사용 중), overflow(초과 생성 수) 딕셔너리
+    """
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
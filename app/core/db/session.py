@@ -4,10 +4,10 @@
 SQLAlchemy 비동기 엔진과 세션 팩토리를 설정합니다.
 
 주요 구성요소:
-    - engine: FastAPI 요청 처리용 메인 엔진 = primary(writer) (pool_size=20, max_overflow=20)
+    - engine: FastAPI 요청 처리용 메인 엔진 = primary(writer) (DB_POOL_SIZE + DB_MAX_OVERFLOW)
     - read_engines: replica(reader) 엔진 목록 (복제 활성 시에만 생성)
     - db_router: 읽기/쓰기 바인딩을 결정하는 DatabaseRouter
-    - background_engine: 백그라운드 태스크용 분리 엔진 (pool_size=10, max_overflow=10)
+    - background_engine: 백그라운드 태스크용 분리 엔진 (DB_BACKGROUND_POOL_SIZE + ..._MAX_OVERFLOW)
     - AsyncSessionLocal: 메인 세션 팩토리
     - BackgroundSessionLocal: 백그라운드 세션 팩토리
     - get_session(): FastAPI DI용 세션 제너레이터 (읽기/쓰기 자동 라우팅)
@@ -44,10 +44,12 @@ SQLAlchemy 비동기 엔진과 세션 팩토리를 설정합니다.
             await session.commit()
 """
 
+import logging
 import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
+from sqlalchemy import Connection, inspect
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -55,6 +57,7 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from app.core.db.pool import install_conditional_reset, install_idle_ping, pool_status
 from app.core.db.router import (
     DatabaseRouter,
     ReadOnlyRoutingError,  # noqa: F401 - re-export
@@ -73,26 +76,35 @@ logger = get_logger("database")
 # 메인 엔진 (FastAPI 요청용) = primary(writer)
 # =============================================================================
 # API 요청 처리를 위한 커넥션 풀
-# - pool_size: 기본 유지 연결 수 (20)
-# - max_overflow: 추가 허용 연결 수 (20) → 최대 40개 동시 연결
-# - pool_pre_ping: 연결 사용 전 유효성 검사 (죽은 연결 자동 복구)
+# - pool_size: 기본 유지 연결 수 (DB_POOL_SIZE, 기본 10)
+# - max_overflow: 추가 허용 연결 수 (DB_MAX_OVERFLOW, 기본 10) → 최대 20개 동시 연결
+# - pool_pre_ping: 끄고 install_idle_ping 으로 오래 놀던 연결만 유효성 검사
+# - pool_use_lifo: 최근 반납된 연결부터 재사용 → 남는 연결은 놀다가 recycle 됨
+# - pool_reset_on_return: 끄고 install_conditional_reset 으로 트랜잭션이 열린 연결만 롤백
 # - pool_recycle: 연결 재활용 주기 (MySQL wait_timeout보다 짧게 설정)
 engine = create_async_engine(
     url=db_settings.MYSQL_WRITER_URL,
     echo=False,  # SQL 로깅 (개발 시 True로 설정)
-    pool_size=20,
-    max_overflow=20,
+    pool_size=db_settings.DB_POOL_SIZE,
+    max_overflow=db_settings.DB_MAX_OVERFLOW,
     pool_timeout=30,  # 풀에서 연결 대기 시간 (초)
     pool_recycle=280,  # MySQL 기본 wait_timeout(28800s), 클라우드는 보통 300s
-    pool_pre_ping=True,
-    pool_reset_on_return="rollback",  # 반환 시 롤백으로 세션 초기화
+    pool_pre_ping=False,  # 체크아웃마다 ping 하지 않음 — 아래 install_idle_ping 참고
+    pool_use_lifo=True,  # 저부하 시 풀 꼬리의 연결이 idle 로 남아 정리되도록 함
+    pool_reset_on_return=None,  # 커밋된 연결에 ROLLBACK 을 또 보내지 않음 — 아래 참고
+    query_cache_size=db_settings.DB_QUERY_CACHE_SIZE,  # 컴파일된 SQL 캐시 (구문 재컴파일 방지)
     connect_args={
-        "connect_timeout": 10,  # DB 연결 타임아웃 (초)
-        "charset": "utf8mb4",  # 이모지 등 4바이트 UTF-8 지원
+        "connect_timeout": 10,  # DB 연결 타임아웃 (초) — 문자셋은 URL 쿼리로 지정
     },
 )
 
-# `engine` 은 SQLAdmin·Alembic 등 기존 소비처가 쓰는 이름이라 유지하고,
+# 최근에 반납된 커넥션은 살아 있다고 보고, 오래 놀던 커넥션만 체크아웃 시 ping 한다.
+# (요청마다 ping 왕복이 붙지 않게 함 — app/core/db/pool.py)
+install_idle_ping(engine, db_settings.DB_POOL_PING_IDLE_SECONDS)
+# 반납 시 드라이버가 트랜잭션이 열려 있다고 보고할 때만 롤백한다.
+install_conditional_reset(engine)
+
+# `engine` 은 app.core.db 재노출 등 기존 소비처가 쓰는 이름이라 유지하고,
 # 역할이 드러나는 별칭을 함께 노출한다.
 writer_engine = engine
 
@@ -106,20 +118,24 @@ def _create_read_engine(url: str) -> AsyncEngine:
     읽기는 보통 쓰기보다 트래픽이 많고 트랜잭션이 짧으므로 풀을 primary 와
     같은 크기로 잡되, replica 대수만큼 커넥션이 곱해진다는 점에 유의한다.
     """
-    return create_async_engine(
+    read_engine = create_async_engine(
         url=url,
         echo=False,
-        pool_size=20,
-        max_overflow=20,
+        pool_size=db_settings.DB_POOL_SIZE,
+        max_overflow=db_settings.DB_MAX_OVERFLOW,
         pool_timeout=30,
         pool_recycle=280,
-        pool_pre_ping=True,
-        pool_reset_on_return="rollback",
+        pool_pre_ping=False,
+        pool_use_lifo=True,
+        pool_reset_on_return=None,
+        query_cache_size=db_settings.DB_QUERY_CACHE_SIZE,
         connect_args={
             "connect_timeout": 10,
-            "charset": "utf8mb4",
         },
     )
+    install_idle_ping(read_engine, db_settings.DB_POOL_PING_IDLE_SECONDS)
+    install_conditional_reset(read_engine)
+    return read_engine
 
 
 # 복제가 꺼져 있으면 빈 목록 → 라우터는 읽기도 primary 로 보낸다.
@@ -168,17 +184,19 @@ logger.info("[database] 라우팅 구성: %s", db_settings.describe_routing())
 background_engine = create_async_engine(
     url=db_settings.MYSQL_WRITER_URL,
     echo=False,
-    pool_size=10,  # 백그라운드용은 작게 설정
-    max_overflow=10,
+    pool_size=db_settings.DB_BACKGROUND_POOL_SIZE,  # 백그라운드용은 작게 설정
+    max_overflow=db_settings.DB_BACKGROUND_MAX_OVERFLOW,
     pool_timeout=60,  # 백그라운드는 대기 시간 여유있게
     pool_recycle=280,
     pool_pre_ping=True,
-    pool_reset_on_return="rollback",
+    pool_use_lifo=True,
+    pool_reset_on_return=None,
+    query_cache_size=db_settings.DB_QUERY_CACHE_SIZE,
     connect_args={
         "connect_timeout": 10,
-        "charset": "utf8mb4",
     },
 )
+install_conditional_reset(background_engine)
 
 # 백그라운드 세션 팩토리
 BackgroundSessionLocal = async_sessionmaker(
@@ -209,6 +227,20 @@ async def background_session() -> AsyncGenerator[AsyncSession, None]:
             raise
 
 
+def _create_missing_tables(connection: Connection) -> list[str]:
+    """
+    없는 테이블만 생성하고 생성한 테이블 이름을 반환합니다.
+
+    ``create_all`` 의 기본 checkfirst 는 테이블마다 존재 여부를 따로 조회하므로,
+    테이블 목록을 한 번만 읽고 빠진 테이블만 넘겨 재시작 시 왕복을 1회로 줄입니다.
+    """
+    existing = set(inspect(connection).get_table_names())
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+    if missing:
+        Base.metadata.create_all(connection, tables=missing, checkfirst=False)
+    return [table.name for table in missing]
+
+
 async def create_db_tables() -> None:
     """
     데이터베이스 테이블을 생성합니다.
@@ -234,7 +266,27 @@ async def create_db_tables() -> None:
 
     async with asyncio.timeout(30):
         async with engine.begin() as connection:
-            await connection.run_sync(Base.metadata.create_all)
+            created = await connection.run_sync(_create_missing_tables)
+    logger.info("Created tables: %s", created or "none (all exist)")
+
+
+def _debug_start_time() -> float | None:
+    """DEBUG 로그가 켜져 있을 때만 세션 소요 시간 측정을 시작합니다."""
+    return time.perf_counter() if logger.isEnabledFor(logging.DEBUG) else None
+
+
+def _log_rollback(source: str, error: Exception, start_time: float | None) -> None:
+    """롤백 로그를 남깁니다 (소요 시간은 측정했을 때만 포함)."""
+    if start_time is None:
+        logger.error("[%s] ROLLBACK - error: %s: %s", source, type(error).__name__, error)
+    else:
+        logger.error(
+            "[%s] ROLLBACK - error: %s: %s, duration: %.1fms",
+            source,
+            type(error).__name__,
+            error,
+            (time.perf_counter() - start_time) * 1000,
+        )
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -262,18 +314,17 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         - 한 요청 내에서 여러 번 호출해도 같은 세션을 반환하지 않습니다
         - 트랜잭션 경계는 기능 의존성(dependencies)이 yield 후 커밋으로 관리합니다
     """
-    start_time = time.perf_counter()
+    start_time = _debug_start_time()
+    if start_time is not None:
+        logger.debug("[get_session] pool: %s", pool_status(engine))
 
     async with AsyncSessionLocal() as session:
         try:
             yield session
         except Exception as e:
             await session.rollback()
-            logger.error(
-                f"[get_session] ROLLBACK - error: {type(e).__name__}: {e}, "
-                f"duration: {(time.perf_counter() - start_time)*1000:.1f}ms"
-            )
-            raise e
+            _log_rollback("get_session", e, start_time)
+            raise
 
 
 async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
@@ -300,11 +351,8 @@ async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
     """
     async with AsyncSessionLocal() as session:
         mark_read_only(session)
-        try:
-            yield session
-        except Exception:
-            await session.rollback()
-            raise
+        # 예외 시 롤백은 세션 close(__aexit__)가 진행 중 트랜잭션을 되돌리며 처리한다
+        yield session
 
 
 async def get_write_session() -> AsyncGenerator[AsyncSession, None]:
@@ -324,11 +372,8 @@ async def get_write_session() -> AsyncGenerator[AsyncSession, None]:
     """
     async with AsyncSessionLocal() as session:
         using_writer(session)
-        try:
-            yield session
-        except Exception:
-            await session.rollback()
-            raise
+        # 예외 시 롤백은 세션 close(__aexit__)가 진행 중 트랜잭션을 되돌리며 처리한다
+        yield session
 
 
 async def get_background_session() -> AsyncGenerator[AsyncSession, None]:
@@ -352,19 +397,17 @@ async def get_background_session() -> AsyncGenerator[AsyncSession, None]:
         - 메인 API 풀과 분리되어 있어 백그라운드 작업이 API를 블로킹하지 않습니다
         - 요청 밖 트랜잭션 경계는 background_session() 컨텍스트 사용을 권장합니다
     """
-    start_time = time.perf_counter()
+    start_time = _debug_start_time()
+    if start_time is not None:
+        logger.debug("[get_background_session] pool: %s", pool_status(background_engine))
 
     async with BackgroundSessionLocal() as session:
         try:
             yield session
         except Exception as e:
             await session.rollback()
-            logger.error(
-                f"[get_background_session] ROLLBACK - "
-                f"error: {type(e).__name__}: {e}, "
-                f"duration: {(time.perf_counter() - start_time)*1000:.1f}ms"
-            )
-            raise e
+            _log_rollback("get_background_session", e, start_time)
+            raise
 
 
 async def dispose_engine() -> None:
@@ -5,8 +5,9 @@
 모든 예외는 에러 메시지, HTTP 상태 코드, 상세 정보를 포함합니다.
 """
 
-from typing import Any
+from typing import Any, ClassVar
 
+import orjson
 from fastapi import status
 from pydantic import BaseModel
 
@@ -52,6 +53,19 @@ class AppException(Exception):
     error_code: str = "INTERNAL_ERROR"
     message: str = "내부 서버 오류가 발생했습니다."
 
+    # 기본 메시지·코드에 detail 없는 응답의 직렬화된 JSON 본문 (클래스 정의 시 계산)
+    _cached_body: ClassVar[bytes] = b""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """하위 클래스마다 기본 응답 본문을 미리 직렬화해 둡니다."""
+        super().__init_subclass__(**kwargs)
+        cls._cached_body = cls._build_default_body()
+
+    @classmethod
+    def _build_default_body(cls) -> bytes:
+        """기본 메시지·코드·detail=None 응답 본문을 직렬화합니다."""
+        return orjson.dumps({"error_code": cls.error_code, "message": cls.message, "detail": None})
+
     def __init__(
         self,
         message: str | None = None,
@@ -65,16 +79,38 @@ class AppException(Exception):
             self.status_code = status_code
         if error_code is not None:
             self.error_code = error_code
-        super().__init__(self.message)
-
-    def to_response(self) -> ErrorResponse:
-        """에러 응답 객체 생성"""
-        return ErrorResponse(
-            error_code=self.error_code,
-            message=self.message,
-            detail=self.detail,
+        # Exception.__init__(message) 는 호출하지 않는다 — 대부분 핸들러에서 응답으로
+        # 변환되고 버려지므로 args 구성 비용을 아낀다. 문자열 표현은 __str__ 이 담당.
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """pickle 지원: 기본 생성 후 인스턴스 속성(message·detail·재정의 값)을 복원"""
+        return (self.__class__, (), self.__dict__.copy())
+
+    def _is_default(self) -> bool:
+        """클래스 기본 메시지·코드 그대로이고 detail 이 없는지 여부"""
+        cls = self.__class__
+        return (
+            self.detail is None
+            and self.message is cls.message
+            and self.error_code is cls.error_code
         )
 
+    def cached_body(self) -> bytes | None:
+        """
+        기본 응답이면 미리 직렬화한 JSON 본문을 반환합니다.
+
+        핸들러가 직렬화 없이 바로 응답할 수 있도록 합니다.
+        메시지·코드를 재정의했거나 detail 이 있으면 None 을 반환합니다.
+        """
+        return self._cached_body if self._is_default() else None
+
+    def to_dict(self) -> dict[str, Any]:
+        """ORJSONResponse 에 바로 넘길 에러 응답 dict (Pydantic 모델을 거치지 않음)"""
+        return {"error_code": self.error_code, "message": self.message, "detail": self.detail}
+
 
 # =============================================================================
 # 클라이언트 에러 (4xx)
@@ -251,6 +287,9 @@ class ResourceLockedException(BusinessException):
     message = "리소스가 잠겨 있습니다."
 
 
+AppException._cached_body = AppException._build_default_body()
+
+
 # =============================================================================
 # 예외 클래스 목록 export
 # =============================================================================
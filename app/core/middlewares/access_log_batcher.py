@@ -0,0 +1,259 @@
+"""접속로그 배치 수집기 — 큐 + 고정 워커 풀 + 일괄 저장.
+
+미들웨어가 요청마다 백그라운드 태스크(=세션·트랜잭션 1개)를 던지던 방식을
+대체한다. 요청 경로에서는 ``enqueue()`` 로 큐에 넣기만 하고, 고정 개수의
+워커 태스크가 최대 ``max_batch`` 건 또는 ``max_wait`` 초 중 먼저 도달하는
+조건까지 모아 sink 의 ``save_many()`` 로 한 트랜잭션에 저장한다. 고부하에서
+DB 왕복이 요청당 1회 → 배치당 1회로 줄고, 핫패스의 태스크 생성 비용도 사라진다.
+
+- **백프레셔**: 큐가 가득 차면 요청을 블로킹하지 않고 드롭해 ``dropped`` 로
+  집계한다(비핵심 로그는 막지 않고 버린다). 드롭 경고는 첫 건과 이후
+  ``DROP_WARN_INTERVAL_SECONDS`` 마다 한 번씩만, 그 사이 드롭 건수를 묶어 남긴다. 동시에 DB 를 쓰는 코루틴은 워커
+  수(``workers``)로 고정되므로 트래픽 급증에도 커넥션 점유가 늘지 않는다.
+- **배치 실패 격리**: 한 행 때문에(중복·컬럼 길이 초과 등) 일괄 저장이 실패하면
+  그 배치를 건별 ``save()`` 로 다시 저장해, 나쁜 행만 버리고 나머지는 남긴다.
+  ``save_many`` 가 없는 sink 도 건별 ``save()`` 로 저장한다.
+- **레코드 재사용**: 큐에는 ``AccessLogRecord`` 가 쌓이고, sink 에는
+  ``as_dict()`` 로 변환해 넘긴다. 저장이 끝난(또는 드롭된) 레코드는 레코드
+  풀로 돌려보내 다음 요청이 재사용한다.
+- **수명 주기**: main lifespan 이 시작 시 ``start()``, 종료 시 ``stop()`` 을
+  호출한다. ``stop()`` 은 워커마다 종료 sentinel 을 큐 끝에 넣어, 앞선 레코드를
+  모두 저장한 뒤 워커가 스스로 끝나게 한다. 엔진 dispose 전에 호출해야 한다.
+  ``start()`` 전(lifespan 을 돌리지 않는 테스트 클라이언트 등)의 ``enqueue()``
+  는 저장하지 않고 False 를 반환한다(이 경우 경고는 한 번만 남긴다).
+
+전역 싱글턴 ``access_log_batcher`` 를 미들웨어(enqueue)와 main lifespan
+(start/stop)이 공유한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from sqlalchemy.exc import DataError
+
+from app.core.exception import DatabaseException, DuplicateException
+from app.core.middlewares.access_log_record import (
+    AccessLogRecord,
+    AccessLogRecordPool,
+    access_log_record_pool,
+)
+from app.core.middlewares.access_log_sink import AccessLogSink, get_access_log_sink
+from app.utils.logs import get_logger
+
+logger = get_logger("access_log_batcher")
+
+# 배치 크기·대기 시간·큐 상한·워커 수 및 종료 flush 타임아웃(초).
+MAX_BATCH_SIZE = 200
+MAX_BATCH_WAIT_SECONDS = 0.05
+MAX_QUEUE_SIZE = 10_000
+WORKER_COUNT = 2
+STOP_TIMEOUT_SECONDS = 5.0
+# 큐 가득 참 드롭 경고의 최소 간격(초) — 과부하 중 드롭마다 로그가 쏟아지지 않도록
+DROP_WARN_INTERVAL_SECONDS = 10.0
+
+# 워커 종료 신호 (stop() 이 워커 수만큼 큐 끝에 넣는다)
+_STOP = object()
+
+
+class AccessLogBatcher:
+    """큐에 쌓인 접속로그를 고정 워커가 모아 sink 에 일괄 저장하는 배치 수집기."""
+
+    def __init__(
+        self,
+        max_batch: int = MAX_BATCH_SIZE,
+        max_wait: float = MAX_BATCH_WAIT_SECONDS,
+        maxsize: int = MAX_QUEUE_SIZE,
+        workers: int = WORKER_COUNT,
+        pool: AccessLogRecordPool | None = None,
+    ) -> None:
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._maxsize = maxsize
+        self._worker_count = workers
+        self._pool = pool if pool is not None else access_log_record_pool
+        self._queue: asyncio.Queue[AccessLogRecord | object] | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self.dropped = 0
+        # 마지막 드롭 경고 시각(monotonic)과 그때까지의 누적 드롭 수
+        self._last_drop_warn = -DROP_WARN_INTERVAL_SECONDS
+        self._dropped_at_warn = 0
+        self._warned_not_started = False
+
+    @property
+    def running(self) -> bool:
+        """워커 태스크가 하나라도 동작 중인지 여부."""
+        return any(not worker.done() for worker in self._workers)
+
+    @property
+    def pending(self) -> int:
+        """아직 저장되지 않은 큐 적재 건수."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self) -> None:
+        """큐와 워커 태스크를 만든다(실행 중인 이벤트 루프 안에서 호출)."""
+        if self.running:
+            return
+        queue: asyncio.Queue[AccessLogRecord | object] = asyncio.Queue(maxsize=self._maxsize)
+        self._queue = queue
+        self._warned_not_started = False
+        self._workers = [
+            asyncio.create_task(self._drain_loop(queue), name=f"access-log-batcher-{i}")
+            for i in range(self._worker_count)
+        ]
+        logger.info(
+            "접속로그 배치 수집기 시작 (workers=%d, batch=%d, wait=%.0fms, queue=%d)",
+            self._worker_count,
+            self._max_batch,
+            self._max_wait * 1000,
+            self._maxsize,
+        )
+
+    def enqueue(self, record: AccessLogRecord) -> bool:
+        """접속로그 1건을 큐에 넣는다(요청 경로에서 호출, 블로킹 없음).
+
+        드롭된 레코드는 즉시 풀로 돌려보낸다.
+
+        Returns:
+            큐에 넣었으면 True, 미시작 또는 큐 가득 참으로 드롭했으면 False.
+        """
+        if self._queue is None:
+            self._pool.release(record)
+            if not self._warned_not_started:
+                self._warned_not_started = True
+                logger.warning("접속로그 배치 수집기가 실행 중이 아님 — 저장하지 않고 버림")
+            return False
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            self._pool.release(record)
+            self.dropped += 1
+            self._warn_dropped()
+            return False
+        return True
+
+    def _warn_dropped(self) -> None:
+        """드롭 경고를 ``DROP_WARN_INTERVAL_SECONDS`` 에 한 번만 남긴다."""
+        now = time.monotonic()
+        if now - self._last_drop_warn < DROP_WARN_INTERVAL_SECONDS:
+            return
+        logger.warning(
+            "접속로그 큐 상한(%d) 초과 — 드롭 %d건(누적 %d)",
+            self._maxsize,
+            self.dropped - self._dropped_at_warn,
+            self.dropped,
+        )
+        self._last_drop_warn = now
+        self._dropped_at_warn = self.dropped
+
+    async def _collect(
+        self, queue: asyncio.Queue[AccessLogRecord | object]
+    ) -> tuple[list[AccessLogRecord], bool]:
+        """첫 건을 기다린 뒤 ``max_batch`` 건 또는 ``max_wait`` 초까지 모은다.
+
+        Returns:
+            (모은 배치, 종료 sentinel 을 만났는지 여부)
+        """
+        item = await queue.get()
+        if item is _STOP:
+            return [], True
+        batch = [item]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._max_wait
+        while len(batch) < self._max_batch:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except TimeoutError:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    async def _flush(self, batch: list[AccessLogRecord]) -> None:
+        """모은 배치를 sink 에 저장한다. 실패는 로그만 남기고 삼킨다.
+
+        특정 행 때문에 일괄 저장이 거부되면(중복·데이터 오류) 건별로 다시 저장한다.
+        연결 끊김 같은 다른 오류는 건별 재시도도 실패하므로 배치를 버린다.
+        """
+        try:
+            sink = get_access_log_sink()
+            if sink is None:
+                return
+            rows = [record.as_dict() for record in batch]
+            save_many = getattr(sink, "save_many", None)
+            if save_many is None:
+                await self._save_each(sink, rows)
+                return
+            try:
+                await save_many(rows)
+            except (DuplicateException, DatabaseException) as e:
+                if len(rows) == 1 or not _is_row_error(e):
+                    raise
+                logger.warning(
+                    "접속 로그 일괄 저장 실패(%d건) — 건별 저장으로 재시도: %s", len(rows), e
+                )
+                await self._save_each(sink, rows)
+        except Exception as e:
+            # 로그 저장 실패가 워커 루프를 멈추지 않도록 함
+            logger.exception("접속 로그 일괄 저장 실패(%d건): %s", len(batch), e)
+
+    @staticmethod
+    async def _save_each(sink: AccessLogSink, rows: list[dict]) -> None:
+        """행마다 ``save()`` 로 저장하고, 실패한 행만 세어 버린다."""
+        failed = 0
+        for row in rows:
+            try:
+                await sink.save(row)
+            except Exception:
+                failed += 1
+        if failed:
+            logger.warning("접속 로그 %d/%d건 저장 실패 — 해당 행만 버림", failed, len(rows))
+
+    async def _drain_loop(self, queue: asyncio.Queue[AccessLogRecord | object]) -> None:
+        """워커 루프: 배치 수집 → 저장 → 레코드 반환을 sentinel 까지 반복한다."""
+        while True:
+            batch, stopping = await self._collect(queue)
+            if batch:
+                try:
+                    await self._flush(batch)
+                finally:
+                    for record in batch:
+                        self._pool.release(record)
+            if stopping:
+                return
+
+    async def stop(self, timeout: float = STOP_TIMEOUT_SECONDS) -> None:
+        """워커에 종료 sentinel 을 보내 남은 큐를 flush(또는 timeout)하고 정리한다."""
+        queue, workers = self._queue, self._workers
+        if queue is None or not workers:
+            return
+        self._queue = None  # 이후 enqueue 는 드롭
+        if queue.qsize():
+            logger.info("접속로그 큐 flush 시작 — %d건 대기", queue.qsize())
+
+        async def _shutdown() -> None:
+            for _ in workers:
+                await queue.put(_STOP)
+            await asyncio.gather(*workers)
+
+        try:
+            # 타임아웃 시 gather 가 취소되며 남은 워커도 함께 취소된다
+            await asyncio.wait_for(_shutdown(), timeout)
+        except TimeoutError:
+            logger.warning("접속로그 flush 타임아웃(%.1fs) — 미저장 %d건", timeout, queue.qsize())
+        self._workers = []
+        logger.info("접속로그 배치 수집기 종료 (드롭 누적 %d)", self.dropped)
+
+
+def _is_row_error(exc: Exception) -> bool:
+    """특정 행의 값 때문에 난 저장 오류인지 (중복 키·컬럼 길이/형식 초과)."""
+    return isinstance(exc, DuplicateException) or isinstance(exc.__cause__, DataError)
+
+
+# 미들웨어(enqueue)와 lifespan(start/stop)이 공유하는 전역 싱글턴.
+access_log_batcher = AccessLogBatcher()
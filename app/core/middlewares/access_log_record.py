@@ -0,0 +1,96 @@
+"""접속로그 레코드 + 재사용 풀.
+
+미들웨어가 요청마다 만들던 접속로그 dict 를 ``__slots__`` 데이터클래스로 바꾸고,
+배치 수집기가 저장을 마친 레코드를 free list 로 돌려받아 재사용한다.
+
+- **레코드**: ``AccessLogRecord`` 는 슬롯 기반이라 같은 필드의 dict 보다 작고
+  필드마다 해시 테이블 엔트리를 만들지 않는다. sink 로 넘길 때만
+  ``as_dict()`` 로 변환한다.
+- **풀**: ``acquire()`` 는 free list 에서 꺼내거나 새로 만들고, ``release()`` 는
+  필드를 초기화해 되돌린다. free list 는 ``maxsize`` 까지만 보관하며 초과분은
+  GC 에 맡긴다.
+
+전역 싱글턴 ``access_log_record_pool`` 을 미들웨어(acquire)와 배치 수집기
+(release)가 공유한다.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, fields
+from typing import Any
+
+# free list 에 보관할 최대 레코드 수
+MAX_POOLED_RECORDS = 2048
+
+
+@dataclass(slots=True)
+class AccessLogRecord:
+    """접속로그 1건 (UserAccessLog 컬럼과 같은 이름의 필드)."""
+
+    # 네트워크 정보
+    ip_address: str = "unknown"
+    forwarded_for: str | None = None
+    real_ip: str | None = None
+    # User-Agent 정보
+    user_agent: str | None = None
+    os_name: str | None = None
+    os_version: str | None = None
+    browser_name: str | None = None
+    browser_version: str | None = None
+    device_type: str | None = None
+    device_brand: str | None = None
+    device_model: str | None = None
+    is_bot: bool = False
+    # 요청 정보
+    request_path: str = ""
+    request_method: str = ""
+    query_string: str | None = None
+    referer: str | None = None
+    accept_language: str | None = None
+    # 응답 정보
+    response_status: int | None = None
+    response_time_ms: int | None = None
+    # 사용자 정보
+    session_id: str | None = None
+    user_id: str | None = None
+    # 요청 추적 정보
+    correlation_id: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """sink 저장용 dict 로 변환합니다."""
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
+
+    def reset(self) -> None:
+        """모든 필드를 기본값으로 되돌립니다 (풀 반환 시)."""
+        self.__init__()  # type: ignore[misc]
+
+
+_FIELD_NAMES: tuple[str, ...] = tuple(f.name for f in fields(AccessLogRecord))
+
+
+class AccessLogRecordPool:
+    """``AccessLogRecord`` 를 재사용하는 상한 있는 free list."""
+
+    def __init__(self, maxsize: int = MAX_POOLED_RECORDS) -> None:
+        self._maxsize = maxsize
+        self._free: deque[AccessLogRecord] = deque()
+
+    @property
+    def available(self) -> int:
+        """재사용 대기 중인 레코드 수."""
+        return len(self._free)
+
+    def acquire(self) -> AccessLogRecord:
+        """재사용 가능한 레코드를 꺼내거나 새로 만듭니다."""
+        return self._free.pop() if self._free else AccessLogRecord()
+
+    def release(self, record: AccessLogRecord) -> None:
+        """레코드를 초기화해 풀에 돌려줍니다 (상한 초과분은 버림)."""
+        if len(self._free) < self._maxsize:
+            record.reset()
+            self._free.append(record)
+
+
+# 미들웨어(acquire)와 배치 수집기(release)가 공유하는 전역 싱글턴.
+access_log_record_pool = AccessLogRecordPool()
@@ -17,6 +17,16 @@ class AccessLogSink(Protocol):
         """Persist one access-log entry."""
         ...
 
+    async def save_many(self, rows: list[dict]) -> None:
+        """Persist a batch of access-log entries in one transaction (optional).
+
+        Only classes that subclass this Protocol inherit the per-row fallback
+        below; the batcher therefore also falls back to ``save`` itself when a
+        structurally-typed sink does not define ``save_many``.
+        """
+        for row in rows:
+            await self.save(row)
+
 
 _sink: AccessLogSink | None = None
 
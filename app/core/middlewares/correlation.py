@@ -0,0 +1,55 @@
+"""요청 상관관계(correlation) ID 컨텍스트.
+
+요청 진입 시 ``traceparent``(W3C Trace Context) 의 trace-id 또는 ``X-Request-ID``
+를 읽어(없으면 새로 생성) ``ContextVar`` 에 보관한다. 같은 요청 안의 코드는
+``get_correlation_id()`` 로 조회하고, 접속로그 행에도 같은 값을 기록해
+로그·트레이스와 DB 행을 조인할 수 있게 한다.
+
+배치 수집기 워커는 다른 태스크에서 돌기 때문에 ContextVar 를 보지 않는다 —
+미들웨어가 적재 시점에 레코드에 값을 찍어 둔다.
+"""
+
+from __future__ import annotations
+
+import re
+from contextvars import ContextVar
+from uuid import uuid4
+
+# 요청 단위 상관관계 ID (요청 밖에서는 빈 문자열)
+correlation_id: ContextVar[str] = ContextVar("correlation_id", default="")
+
+# traceparent: "{version:2}-{trace-id:32}-{parent-id:16}-{flags:2}" (소문자 hex)
+_TRACEPARENT_RE = re.compile(r"[0-9a-f]{2}-([0-9a-f]{32})-[0-9a-f]{16}-[0-9a-f]{2}")
+_INVALID_TRACE_ID = "0" * 32
+
+# X-Request-ID 최대 길이 (UserAccessLog.correlation_id 컬럼 길이)
+MAX_REQUEST_ID_LENGTH = 64
+
+
+def resolve_correlation_id(traceparent: str | None, request_id: str | None) -> str:
+    """
+    요청 헤더에서 상관관계 ID 를 결정합니다.
+
+    우선순위: 유효한 traceparent 의 trace-id → X-Request-ID → 새 UUID4 hex.
+
+    Args:
+        traceparent: traceparent 헤더 값
+        request_id: X-Request-ID 헤더 값
+
+    Returns:
+        상관관계 ID (최대 64자)
+    """
+    if traceparent:
+        match = _TRACEPARENT_RE.fullmatch(traceparent.strip())
+        if match and match.group(1) != _INVALID_TRACE_ID:
+            return match.group(1)
+    if request_id:
+        request_id = request_id.strip()[:MAX_REQUEST_ID_LENGTH]
+        if request_id:
+            return request_id
+    return uuid4().hex
+
+
+def get_correlation_id() -> str:
+    """현재 요청의 상관관계 ID 를 반환합니다 (요청 밖에서는 빈 문자열)."""
+    return correlation_id.get()
@@ -4,27 +4,219 @@
 모든 요청에서 사용자의 접속 정보를 수집하여 데이터베이스에 저장합니다.
 """
 
+import re
 import time
-
-from fastapi import FastAPI, Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.types import ASGIApp
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
+
+from fastapi import FastAPI
+from starlette.datastructures import QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from user_agents import parse as parse_user_agent
 
-from app.core.middlewares.access_log_sink import get_access_log_sink
-from app.core.middlewares.background_tasks import access_log_tasks
+from app.core.middlewares.access_log_batcher import access_log_batcher
+from app.core.middlewares.access_log_record import AccessLogRecord, access_log_record_pool
+from app.core.middlewares.correlation import correlation_id, resolve_correlation_id
 from app.utils.logs import get_logger
 from config import middleware_settings
 
 logger = get_logger("user_info_middleware")
 
+# UA 파싱 캐시 크기. ua-parser 는 수백 개 정규식을 순차 매칭하므로 비싸지만,
+# 실제 트래픽의 UA 문자열 종류는 적어 캐시 적중률이 높다.
+UA_CACHE_SIZE = 4096
+
+# 접속로그 컬럼 길이 (UserAccessLog 의 String(n) 과 맞춤). 클라이언트가 보낸 헤더·경로가
+# 길이를 넘으면 strict 모드 MySQL 에서 배치 INSERT 전체가 실패하므로 레코드에 채울 때 자른다.
+_IP_MAX_LENGTH = 45
+_HEADER_MAX_LENGTH = 255
+_SESSION_ID_MAX_LENGTH = 100
+_PATH_MAX_LENGTH = 2048
+_METHOD_MAX_LENGTH = 10
+_UA_FIELD_MAX_LENGTH = 50
+_DEVICE_MODEL_MAX_LENGTH = 100
+
+# 따옴표로 감싼 쿠키 값의 이스케이프: 8진수 3자리(\073 → ';') 또는 백슬래시 + 한 글자
+_COOKIE_ESCAPE = re.compile(r"\\(?:([0-3][0-7][0-7])|(.))")
+
+# ua-parser 가 인식하지 못한 OS·브라우저에 돌려주는 family 값
+_OTHER = "Other"
+
+# User-Agent 헤더가 없는 요청의 파싱 결과
+_EMPTY_UA: Mapping[str, Any] = MappingProxyType(
+    {
+        "os_name": None,
+        "os_version": None,
+        "browser_name": None,
+        "browser_version": None,
+        "device_type": None,
+        "device_brand": None,
+        "device_model": None,
+        "is_bot": False,
+    }
+)
+
+
+def _clip(value: str | None, limit: int) -> str | None:
+    """컬럼 길이를 넘는 문자열을 잘라냅니다 (None·빈 문자열은 그대로)."""
+    return value[:limit] if value else value
+
+
+@lru_cache(maxsize=UA_CACHE_SIZE)
+def _parse_ua_cached(user_agent_string: str) -> Mapping[str, Any]:
+    """
+    User-Agent 문자열을 파싱해 접속 로그 필드로 변환합니다 (LRU 캐시).
+
+    결과는 여러 요청이 공유하므로 읽기 전용 매핑으로 반환합니다.
+
+    Args:
+        user_agent_string: 비어 있지 않은 User-Agent 헤더 값
+
+    Returns:
+        파싱된 정보 (읽기 전용 매핑)
+    """
+    ua = parse_user_agent(user_agent_string)
+    ua_os, ua_browser, ua_device = ua.os, ua.browser, ua.device
+    os_family, browser_family = ua_os.family, ua_browser.family
+
+    # 장치 유형 결정
+    if ua.is_mobile:
+        device_type = "mobile"
+    elif ua.is_tablet:
+        device_type = "tablet"
+    elif ua.is_pc:
+        device_type = "desktop"
+    else:
+        device_type = "other"
+
+    return MappingProxyType(
+        {
+            "os_name": _clip(os_family, _UA_FIELD_MAX_LENGTH) if os_family != _OTHER else None,
+            "os_version": _clip(ua_os.version_string, _UA_FIELD_MAX_LENGTH) or None,
+            "browser_name": (
+                _clip(browser_family, _UA_FIELD_MAX_LENGTH) if browser_family != _OTHER else None
+            ),
+            "browser_version": _clip(ua_browser.version_string, _UA_FIELD_MAX_LENGTH) or None,
+            "device_type": device_type,
+            "device_brand": _clip(ua_device.brand, _UA_FIELD_MAX_LENGTH) or None,
+            "device_model": _clip(ua_device.model, _DEVICE_MODEL_MAX_LENGTH) or None,
+            "is_bot": ua.is_bot,
+        }
+    )
+
+
+def _compile_skip_rules(
+    paths: Iterable[str], extensions: Iterable[str]
+) -> tuple[frozenset[str], tuple[str, ...], tuple[str, ...]]:
+    """
+    제외 경로·확장자를 요청마다 C 수준 연산 한 번씩으로 검사할 형태로 나눕니다.
+
+    경로는 정확히 일치해야 하며, ``/*`` 로 끝나면 그 아래 모든 경로(접두사)를
+    제외합니다 (예: ``/metrics/*`` → ``/metrics/cpu``). 확장자는 경로 끝과 비교합니다.
+    ``.*ext`` 대안을 이어 붙인 정규식은 대안마다 경로 전체를 다시 훑으므로, 집합 조회 ·
+    ``str.startswith(tuple)`` · ``str.endswith(tuple)`` 로 나눠 검사합니다.
+
+    Args:
+        paths: 제외 경로 목록
+        extensions: 제외 확장자 목록
+
+    Returns:
+        (정확히 일치할 경로 집합, 접두사 튜플, 확장자 튜플)
+    """
+    paths = list(paths)
+    exact = frozenset(path for path in paths if not path.endswith("/*"))
+    prefixes = tuple(path[:-1] for path in paths if path.endswith("/*"))
+    return exact, prefixes, tuple(extensions)
+
+
+# 접속로그에 필요한 요청 헤더 (ASGI 헤더 이름은 소문자 bytes)
+_WANTED_HEADERS = frozenset(
+    (
+        b"x-forwarded-for",
+        b"x-real-ip",
+        b"user-agent",
+        b"referer",
+        b"accept-language",
+        b"cookie",
+        b"traceparent",
+        b"x-request-id",
+    )
+)
+
+
+def _scan_headers(scope: Scope) -> dict[bytes, str]:
+    """
+    scope 의 원시 헤더 목록을 한 번 훑어 필요한 헤더만 꺼냅니다.
+
+    같은 헤더가 여러 번 오면 첫 값을 사용합니다 (Starlette ``Headers.get`` 과 동일).
+
+    Args:
+        scope: ASGI 연결 scope
+
+    Returns:
+        소문자 헤더 이름(bytes) → 디코딩된 값
+    """
+    found: dict[bytes, str] = {}
+    for key, value in scope["headers"]:
+        if key in _WANTED_HEADERS and key not in found:
+            found[key] = value.decode("latin-1")
+    return found
+
+
+def _unquote_cookie(value: str) -> str:
+    """
+    큰따옴표로 감싼 쿠키 값을 풉니다 (``request.cookies`` 와 같은 규칙).
+
+    감싸지 않은 값은 그대로 두고, 감싼 값은 따옴표를 벗긴 뒤 ``\\073`` 같은
+    8진수 이스케이프와 ``\\"`` 같은 백슬래시 이스케이프를 원래 글자로 바꿉니다.
+
+    Args:
+        value: 앞뒤 공백을 정리한 쿠키 값
+
+    Returns:
+        따옴표·이스케이프를 푼 값
+    """
+    if len(value) < 2 or value[0] != '"' or value[-1] != '"':
+        return value
+    return _COOKIE_ESCAPE.sub(
+        lambda m: chr(int(m[1], 8)) if m[1] else m[2],
+        value[1:-1],
+    )
+
+
+def _get_session_id(cookie: str | None) -> str | None:
+    """
+    Cookie 헤더에서 ``session_id`` 값만 찾습니다 (전체 쿠키 dict 파싱 생략).
+
+    ``request.cookies`` 와 같은 결과가 되도록 따옴표·이스케이프를 풀고,
+    같은 이름이 여러 번 오면 마지막 값을 씁니다.
+
+    Args:
+        cookie: Cookie 헤더 값
 
-class UserInfoMiddleware(BaseHTTPMiddleware):
+    Returns:
+        session_id 쿠키 값 (없으면 None)
+    """
+    if not cookie:
+        return None
+    found = None
+    for chunk in cookie.split(";"):
+        name, _, value = chunk.partition("=")
+        if name.strip() == "session_id":
+            found = value.strip()
+    if not found:
+        return None
+    return _unquote_cookie(found) or None
+
+
+class UserInfoMiddleware:
     """
     사용자 접속 정보 수집 미들웨어
 
-    요청 시작 시 사용자 정보를 수집하고,
-    응답 완료 후 백그라운드에서 데이터베이스에 저장합니다.
+    응답 완료 후 사용자 정보를 수집하여
+    배치 수집기 큐에 넣고, 백그라운드에서 일괄 저장합니다.
 
     수집 정보:
         - IP 주소 (X-Forwarded-For, X-Real-IP 포함)
@@ -33,227 +225,238 @@ class UserInfoMiddleware(BaseHTTPMiddleware):
         - 응답 상태 코드 및 시간
     """
 
-    def __init__(self, app: ASGIApp) -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        exclude_paths: Iterable[str] | None = None,
+        exclude_extensions: Iterable[str] | None = None,
+    ) -> None:
         """
         미들웨어 초기화
 
         Args:
             app: 다음 ASGI 애플리케이션(add_middleware 가 주입)
+            exclude_paths: 제외 경로 (기본값: ACCESS_LOG_EXCLUDE_PATHS)
+            exclude_extensions: 제외 확장자 (기본값: ACCESS_LOG_EXCLUDE_EXTENSIONS)
         """
-        super().__init__(app)
-        self.enabled = middleware_settings.ACCESS_LOG_ENABLED
-        self.exclude_paths = set(middleware_settings.ACCESS_LOG_EXCLUDE_PATHS)
-        self.exclude_extensions = set(middleware_settings.ACCESS_LOG_EXCLUDE_EXTENSIONS)
+        self.app = app
+        self._skip_paths, self._skip_prefixes, self._skip_extensions = _compile_skip_rules(
+            middleware_settings.ACCESS_LOG_EXCLUDE_PATHS
+            if exclude_paths is None
+            else exclude_paths,
+            middleware_settings.ACCESS_LOG_EXCLUDE_EXTENSIONS
+            if exclude_extensions is None
+            else exclude_extensions,
+        )
 
     def _should_skip(self, path: str) -> bool:
         """
         로깅을 건너뛸지 결정합니다.
 
+        정확한 경로는 집합 조회, 하위 경로 · 확장자는 튜플 인자 startswith/endswith 로
+        검사합니다 (빈 튜플은 항상 False).
+
         Args:
             path: 요청 경로
 
         Returns:
             건너뛸 경우 True
         """
-        # 비활성화된 경우
-        if not self.enabled:
-            return True
-
-        # 제외 경로인 경우
-        if path in self.exclude_paths:
-            return True
-
-        # 제외 확장자인 경우
-        for ext in self.exclude_extensions:
-            if path.endswith(ext):
-                return True
-
-        return False
+        return (
+            path in self._skip_paths
+            or path.startswith(self._skip_prefixes)
+            or path.endswith(self._skip_extensions)
+        )
 
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(
+        self,
+        forwarded_for: str | None,
+        real_ip: str | None,
+        scope: Scope,
+    ) -> str:
         """
         클라이언트 IP 주소를 추출합니다.
 
         프록시 환경을 고려하여 X-Forwarded-For, X-Real-IP 헤더를 확인합니다.
 
         Args:
-            request: FastAPI Request 객체
+            forwarded_for: X-Forwarded-For 헤더 값
+            real_ip: X-Real-IP 헤더 값
+            scope: ASGI 연결 scope (직접 연결 클라이언트 주소)
 
         Returns:
             클라이언트 IP 주소
         """
-        # X-Forwarded-For 헤더 확인 (프록시/로드밸런서 환경)
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            # 첫 번째 IP가 실제 클라이언트 IP
-            return forwarded_for.split(",")[0].strip()
-
-        # X-Real-IP 헤더 확인
-        real_ip = request.headers.get("X-Real-IP")
-        if real_ip:
-            return real_ip
-
-        # 직접 연결된 클라이언트 IP
-        if request.client:
-            return request.client.host
-
-        return "unknown"
+        # 우선순위: X-Forwarded-For 첫 IP(실제 클라이언트) → X-Real-IP → 직접 연결 주소.
+        # partition 은 콤마 구분 IP 전체를 리스트로 만들지 않고 첫 항목만 잘라낸다.
+        return (
+            (forwarded_for and forwarded_for.partition(",")[0].strip())
+            or real_ip
+            or (scope.get("client") or ("unknown", 0))[0]
+        )
 
-    def _parse_user_agent(self, user_agent_string: str | None) -> dict:
+    def _parse_user_agent(self, user_agent_string: str | None) -> Mapping[str, Any]:
         """
         User-Agent 문자열을 파싱합니다.
 
+        같은 UA 문자열은 트래픽에서 반복되므로 파싱 결과를 LRU 캐시에서 재사용합니다.
+
         Args:
             user_agent_string: User-Agent 헤더 값
 
         Returns:
-            파싱된 정보 딕셔너리
+            파싱된 정보 (읽기 전용 매핑)
         """
         if not user_agent_string:
-            return {
-                "os_name": None,
-                "os_version": None,
-                "browser_name": None,
-                "browser_version": None,
-                "device_type": None,
-                "device_brand": None,
-                "device_model": None,
-                "is_bot": False,
-            }
-
-        ua = parse_user_agent(user_agent_string)
-
-        # 장치 유형 결정
-        if ua.is_mobile:
-            device_type = "mobile"
-        elif ua.is_tablet:
-            device_type = "tablet"
-        elif ua.is_pc:
-            device_type = "desktop"
-        else:
-            device_type = "other"
-
-        return {
-            "os_name": ua.os.family if ua.os.family != "Other" else None,
-            "os_version": ua.os.version_string or None,
-            "browser_name": ua.browser.family if ua.browser.family != "Other" else None,
-            "browser_version": ua.browser.version_string or None,
-            "device_type": device_type,
-            "device_brand": ua.device.brand or None,
-            "device_model": ua.device.model or None,
-            "is_bot": ua.is_bot,
-        }
+            return _EMPTY_UA
+        return _parse_ua_cached(user_agent_string)
 
-    def _collect_request_info(self, request: Request) -> dict:
+    def _collect_request_info(
+        self,
+        scope: Scope,
+        headers: dict[bytes, str] | None = None,
+    ) -> AccessLogRecord:
         """
         요청에서 정보를 수집합니다.
 
+        ``Request``/``Headers`` 래퍼를 거치지 않고 ASGI scope 의 원시 헤더 목록을
+        한 번만 훑어 필요한 값만 꺼냅니다. 레코드는 풀에서 꺼내 채우며,
+        저장 후 배치 수집기가 풀로 돌려보냅니다. 클라이언트가 정하는 값은 길이 제한이
+        있는 컬럼에 맞게 잘라, 한 요청의 긴 헤더가 배치 저장을 깨뜨리지 않게 합니다.
+
         Args:
-            request: FastAPI Request 객체
+            scope: ASGI 연결 scope
+            headers: 이미 훑은 헤더 (없으면 여기서 훑음)
 
         Returns:
-            수집된 정보 딕셔너리
+            수집된 접속로그 레코드
         """
-        # User-Agent 파싱
-        user_agent_string = request.headers.get("User-Agent")
+        if headers is None:
+            headers = _scan_headers(scope)
+        record = access_log_record_pool.acquire()
+
+        # 네트워크 정보
+        forwarded_for = headers.get(b"x-forwarded-for")
+        real_ip = headers.get(b"x-real-ip")
+        record.ip_address = self._get_client_ip(forwarded_for, real_ip, scope)[:_IP_MAX_LENGTH]
+        record.forwarded_for = _clip(forwarded_for, _HEADER_MAX_LENGTH)
+        record.real_ip = _clip(real_ip, _IP_MAX_LENGTH)
+
+        # User-Agent 정보
+        user_agent_string = headers.get(b"user-agent")
         ua_info = self._parse_user_agent(user_agent_string)
+        record.user_agent = user_agent_string
+        record.os_name = ua_info["os_name"]
+        record.os_version = ua_info["os_version"]
+        record.browser_name = ua_info["browser_name"]
+        record.browser_version = ua_info["browser_version"]
+        record.device_type = ua_info["device_type"]
+        record.device_brand = ua_info["device_brand"]
+        record.device_model = ua_info["device_model"]
+        record.is_bot = ua_info["is_bot"]
+
+        # 요청 정보
+        record.request_path = scope["path"][:_PATH_MAX_LENGTH]
+        record.request_method = scope["method"][:_METHOD_MAX_LENGTH]
+        # request.query_params 와 같은 정규화된 형태로 저장 (쿼리가 있을 때만 파싱)
+        raw_query = scope.get("query_string", b"")
+        record.query_string = (str(QueryParams(raw_query)) or None) if raw_query else None
+        record.referer = headers.get(b"referer")
+
+        # 추가 헤더
+        record.accept_language = _clip(headers.get(b"accept-language"), _HEADER_MAX_LENGTH)
+
+        # 사용자 정보 (인증 미들웨어·핸들러가 request.state 에 설정할 수 있음)
+        record.session_id = _clip(_get_session_id(headers.get(b"cookie")), _SESSION_ID_MAX_LENGTH)
+        record.user_id = scope.get("state", {}).get("user_id")
+
+        # 요청 추적 정보 (워커 태스크는 ContextVar 를 보지 않으므로 적재 시점에 기록)
+        record.correlation_id = correlation_id.get() or resolve_correlation_id(
+            headers.get(b"traceparent"), headers.get(b"x-request-id")
+        )
 
-        # 쿼리 스트링
-        query_string = str(request.query_params) if request.query_params else None
-
-        return {
-            # 네트워크 정보
-            "ip_address": self._get_client_ip(request),
-            "forwarded_for": request.headers.get("X-Forwarded-For"),
-            "real_ip": request.headers.get("X-Real-IP"),
-            # User-Agent 정보
-            "user_agent": user_agent_string,
-            **ua_info,
-            # 요청 정보
-            "request_path": request.url.path,
-            "request_method": request.method,
-            "query_string": query_string,
-            "referer": request.headers.get("Referer"),
-            # 추가 헤더
-            "accept_language": request.headers.get("Accept-Language"),
-            # 사용자 정보 (인증 미들웨어에서 설정될 수 있음)
-            "session_id": request.cookies.get("session_id"),
-            "user_id": getattr(request.state, "user_id", None),
-        }
+        return record
 
-    async def _save_access_log(self, data: dict) -> None:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        접속 로그를 백그라운드에서 저장합니다.
+        미들웨어 메인 로직 (순수 ASGI)
 
-        Args:
-            data: 저장할 접속 로그 데이터
-        """
-        try:
-            sink = get_access_log_sink()
-            if sink is None:
-                return
-            await sink.save(data)
-        except Exception as e:
-            # 로그 저장 실패가 요청 처리에 영향을 주지 않도록 함
-            logger.error(f"접속 로그 저장 실패: {e}", exc_info=True)
-
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: RequestResponseEndpoint,
-    ) -> Response:
-        """
-        미들웨어 메인 로직
+        BaseHTTPMiddleware 와 달리 요청마다 별도 태스크·메모리 스트림을 만들지 않고,
+        ``send`` 를 감싸 응답 상태 코드만 가로챕니다.
 
         Args:
-            request: FastAPI Request 객체
-            call_next: 다음 미들웨어 또는 라우터 호출 함수
-
-        Returns:
-            Response 객체
+            scope: ASGI 연결 scope
+            receive: ASGI receive 채널
+            send: ASGI send 채널
         """
-        path = request.url.path
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
 
         # 로깅 제외 대상인 경우 바로 다음으로 전달
         if self._should_skip(path):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
-        # 요청 시작 시간 기록
-        start_time = time.perf_counter()
+        # 요청 시작 시간 기록 (정수 나노초 — 경과 ms 를 정수 나눗셈으로 계산)
+        start_ns = time.monotonic_ns()
+        method = scope["method"]
 
-        logger.debug(f"[요청 시작] {request.method} {path}")
+        # 헤더는 진입 시 한 번만 훑는다 (상관관계 ID 결정 + 응답 후 수집에 재사용)
+        headers = _scan_headers(scope)
+        token = correlation_id.set(
+            resolve_correlation_id(headers.get(b"traceparent"), headers.get(b"x-request-id"))
+        )
 
-        # 요청 정보 수집
-        request_info = self._collect_request_info(request)
+        # %-지연 포맷팅: DEBUG 가 꺼져 있으면 문자열을 만들지 않는다
+        logger.debug("[요청 시작] %s %s", method, path)
 
-        # 요청 처리
-        response: Response = await call_next(request)
+        status_code = 500
 
-        # 응답 시간 계산
-        response_time_ms = int((time.perf_counter() - start_time) * 1000)
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-        # 응답 정보 추가
-        request_info["response_status"] = response.status_code
-        request_info["response_time_ms"] = response_time_ms
+        try:
+            # 요청 처리
+            await self.app(scope, receive, send_wrapper)
 
-        logger.debug(
-            f"[요청 완료] {request.method} {path} "
-            f"- {response.status_code} ({response_time_ms}ms)"
-        )
+            # 응답 시간 계산
+            response_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
-        # 백그라운드에서 로그 저장 (요청 처리를 블로킹하지 않음).
-        # 상한 초과 시 드롭·집계되고, 앱 종료 시 lifespan 이 drain 한다(W1).
-        access_log_tasks.spawn(self._save_access_log(request_info))
+            # 요청 정보 수집 — 핸들러 동작에 영향이 없으므로 응답 이후로 미뤄
+            # UA 파싱 비용이 응답 지연에 더해지지 않게 한다.
+            request_info = self._collect_request_info(scope, headers)
+        finally:
+            correlation_id.reset(token)
 
-        return response
+        # 응답 정보 추가
+        request_info.response_status = status_code
+        request_info.response_time_ms = response_time_ms
+
+        logger.debug("[요청 완료] %s %s - %d (%dms)", method, path, status_code, response_time_ms)
+
+        # 배치 수집기 큐에 적재 (요청 처리를 블로킹하지 않음).
+        # 소비자가 모아서 한 트랜잭션에 일괄 저장하고, 큐가 가득 차면 드롭·집계된다.
+        access_log_batcher.enqueue(request_info)
 
 
 def setup_user_info_middleware(app: FastAPI) -> None:
     """
     UserInfoMiddleware를 FastAPI 앱에 등록합니다.
 
+    ACCESS_LOG_ENABLED=false 이면 미들웨어를 아예 등록하지 않아
+    요청당 수집 비용이 전혀 들지 않습니다.
+
     Args:
         app: FastAPI 애플리케이션 인스턴스
     """
+    if not middleware_settings.ACCESS_LOG_ENABLED:
+        logger.info("UserInfoMiddleware 비활성화 (ACCESS_LOG_ENABLED=False) — 등록 건너뜀")
+        return
     app.add_middleware(UserInfoMiddleware)
     logger.info("UserInfoMiddleware 등록 완료")
@@ -12,8 +12,10 @@ SQLAlchemy Base 클래스
         ...
 """
 
+import os
+import time
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 from uuid import uuid4
 
 from sqlalchemy import DateTime, String
@@ -41,9 +43,18 @@ class Base(DeclarativeBase):
         datetime: DateTime(timezone=True),
     }
 
+    # 매핑된 테이블의 컬럼 이름 (클래스 정의 시 한 번 계산)
+    _column_names: ClassVar[tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        table = getattr(cls, "__table__", None)
+        if table is not None:
+            cls._column_names = tuple(c.name for c in table.columns)
+
     def to_dict(self) -> dict[str, Any]:
-        """모델을 딕셔너리로 변환합니다."""
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
+        """모델을 딕셔너리로 변환합니다 (캐시된 컬럼 이름 사용)."""
+        return {name: getattr(self, name) for name in self._column_names}
 
 
 class TimestampMixin:
@@ -61,16 +72,47 @@ class TimestampMixin:
     )
 
 
+def new_hex_id() -> str:
+    """
+    UUID4 기본키 값을 생성합니다 (하이픈 없는 32자 hex).
+
+    ``str(uuid4())`` 의 하이픈 포맷팅(``UUID.__str__``)을 거치지 않아 대량 적재 시
+    행당 비용이 줄어듭니다. 엔트로피는 동일합니다.
+    """
+    return uuid4().hex
+
+
+def new_uuid7_hex() -> str:
+    """
+    UUIDv7(RFC 9562) 기본키 값을 생성합니다 (하이픈 없는 32자 hex).
+
+    앞 48비트가 유닉스 밀리초 타임스탬프라 값이 시간순으로 커집니다. InnoDB 는 기본키로
+    행을 클러스터링하므로, 랜덤한 UUID4 와 달리 새 행이 항상 인덱스 끝 페이지에 붙어
+    페이지 분할·버퍼 풀 교체가 줄어듭니다. 나머지 74비트는 난수입니다.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10))
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76  # version
+        | (rand >> 68) << 64  # rand_a (12비트)
+        | 0b10 << 62  # variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b (62비트)
+    )
+    return f"{value:032x}"
+
+
 class UUIDMixin:
     """
     UUID 기본키 믹스인
 
-    String(36) 타입의 UUID id 필드를 자동으로 추가합니다.
+    UUID id 필드를 자동으로 추가합니다. 새 값은 32자 hex 로 생성하되,
+    기존 하이픈 포함 값(36자)과 공존할 수 있도록 컬럼은 String(36)을 유지합니다.
     MySQL, PostgreSQL 모두 호환됩니다.
     """
 
     id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=new_hex_id,
     )
@@ -18,11 +18,24 @@ CRUD 작업과 N+1 문제 해결을 위한 Eager Loading 메서드를 제공합
     users = await repo.get_all_with(relations=["posts"])
 """
 
-from collections.abc import Sequence
-from typing import Any, cast
-from uuid import uuid4
-
-from sqlalchemy import CursorResult, delete, func, select, update
+from collections.abc import AsyncIterator, Callable, Sequence
+from functools import lru_cache
+from typing import Any, ClassVar, cast
+
+from sqlalchemy import (
+    CursorResult,
+    Result,
+    Row,
+    bindparam,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import (
@@ -36,11 +49,152 @@ from sqlalchemy.orm import (
 from sqlalchemy.sql import Select
 
 from app.core.exception import DatabaseException, DuplicateException, NotFoundException
+from app.core.models.models_base import Base
 from app.core.repositories.crud_base import CRUDBase, ModelType
 from app.utils.logs import get_logger
 
 logger = get_logger("repository")
 
+# Eager Loading 전략 이름 → 로더 함수 (알 수 없는 전략은 selectin)
+_LOADERS: dict[str, Callable[..., Any]] = {
+    "selectin": selectinload,
+    "joined": joinedload,
+    "subquery": subqueryload,
+}
+
+# MySQL 테이블 추정 행 수 (InnoDB 통계, 현재 스키마 기준)
+_MYSQL_TABLE_ROWS_STMT = text(
+    "SELECT TABLE_ROWS FROM information_schema.TABLES "
+    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"
+)
+
+
+@lru_cache(maxsize=512)
+def _resolve_load_option(model: type[Base], relation: str, strategy: str) -> Any:
+    """
+    관계 경로 문자열을 로더 옵션으로 해석합니다 (모델·경로·전략별 캐시).
+
+    로더 옵션은 불변 객체라 여러 구문에서 그대로 재사용할 수 있으므로,
+    경로 분할·속성 조회·옵션 체인 구성을 조합마다 한 번만 수행합니다.
+
+    Args:
+        model: 기준 모델 클래스
+        relation: 관계 경로 (중첩은 점 구분: "posts.comments")
+        strategy: 첫 관계에 적용할 로딩 전략
+
+    Returns:
+        ``stmt.options()`` 에 넘길 로더 옵션
+    """
+    # 중첩 관계 지원: "posts.comments" -> posts -> comments
+    parts = relation.split(".")
+
+    # 첫 파트는 현재 모델의 관계 속성으로 로더를 시작한다.
+    attr = getattr(model, parts[0])
+    loader = _LOADERS.get(strategy, selectinload)
+    # 1:N 컬렉션을 JOIN 으로 읽으면 부모 행이 자식 수만큼 중복되어 결과마다
+    # .unique() 로 걸러야 하므로, 컬렉션은 selectin 으로 바꿔 로드한다.
+    if loader is joinedload and attr.property.uselist:
+        loader = selectinload
+    load_option = loader(attr)
+    # 다음 파트는 "직전 관계가 가리키는 모델"의 속성이어야 한다. SQLAlchemy 2.0
+    # 에서는 문자열 기반 관계 로딩이 제거되었으므로, mapper 를 따라가며 실제
+    # QueryableAttribute 로 해석한다(문자열 전달 시 런타임 오류).
+    related_model = attr.property.mapper.class_
+    for part in parts[1:]:
+        attr = getattr(related_model, part)
+        load_option = load_option.selectinload(attr)
+        related_model = attr.property.mapper.class_
+    return load_option
+
+
+def _relations_loaded(instance: Any, relations: list[str] | None) -> bool:
+    """
+    인스턴스에 관계 경로가 모두 로드돼 있는지 확인합니다 (접근 시 지연 로딩 없음).
+
+    Args:
+        instance: identity map 에 있는 모델 인스턴스
+        relations: 관계 경로 목록 (중첩은 점 구분)
+
+    Returns:
+        모든 경로가 로드돼 있으면 True
+    """
+    state = inspect(instance)
+    unloaded = state.unloaded
+    if any(attr.key in unloaded for attr in state.mapper.column_attrs):
+        return False
+    for relation in relations or ():
+        level = [instance]
+        for part in relation.split("."):
+            next_level = []
+            for obj in level:
+                if part in inspect(obj).unloaded:
+                    return False
+                value = getattr(obj, part)
+                if isinstance(value, list | set | tuple):
+                    next_level.extend(value)
+                elif value is not None:
+                    next_level.append(value)
+            level = next_level
+    return True
+
+
+@lru_cache(maxsize=512)
+def _resolve_column_options(
+    model: type[Base],
+    only_columns: tuple[str, ...],
+    defer_columns: tuple[str, ...],
+) -> tuple[Any, ...]:
+    """
+    컬럼 로딩 옵션(load_only/defer)을 만듭니다 (모델·컬럼 조합별 캐시).
+
+    Args:
+        model: 기준 모델 클래스
+        only_columns: 로드할 컬럼 이름
+        defer_columns: 지연 로딩할 컬럼 이름
+
+    Returns:
+        ``stmt.options()`` 에 넘길 옵션 튜플
+    """
+    options: list[Any] = []
+    if only_columns:
+        options.append(load_only(*(getattr(model, col) for col in only_columns)))
+    options.extend(defer(getattr(model, col)) for col in defer_columns)
+    return tuple(options)
+
+
+@lru_cache(maxsize=512)
+def _page_template(
+    model: type[Base], filters: tuple[tuple[str, bool], ...], seek: bool, counted: bool = True
+) -> Select:
+    """
+    ``get_page()`` 구문 템플릿을 모델·필터 조합마다 한 번만 만듭니다.
+
+    값은 모두 bindparam 으로 넘기므로 요청마다 select() 표현식 트리를 다시
+    조립하거나 컴파일 캐시 키를 새로 계산하지 않고 같은 구문 객체를 재사용합니다.
+
+    Args:
+        model: 기준 모델 클래스
+        filters: 정렬된 ``(컬럼명, 값이 None 인지)`` 목록 (None 은 IS NULL 로 비교)
+        seek: 커서(``id > :cursor``) 조건 포함 여부
+        counted: 전체 개수 창 함수(``total`` 컬럼) 포함 여부 (seek 과 함께 쓰지 않음)
+
+    Returns:
+        ``filter_<컬럼명>`` · ``cursor`` · ``skip`` · ``limit`` 를 바인드하는 Select 문
+    """
+    stmt = select(model).where(
+        *(
+            getattr(model, name).is_(None)
+            if is_null
+            else getattr(model, name) == bindparam(f"filter_{name}")
+            for name, is_null in filters
+        )
+    )
+    if seek:
+        stmt = stmt.where(model.id > bindparam("cursor", type_=model.id.type))
+    elif counted:
+        stmt = stmt.add_columns(func.count(model.id).over().label("total"))
+    return stmt.order_by(model.id).offset(bindparam("skip")).limit(bindparam("limit"))
+
 
 class BaseRepository(CRUDBase[ModelType]):
     """
@@ -66,6 +220,24 @@ class BaseRepository(CRUDBase[ModelType]):
 
     model: type[ModelType]
 
+    # 하위 클래스마다 한 번 만들어 두는 구문 템플릿 (id 는 bindparam 으로 전달)
+    _select_by_id_stmt: ClassVar[Select]
+    _exists_stmt: ClassVar[Select]
+    _count_stmt: ClassVar[Select]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """model 을 정의한 하위 클래스의 자주 쓰는 구문을 미리 구성합니다."""
+        super().__init_subclass__(**kwargs)
+        model = cls.__dict__.get("model")
+        if model is None:
+            return
+        id_param = bindparam("id")
+        cls._select_by_id_stmt = select(model).where(model.id == id_param)
+        # count(*) 대신 첫 행에서 멈추는 SELECT 1 ... LIMIT 1
+        cls._exists_stmt = select(literal(1)).where(model.id == id_param).limit(1)
+        # 기본키 컬럼으로 세어 FROM 을 모델 테이블 하나로 고정한다
+        cls._count_stmt = select(func.count(model.id))
+
     def __init__(self, session: AsyncSession) -> None:
         """
         BaseRepository 초기화
@@ -96,6 +268,7 @@ class BaseRepository(CRUDBase[ModelType]):
             strategy: 로딩 전략
                 - "selectin": SELECT ... WHERE id IN (...) - 1:N 컬렉션에 권장
                 - "joined": LEFT JOIN으로 한 번에 조회 - 1:1, N:1에 권장
+                  (1:N 컬렉션에 지정하면 selectin 으로 대체)
                 - "subquery": 서브쿼리 사용 - selectin과 유사
 
         Returns:
@@ -107,32 +280,9 @@ class BaseRepository(CRUDBase[ModelType]):
         if not relations:
             return stmt
 
-        loader_map = {
-            "selectin": selectinload,
-            "joined": joinedload,
-            "subquery": subqueryload,
-        }
-        loader = loader_map.get(strategy, selectinload)
-
-        for relation in relations:
-            # 중첩 관계 지원: "posts.comments" -> posts -> comments
-            parts = relation.split(".")
-
-            # 첫 파트는 현재 모델의 관계 속성으로 로더를 시작한다.
-            attr = getattr(self.model, parts[0])
-            load_option = loader(attr)
-            # 다음 파트는 "직전 관계가 가리키는 모델"의 속성이어야 한다. SQLAlchemy 2.0
-            # 에서는 문자열 기반 관계 로딩이 제거되었으므로, mapper 를 따라가며 실제
-            # QueryableAttribute 로 해석한다(문자열 전달 시 런타임 오류).
-            related_model = attr.property.mapper.class_
-            for part in parts[1:]:
-                attr = getattr(related_model, part)
-                load_option = load_option.selectinload(attr)
-                related_model = attr.property.mapper.class_
-
-            stmt = stmt.options(load_option)
-
-        return stmt
+        return stmt.options(
+            *(_resolve_load_option(self.model, relation, strategy) for relation in relations)
+        )
 
     def _apply_column_loading(
         self,
@@ -153,15 +303,34 @@ class BaseRepository(CRUDBase[ModelType]):
         Returns:
             컬럼 로딩이 적용된 Select 문
         """
-        if only_columns:
-            columns = [getattr(self.model, col) for col in only_columns]
-            stmt = stmt.options(load_only(*columns))
+        if not only_columns and not defer_columns:
+            return stmt
+
+        return stmt.options(
+            *_resolve_column_options(
+                self.model,
+                tuple(only_columns or ()),
+                tuple(defer_columns or ()),
+            )
+        )
 
-        if defer_columns:
-            for col in defer_columns:
-                stmt = stmt.options(defer(getattr(self.model, col)))
+    async def _read(self, stmt: Select, params: dict[str, Any] | None = None) -> Result[Any]:
+        """
+        조회 구문을 autoflush 없이 실행합니다.
 
-        return stmt
+        세션 팩토리는 이미 ``autoflush=False`` 지만, 외부에서 만든 세션(테스트,
+        관리 도구 등)이 넘어와도 읽기마다 unit-of-work 변경 목록을 훑지 않도록
+        보장합니다. 쓰기 메서드는 모두 명시적으로 flush 하므로 결과는 같습니다.
+
+        Args:
+            stmt: 실행할 Select 문
+            params: bindparam 값 (구문 템플릿 실행 시)
+
+        Returns:
+            실행 결과
+        """
+        with self.session.no_autoflush:
+            return await self.session.execute(stmt, params)
 
     # ========================================================================
     # CREATE (생성)
@@ -181,23 +350,33 @@ class BaseRepository(CRUDBase[ModelType]):
             DuplicateException: 중복 데이터가 존재하는 경우
             DatabaseException: 데이터베이스 오류가 발생한 경우
 
+        Note:
+            RETURNING 을 지원하는 DB 에서는 ``INSERT ... RETURNING`` 한 번으로 생성된
+            인스턴스를 받습니다. 지원하지 않는 DB(MySQL)에서는 add 후 flush 만 하고
+            refresh 로 다시 읽지 않습니다 — 모든 기본값이 Python 측 default 라
+            flush 시점에 인스턴스에 이미 채워져 있습니다.
+
         Example:
             user = await repo.create({"name": "John", "email": "john@example.com"})
         """
-        if "id" not in data:
-            data["id"] = str(uuid4())
-
+        # id 는 모델 컬럼 default 가 flush 시점에 채운다
         try:
+            if self.session.get_bind().dialect.insert_returning:
+                stmt = insert(self.model).values(**data).returning(self.model)
+                return (await self.session.scalars(stmt)).one()
+
             instance = self.model(**data)
-            return await self._add(instance)  # CRUDBase 메서드 활용
+            self.session.add(instance)
+            await self.session.flush()
+            return instance
         except IntegrityError as e:
-            logger.error(f"[CREATE] 중복 데이터 오류: {e}")
+            logger.error("[CREATE] 중복 데이터 오류: %s", e)
             raise DuplicateException(
                 message="이미 존재하는 데이터입니다.",
                 detail={"model": self.model.__name__, "error": str(e.orig)},
             ) from e
         except SQLAlchemyError as e:
-            logger.error(f"[CREATE] 데이터베이스 오류: {e}")
+            logger.error("[CREATE] 데이터베이스 오류: %s", e)
             raise DatabaseException(
                 message="데이터 생성 중 오류가 발생했습니다.",
                 detail={"model": self.model.__name__, "error": str(e)},
@@ -217,39 +396,84 @@ class BaseRepository(CRUDBase[ModelType]):
             DuplicateException: 중복 데이터가 존재하는 경우
             DatabaseException: 데이터베이스 오류가 발생한 경우
 
+        Note:
+            RETURNING 을 executemany 로 지원하는 DB(PostgreSQL, SQLite 3.35+)에서는
+            ``INSERT ... RETURNING`` 한 번으로 생성된 인스턴스를 받습니다. 지원하지 않는
+            DB(MySQL)에서는 ``add_all`` 후 flush 한 번으로 저장합니다. 모든 기본값이
+            Python 측 default 이고 세션이 ``expire_on_commit=False`` 이므로 행마다
+            refresh 로 다시 읽지 않습니다.
+
         Example:
             users = await repo.bulk_create([
                 {"name": "John"},
                 {"name": "Jane"},
             ])
         """
+        if not data_list:
+            return []
+
+        # id 는 모델 컬럼 default 가 INSERT 시점에 행마다 채운다
         try:
-            instances = []
-            for data in data_list:
-                if "id" not in data:
-                    data["id"] = str(uuid4())
-                instances.append(self.model(**data))
+            if self.session.get_bind().dialect.insert_executemany_returning:
+                stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+                result = await self.session.scalars(stmt, data_list)
+                return list(result.all())
 
+            instances = [self.model(**data) for data in data_list]
             self.session.add_all(instances)
             await self.session.flush()
-
-            for instance in instances:
-                await self.session.refresh(instance)
-
             return instances
         except IntegrityError as e:
-            logger.error(f"[BULK_CREATE] 중복 데이터 오류: {e}")
+            logger.error("[BULK_CREATE] 중복 데이터 오류: %s", e)
             raise DuplicateException(
                 message="일괄 생성 중 중복 데이터가 발견되었습니다.",
                 detail={"model": self.model.__name__, "error": str(e.orig)},
             ) from e
         except SQLAlchemyError as e:
-            logger.error(f"[BULK_CREATE] 데이터베이스 오류: {e}")
+            logger.error("[BULK_CREATE] 데이터베이스 오류: %s", e)
             raise DatabaseException(
                 message="일괄 데이터 생성 중 오류가 발생했습니다.",
                 detail={"model": self.model.__name__, "error": str(e)},
             ) from e
 
+    async def bulk_insert(self, data_list: list[dict[str, Any]]) -> None:
+        """
+        여러 레코드를 Core INSERT 한 번으로 적재합니다 (인스턴스 반환 없음).
+
+        ORM 인스턴스 생성·identity map 등록·refresh 를 모두 건너뛰므로
+        접속 로그처럼 저장 후 다시 읽을 필요가 없는 대량 적재에 사용합니다.
+
+        Args:
+            data_list: 생성할 데이터 딕셔너리 목록
+
+        Raises:
+            DuplicateException: 중복 데이터가 존재하는 경우
+            DatabaseException: 데이터베이스 오류가 발생한 경우
+
+        Example:
+            await repo.bulk_insert([
+                {"name": "John"},
+                {"name": "Jane"},
+            ])
+        """
+        if not data_list:
+            return
+        try:
+            # id·created_at 등은 모델 컬럼의 Python 측 default 가 행마다 채운다
+            await self.session.execute(insert(self.model), data_list)
+        except IntegrityError as e:
+            logger.error("[BULK_INSERT] 중복 데이터 오류: %s", e)
+            raise DuplicateException(
+                message="일괄 적재 중 중복 데이터가 발견되었습니다.",
+                detail={"model": self.model.__name__, "error": str(e.orig)},
+            ) from e
+        except SQLAlchemyError as e:
+            logger.error("[BULK_INSERT] 데이터베이스 오류: %s", e)
+            raise DatabaseException(
+                message="일괄 데이터 적재 중 오류가 발생했습니다.",
+                detail={"model": self.model.__name__, "error": str(e)},
+            ) from e
+
     # ========================================================================
     # READ - 기본 조회
     # ========================================================================
@@ -258,6 +482,9 @@ class BaseRepository(CRUDBase[ModelType]):
         """
         ID로 레코드를 조회합니다.
 
+        ``session.get`` 을 사용하므로 세션 identity map 에 이미 있는 객체는
+        SQL 없이 반환합니다.
+
         Args:
             id: 조회할 레코드의 ID
 
@@ -307,7 +534,7 @@ class BaseRepository(CRUDBase[ModelType]):
             user = await repo.get_one(email="john@example.com")
         """
         stmt = select(self.model).filter_by(**filters)
-        result = await self.session.execute(stmt)
+        result = await self._read(stmt)
         return result.scalar_one_or_none()
 
     async def get_many(
@@ -331,7 +558,7 @@ class BaseRepository(CRUDBase[ModelType]):
             active_users = await repo.get_many(is_active=True, limit=50)
         """
         stmt = select(self.model).filter_by(**filters).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
+        result = await self._read(stmt)
         return result.scalars().all()
 
     async def get_all(
@@ -353,29 +580,153 @@ class BaseRepository(CRUDBase[ModelType]):
             users = await repo.get_all(skip=0, limit=100)
         """
         stmt = select(self.model).offset(skip).limit(limit)
-        result = await self.session.execute(stmt)
+        result = await self._read(stmt)
         return result.scalars().all()
 
-    async def count(self, **filters: Any) -> int:
+    async def stream_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        yield_per: int = 50,
+    ) -> AsyncIterator[ModelType]:
+        """
+        모든 레코드를 스트리밍으로 조회합니다 (Async Generator).
+
+        ``get_all()`` 과 같은 범위를 ``yield_per`` 건씩 나눠 가져오므로, 호출자가
+        한 건씩 변환·전송하면 ORM 목록 전체를 메모리에 쥐고 있지 않아도 됩니다.
+
+        Args:
+            skip: 건너뛸 레코드 수
+            limit: 최대 조회 수
+            yield_per: 한 번에 가져올 행 수
+
+        Yields:
+            모델 인스턴스
+
+        Note:
+            스트리밍 중에는 커넥션이 결과를 읽는 데 묶이므로, 같은 세션으로 다른
+            쿼리(예: count)가 필요하면 스트리밍 전에 실행하세요.
+
+        Example:
+            async for user in repo.stream_all(limit=1000):
+                await send(user)
+        """
+        stmt = select(self.model).offset(skip).limit(limit).execution_options(yield_per=yield_per)
+        with self.session.no_autoflush:
+            result = await self.session.stream_scalars(stmt)
+        async for instance in result:
+            yield instance
+
+    async def count(self, *, exact: bool = True, **filters: Any) -> int:
         """
         레코드 수를 반환합니다.
 
+        ORDER BY · LIMIT · 컬럼 목록 없이 ``SELECT count(id) FROM <table> [WHERE ...]``
+        만 실행하므로 옵티마이저가 가장 작은 인덱스로 셀 수 있습니다.
+
         Args:
+            exact: False 이고 필터가 없으면 테이블 전체를 세지 않고 DB 통계의 추정
+                행 수를 반환합니다 (MySQL: ``information_schema.TABLES.TABLE_ROWS``).
+                추정치를 제공하지 않는 DB 는 정확한 개수로 대체합니다.
             **filters: 필터 조건 (선택적)
 
         Returns:
-            레코드 수
+            레코드 수 (``exact=False`` 면 추정치일 수 있음)
 
         Example:
             total = await repo.count()
             active_count = await repo.count(is_active=True)
+            approx_total = await repo.count(exact=False)
         """
-        stmt = select(func.count()).select_from(self.model)
+        if not exact and not filters:
+            estimate = await self._estimated_count()
+            if estimate is not None:
+                return estimate
+        stmt = self._count_stmt
         if filters:
             stmt = stmt.filter_by(**filters)
-        result = await self.session.execute(stmt)
+        result = await self._read(stmt)
         return result.scalar_one()
 
+    async def _estimated_count(self) -> int | None:
+        """
+        DB 통계에 기록된 테이블 추정 행 수를 반환합니다 (O(1), 지원하지 않으면 None).
+
+        InnoDB 의 TABLE_ROWS 는 샘플링 추정치라 실제와 수십 % 까지 차이 날 수
+        있으므로, "약 N 건" 표시처럼 정확도가 필요 없는 곳에만 사용하세요.
+        """
+        if self.session.get_bind().dialect.name != "mysql":
+            return None
+        result = await self.session.execute(
+            _MYSQL_TABLE_ROWS_STMT, {"table": self.model.__tablename__}
+        )
+        rows = result.scalar_one_or_none()
+        return int(rows) if rows is not None else None
+
+    async def get_page(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None,
+        with_total: bool = True,
+        **filters: Any,
+    ) -> tuple[Sequence[ModelType], int | None]:
+        """
+        한 페이지의 레코드(기본키 순)와 필터 조건의 전체 개수를 조회합니다.
+
+        ``get_many()`` + ``count()`` 두 번 왕복하는 대신 ``count(id) OVER ()`` 를
+        각 행에 붙여 WHERE 평가와 인덱스 스캔을 한 번으로 끝냅니다. 창 함수는
+        OFFSET/LIMIT 적용 전 결과 집합 전체를 세므로 어느 행의 값이든 전체 개수와
+        같습니다.
+
+        ``cursor`` (이전 페이지 마지막 행의 id)를 주면 OFFSET 대신
+        ``WHERE id > :cursor`` 로 이어서 읽습니다(키셋 페이지네이션). OFFSET 은 버릴
+        행을 DB 가 모두 읽어야 하지만, 키셋은 기본키 인덱스에서 바로 시작 위치를
+        찾으므로 페이지 깊이와 무관하게 ``limit`` 건만 읽습니다.
+
+        Args:
+            skip: 건너뛸 레코드 수 (깊은 페이지는 cursor 권장)
+            limit: 최대 조회 수
+            cursor: 이전 페이지 마지막 행의 id — 그 다음 행부터 조회
+            with_total: False 면 전체 개수를 세지 않음 (다음 페이지 여부만 필요할 때는
+                ``limit + 1`` 건을 읽어 판단)
+            **filters: 필터 조건 (컬럼명=값)
+
+        Returns:
+            (모델 인스턴스 목록, 전체 개수 — ``with_total=False`` 면 None)
+
+        Note:
+            창 함수는 커서 이후 행만 세므로 cursor 가 있으면 전체 개수는 ``count()``
+            로 따로 셉니다. 마지막 페이지를 넘긴 ``skip`` 이면 돌아온 행이 없어 개수를
+            알 수 없으므로 그때도 ``count()`` 를 한 번 더 실행합니다.
+
+        Example:
+            posts, total = await repo.get_page(limit=20)
+            more, _ = await repo.get_page(limit=20, cursor=posts[-1].id)
+        """
+        stmt = _page_template(
+            self.model,
+            tuple(sorted((name, value is None) for name, value in filters.items())),
+            seek=cursor is not None,
+            counted=with_total and cursor is None,
+        )
+        params: dict[str, Any] = {
+            f"filter_{name}": value for name, value in filters.items() if value is not None
+        }
+        params.update(skip=skip, limit=limit)
+        if cursor is not None:
+            params["cursor"] = cursor
+        if cursor is not None or not with_total:
+            result = await self._read(stmt, params)
+            records = result.scalars().all()
+            return records, await self.count(**filters) if with_total else None
+        result = await self._read(stmt, params)
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        total = await self.count(**filters) if skip else 0
+        return [], total
+
     async def exists(self, id: str) -> bool:
         """
         ID로 레코드 존재 여부를 확인합니다.
@@ -390,9 +741,8 @@ class BaseRepository(CRUDBase[ModelType]):
             if await repo.exists("user-123"):
                 print("User exists")
         """
-        stmt = select(func.count()).select_from(self.model).where(self.model.id == id)
-        result = await self.session.execute(stmt)
-        return result.scalar_one() > 0
+        result = await self._read(self._exists_stmt, {"id": id})
+        return result.scalar() is not None
 
     async def exists_by(self, **filters: Any) -> bool:
         """
@@ -408,9 +758,9 @@ class BaseRepository(CRUDBase[ModelType]):
             if await repo.exists_by(email="john@example.com"):
                 print("Email already exists")
         """
-        stmt = select(func.count()).select_from(self.model).filter_by(**filters)
-        result = await self.session.execute(stmt)
-        return result.scalar_one() > 0
+        stmt = select(literal(1)).select_from(self.model).filter_by(**filters).limit(1)
+        result = await self._read(stmt)
+        return result.scalar() is not None
 
     # ========================================================================
     # READ - Eager Loading (N+1 문제 해결)
@@ -426,6 +776,8 @@ class BaseRepository(CRUDBase[ModelType]):
         ID로 조회하면서 관계 데이터를 함께 로드합니다.
 
         N+1 문제를 방지하여 관계 데이터에 접근할 때 추가 쿼리가 발생하지 않습니다.
+        세션 identity map 에 있는 객체가 요청한 관계까지 로드된 상태면 SQL 없이
+        그대로 반환합니다.
 
         Args:
             id: 조회할 레코드 ID
@@ -443,10 +795,15 @@ class BaseRepository(CRUDBase[ModelType]):
             )
             print(user.posts)  # 추가 쿼리 없음
         """
-        stmt = select(self.model).where(self.model.id == id)
-        stmt = self._apply_eager_loading(stmt, relations, strategy)
+        # 세션에 이미 있고 요청한 관계까지 로드돼 있으면 DB 를 거치지 않는다
+        key = self.model.__mapper__.identity_key_from_primary_key((id,))
+        cached = self.session.identity_map.get(key)
+        if cached is not None and _relations_loaded(cached, relations):
+            return cached
 
-        result = await self.session.execute(stmt)
+        stmt = self._apply_eager_loading(self._select_by_id_stmt, relations, strategy)
+
+        result = await self._read(stmt, {"id": id})
         return result.scalar_one_or_none()
 
     async def get_one_with(
@@ -475,7 +832,7 @@ class BaseRepository(CRUDBase[ModelType]):
         stmt = select(self.model).filter_by(**filters)
         stmt = self._apply_eager_loading(stmt, relations, strategy)
 
-        result = await self.session.execute(stmt)
+        result = await self._read(stmt)
         return result.scalar_one_or_none()
 
     async def get_many_with(
@@ -509,8 +866,8 @@ class BaseRepository(CRUDBase[ModelType]):
         stmt = select(self.model).filter_by(**filters).offset(skip).limit(limit)
         stmt = self._apply_eager_loading(stmt, relations, strategy)
 
-        result = await self.session.execute(stmt)
-        return result.scalars().unique().all()
+        result = await self._read(stmt)
+        return result.scalars().all()
 
     async def get_all_with(
         self,
@@ -541,8 +898,8 @@ class BaseRepository(CRUDBase[ModelType]):
         stmt = select(self.model).offset(skip).limit(limit)
         stmt = self._apply_eager_loading(stmt, relations, strategy)
 
-        result = await self.session.execute(stmt)
-        return result.scalars().unique().all()
+        result = await self._read(stmt)
+        return result.scalars().all()
 
     async def get_by_ids_with(
         self,
@@ -559,7 +916,7 @@ class BaseRepository(CRUDBase[ModelType]):
             strategy: 로딩 전략
 
         Returns:
-            관계가 로드된 모델 인스턴스 목록
+            관계가 로드된 모델 인스턴스 목록 (입력 ID 순서, 없는 ID·중복 ID 는 제외)
 
         Example:
             users = await repo.get_by_ids_with(
@@ -570,11 +927,15 @@ class BaseRepository(CRUDBase[ModelType]):
         if not ids:
             return []
 
-        stmt = select(self.model).where(self.model.id.in_(ids))
+        # 중복 제거 + 입력 순서 유지
+        unique_ids = list(dict.fromkeys(ids))
+        stmt = select(self.model).where(self.model.id.in_(unique_ids))
         stmt = self._apply_eager_loading(stmt, relations, strategy)
 
-        result = await self.session.execute(stmt)
-        return result.scalars().unique().all()
+        result = await self._read(stmt)
+        # IN 결과 순서는 DB 마음대로이므로 정렬 대신 id → 행 dict 로 입력 순서를 복원 (O(N))
+        by_id = {row.id: row for row in result.scalars()}
+        return [by_id[id_] for id_ in unique_ids if id_ in by_id]
 
     # ========================================================================
     # READ - Partial Loading (컬럼 최적화)
@@ -586,11 +947,51 @@ class BaseRepository(CRUDBase[ModelType]):
         skip: int = 0,
         limit: int = 100,
         **filters: Any,
+    ) -> Sequence[Row[Any]]:
+        """
+        필요한 컬럼만 Core Row 로 조회합니다.
+
+        ORM 인스턴스 생성·identity map 등록을 건너뛰므로, 목록 화면처럼
+        일부 컬럼만 읽고 수정하지 않는 경우에 사용합니다.
+
+        Args:
+            columns: 조회할 컬럼 목록
+            skip: 건너뛸 레코드 수
+            limit: 최대 조회 수
+            **filters: 필터 조건
+
+        Returns:
+            Row 목록. 각 Row 의 값은 ``columns`` 순서를 따르며
+            ``row.title`` 처럼 컬럼 이름으로도 접근할 수 있습니다.
+
+        Example:
+            # content 컬럼 제외하고 조회 (목록용)
+            rows = await repo.get_partial(
+                columns=["id", "title", "created_at"],
+                is_published=True
+            )
+        """
+        stmt = (
+            select(*(getattr(self.model, col) for col in columns))
+            .filter_by(**filters)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await self._read(stmt)
+        return result.all()
+
+    async def get_partial_orm(
+        self,
+        columns: list[str],
+        skip: int = 0,
+        limit: int = 100,
+        **filters: Any,
     ) -> Sequence[ModelType]:
         """
-        필요한 컬럼만 선택적으로 조회합니다.
+        필요한 컬럼만 로드한 ORM 인스턴스로 조회합니다.
 
-        대용량 컬럼(TEXT, BLOB 등)을 제외하여 성능을 최적화합니다.
+        대용량 컬럼(TEXT, BLOB 등)을 제외하되, 조회 후 인스턴스를 수정하거나
+        관계에 접근해야 할 때 사용합니다 (읽기 전용이면 ``get_partial``).
 
         Args:
             columns: 로드할 컬럼 목록
@@ -603,7 +1004,7 @@ class BaseRepository(CRUDBase[ModelType]):
 
         Example:
             # content 컬럼 제외하고 조회 (목록용)
-            posts = await repo.get_partial(
+            posts = await repo.get_partial_orm(
                 columns=["id", "title", "created_at"],
                 is_published=True
             )
@@ -611,7 +1012,7 @@ class BaseRepository(CRUDBase[ModelType]):
         stmt = select(self.model).filter_by(**filters).offset(skip).limit(limit)
         stmt = self._apply_column_loading(stmt, only_columns=columns)
 
-        result = await self.session.execute(stmt)
+        result = await self._read(stmt)
         return result.scalars().all()
 
     async def get_by_id_partial(
@@ -635,10 +1036,9 @@ class BaseRepository(CRUDBase[ModelType]):
                 columns=["id", "title", "author_id"]
             )
         """
-        stmt = select(self.model).where(self.model.id == id)
-        stmt = self._apply_column_loading(stmt, only_columns=columns)
+        stmt = self._apply_column_loading(self._select_by_id_stmt, only_columns=columns)
 
-        result = await self.session.execute(stmt)
+        result = await self._read(stmt, {"id": id})
         return result.scalar_one_or_none()
 
     # ========================================================================
@@ -664,25 +1064,35 @@ class BaseRepository(CRUDBase[ModelType]):
         Yields:
             배치 단위 모델 인스턴스 목록
 
+        Note:
+            OFFSET 대신 기본키 keyset(``WHERE id > :last_id ORDER BY id``)으로
+            다음 배치를 찾으므로, 앞선 행을 읽고 버리지 않아 배치마다 비용이
+            ``batch_size`` 에 비례합니다. 배치는 id 순서로 반환됩니다.
+
         Example:
             async for batch in repo.get_in_batches(batch_size=100):
                 for user in batch:
                     await process(user)
         """
-        offset = 0
+        base_stmt = self._apply_eager_loading(
+            select(self.model).filter_by(**filters).order_by(self.model.id).limit(batch_size),
+            relations,
+        )
+        last_id: str | None = None
 
         while True:
-            stmt = select(self.model).filter_by(**filters).offset(offset).limit(batch_size)
-            stmt = self._apply_eager_loading(stmt, relations)
+            stmt = base_stmt if last_id is None else base_stmt.where(self.model.id > last_id)
 
-            result = await self.session.execute(stmt)
-            batch = result.scalars().unique().all()
+            result = await self._read(stmt)
+            batch = result.scalars().all()
 
             if not batch:
                 break
 
             yield batch
-            offset += batch_size
+            if len(batch) < batch_size:
+                break
+            last_id = batch[-1].id
 
     # ========================================================================
     # READ - Join (명시적 조인)
@@ -731,7 +1141,7 @@ class BaseRepository(CRUDBase[ModelType]):
             for relation in relations:
                 stmt = stmt.options(contains_eager(getattr(self.model, relation)))
 
-        result = await self.session.execute(stmt)
+        result = await self._read(stmt)
         return result.scalars().unique().all()
 
     # ========================================================================
@@ -742,7 +1152,7 @@ class BaseRepository(CRUDBase[ModelType]):
         self,
         relation: str,
         **filters: Any,
-    ) -> list[tuple[ModelType, int]]:
+    ) -> Sequence[tuple[ModelType, int]]:
         """
         관계 데이터의 개수와 함께 조회합니다.
 
@@ -768,8 +1178,9 @@ class BaseRepository(CRUDBase[ModelType]):
             .group_by(self.model.id)
         )
 
-        result = await self.session.execute(stmt)
-        return [(row[0], row[1]) for row in result.all()]
+        result = await self._read(stmt)
+        # Row 는 이미 (인스턴스, 개수) 튜플처럼 동작하므로 다시 만들지 않는다
+        return result.tuples().all()
 
     # ========================================================================
     # UPDATE (수정)
@@ -803,13 +1214,57 @@ class BaseRepository(CRUDBase[ModelType]):
 
             return await self.get_by_id(id)
         except IntegrityError as e:
-            logger.error(f"[UPDATE] 무결성 제약 조건 위반: {e}")
+            logger.error("[UPDATE] 무결성 제약 조건 위반: %s", e)
+            raise DuplicateException(
+                message="업데이트할 데이터가 기존 데이터와 충돌합니다.",
+                detail={"model": self.model.__name__, "id": id, "error": str(e.orig)},
+            ) from e
+        except SQLAlchemyError as e:
+            logger.error("[UPDATE] 데이터베이스 오류: %s", e)
+            raise DatabaseException(
+                message="데이터 업데이트 중 오류가 발생했습니다.",
+                detail={"model": self.model.__name__, "id": id, "error": str(e)},
+            ) from e
+
+    async def update_id(self, id: str, data: dict[str, Any]) -> str | None:
+        """
+        ID로 레코드를 업데이트하고 ID 만 돌려받습니다 (행 재조회 없음).
+
+        갱신 여부만 필요할 때 ``update`` 대신 사용합니다. RETURNING 을 지원하는
+        DB 에서는 기본키 컬럼만 반환받고, 지원하지 않는 DB(MySQL)에서는
+        영향받은 행 수로 판단합니다.
+
+        Args:
+            id: 업데이트할 레코드의 ID
+            data: 업데이트할 데이터 딕셔너리
+
+        Returns:
+            업데이트된 레코드의 ID 또는 None (대상 없음)
+
+        Raises:
+            DuplicateException: 중복 데이터로 인한 제약 조건 위반
+            DatabaseException: 데이터베이스 오류가 발생한 경우
+
+        Example:
+            if await repo.update_id("user-123", {"is_active": False}) is None:
+                raise UserNotFound()
+        """
+        try:
+            stmt = update(self.model).where(self.model.id == id).values(**data)
+            if self.session.get_bind().dialect.update_returning:
+                result = await self.session.execute(stmt.returning(self.model.id))
+                return result.scalar_one_or_none()
+
+            cursor = cast("CursorResult[Any]", await self.session.execute(stmt))
+            return id if cursor.rowcount else None
+        except IntegrityError as e:
+            logger.error("[UPDATE] 무결성 제약 조건 위반: %s", e)
             raise DuplicateException(
                 message="업데이트할 데이터가 기존 데이터와 충돌합니다.",
                 detail={"model": self.model.__name__, "id": id, "error": str(e.orig)},
             ) from e
         except SQLAlchemyError as e:
-            logger.error(f"[UPDATE] 데이터베이스 오류: {e}")
+            logger.error("[UPDATE] 데이터베이스 오류: %s", e)
             raise DatabaseException(
                 message="데이터 업데이트 중 오류가 발생했습니다.",
                 detail={"model": self.model.__name__, "id": id, "error": str(e)},
@@ -894,13 +1349,13 @@ class BaseRepository(CRUDBase[ModelType]):
             await self.session.flush()
             return result.rowcount > 0
         except IntegrityError as e:
-            logger.error(f"[DELETE] 무결성 제약 조건 위반 (참조 중인 데이터): {e}")
+            logger.error("[DELETE] 무결성 제약 조건 위반 (참조 중인 데이터): %s", e)
             raise DatabaseException(
                 message="다른 데이터에서 참조 중이어서 삭제할 수 없습니다.",
                 detail={"model": self.model.__name__, "id": id, "error": str(e.orig)},
             ) from e
         except SQLAlchemyError as e:
-            logger.error(f"[DELETE] 데이터베이스 오류: {e}")
+            logger.error("[DELETE] 데이터베이스 오류: %s", e)
             raise DatabaseException(
                 message="데이터 삭제 중 오류가 발생했습니다.",
                 detail={"model": self.model.__name__, "id": id, "error": str(e)},
@@ -994,19 +1449,29 @@ class BaseRepository(CRUDBase[ModelType]):
             (인스턴스, 생성여부) 튜플
             - 생성여부: True면 새로 생성됨, False면 업데이트됨
 
+        Raises:
+            MultipleResultsFound: 필터에 맞는 레코드가 둘 이상인 경우 (아무것도 갱신하지 않음)
+
+        Note:
+            DB 종류와 무관하게 조회(단건 보장) 후 변경분을 flush 한 번으로 저장하며,
+            refresh 로 다시 읽지 않습니다. ``UPDATE ... RETURNING`` 한 번으로 끝내면
+            필터가 유일하지 않을 때 맞는 행을 모두 갱신해 버리므로 쓰지 않습니다.
+
         Example:
             user, created = await repo.update_or_create(
                 defaults={"last_login": datetime.now()},
                 email="john@example.com"
             )
         """
+        values = defaults or {}
         instance = await self.get_one(**filters)
         if instance:
-            for key, value in (defaults or {}).items():
+            for key, value in values.items():
                 setattr(instance, key, value)
-            await self._update(instance)  # CRUDBase 메서드 활용
+            # onupdate 기본값도 Python 측이라 flush 시점에 인스턴스에 채워진다
+            await self.session.flush()
             return instance, False
 
-        data = {**filters, **(defaults or {})}
+        data = {**filters, **values}
         instance = await self.create(data)
         return instance, True
@@ -7,7 +7,7 @@ view 는 HTTP 역할만 한다: 파라미터 수신 → 의존성으로 주입
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi import APIRouter, Depends, Path, Query, Response, status
 
 from app.core.exception import ErrorResponse
 from app.domains.blog.dependencies.blog_dependencies import get_blog_service
@@ -52,15 +52,31 @@ async def create_post(
 async def list_posts(
     skip: int = Query(0, ge=0, description="건너뛸 레코드 수(offset)"),
     limit: int = Query(50, ge=1, le=100, description="조회할 레코드 수(1-100)"),
+    cursor: str | None = Query(
+        None, description="이전 응답의 next_cursor — 주면 OFFSET 없이 그 다음 행부터 조회"
+    ),
+    optimize_for_speed: bool = Query(
+        False, description="true 면 전체 개수(COUNT) 조회를 건너뜀 — total 은 null, has_more 사용"
+    ),
     service: BlogService = Depends(get_blog_service),
-) -> PostListResponse:
-    posts, total = await service.list_posts(skip=skip, limit=limit)
-    return PostListResponse(
+) -> Response:
+    # 한 건 더 읽어 다음 페이지 존재 여부를 COUNT 없이 판단한다
+    posts, total = await service.list_posts(
+        skip=skip, limit=limit + 1, cursor=cursor, with_total=not optimize_for_speed
+    )
+    has_more = len(posts) > limit
+    posts = posts[:limit]
+    # 항목은 model_validate 로 이미 검증했으므로 목록 봉투는 검증 없이 만들고,
+    # FastAPI 의 응답 재검증(덤프 후 response_model 로 재검증)도 직접 직렬화로 건너뛴다
+    body = PostListResponse.model_construct(
         items=[PostResponse.model_validate(p) for p in posts],
         total=total,
         skip=skip,
         limit=limit,
+        has_more=has_more,
+        next_cursor=posts[-1].id if has_more else None,
     )
+    return Response(body.model_dump_json(), media_type="application/json")
 
 
 @router.get(
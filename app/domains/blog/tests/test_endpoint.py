@@ -71,6 +71,42 @@ async def test_list_posts(client):
     assert len(body["items"]) == 2
 
 
+async def test_list_posts_follows_next_cursor(client):
+    for title in ("a", "b", "c"):
+        await client.post("/api/v1/blog/posts", json={"title": title, "content": "x"})
+
+    first = (await client.get("/api/v1/blog/posts", params={"limit": 2})).json()
+    second = (
+        await client.get("/api/v1/blog/posts", params={"limit": 2, "cursor": first["next_cursor"]})
+    ).json()
+
+    assert first["next_cursor"] == first["items"][-1]["id"]
+    assert second["total"] == 3
+    assert len(second["items"]) == 1 and second["next_cursor"] is None
+    seen = {p["id"] for p in first["items"]} | {p["id"] for p in second["items"]}
+    assert len(seen) == 3, "커서로 이어 읽은 페이지는 겹치거나 빠지는 행이 없어야 함"
+
+
+async def test_list_posts_can_skip_total_count(client):
+    for title in ("a", "b", "c"):
+        await client.post("/api/v1/blog/posts", json={"title": title, "content": "x"})
+
+    first = (
+        await client.get("/api/v1/blog/posts", params={"limit": 2, "optimize_for_speed": True})
+    ).json()
+    last = (
+        await client.get(
+            "/api/v1/blog/posts",
+            params={"limit": 2, "cursor": first["next_cursor"], "optimize_for_speed": True},
+        )
+    ).json()
+
+    assert first["total"] is None and first["has_more"] is True
+    assert len(first["items"]) == 2
+    assert len(last["items"]) == 1
+    assert last["has_more"] is False and last["next_cursor"] is None
+
+
 async def test_update_post(client):
     created = await client.post("/api/v1/blog/posts", json={"title": "old", "content": "c"})
     post_id = created.json()["id"]
@@ -1,25 +1,28 @@
 """
 Home-domain implementation of the AccessLogSink Protocol.
 
-Persists access-log entries using the background session context
-(background_session) so the write runs on the background connection pool and
-does not interfere with the main API pool. (UnitOfWork was removed; the
-transaction boundary is the background_session context manager.)
+Persists access-log entries on the background connection pool so the write
+does not interfere with the main API pool. The sink only writes, so each call
+runs in ``BackgroundSessionLocal.begin()``: the sessionmaker opens the
+transaction, commits on success and rolls back on error, with no extra
+context-manager layer or explicit commit.
 """
 
-from app.core.db.session import background_session
+from app.core.db.session import BackgroundSessionLocal
 from app.core.middlewares.access_log_sink import AccessLogSink, set_access_log_sink
 from app.domains.home.services.user_access_log_service import UserAccessLogService
 
 
 class HomeAccessLogSink(AccessLogSink):
-    """Saves access-log entries via the background session context."""
+    """Saves access-log entries in a background-pool write transaction."""
 
     async def save(self, data: dict) -> None:
-        async with background_session() as session:
-            service = UserAccessLogService(session)
-            await service.create_access_log(data)
-            await session.commit()
+        async with BackgroundSessionLocal.begin() as session:
+            await UserAccessLogService(session).create_access_log(data)
+
+    async def save_many(self, rows: list[dict]) -> None:
+        async with BackgroundSessionLocal.begin() as session:
+            await UserAccessLogService(session).create_access_logs(rows)
 
 
 def register_sink() -> None:
@@ -1,7 +1,7 @@
 """
 Home 모듈 SQLAdmin 설정
 
-SQLAdmin을 사용한 UserAccessLog 모델의 관리자 인터페이스를 정의합니다.
+SQLAdmin을 사용한 UserAccessLog · UserAccessLogStat 모델의 관리자 인터페이스를 정의합니다.
 
 사용 방법:
     main.py에서 Admin 인스턴스를 생성하고 ModelView를 등록합니다.
@@ -9,7 +9,7 @@ SQLAdmin을 사용한 UserAccessLog 모델의 관리자 인터페이스를 정
     from sqladmin import Admin
     from app.domains.home.admin import UserAccessLogAdmin
 
-    admin = Admin(app, engine)
+    admin = Admin(app, background_engine)  # 백그라운드 풀 공유
     admin.add_view(UserAccessLogAdmin)
 
 Note:
@@ -21,8 +21,14 @@ Note:
 from typing import Any
 
 from sqladmin import ModelView
+from sqlalchemy import Select, func, select
+from starlette.requests import Request
 
-from app.domains.home.models.models import UserAccessLog
+from app.domains.home.models.models import UserAccessLog, UserAccessLogStat
+
+# 목록 화면 총 개수 상한. 접속 로그는 계속 쌓이므로 COUNT(*) 를 테이블 전체에
+# 돌리지 않고 이 건수까지만 센다 (넘으면 페이지 수가 상한 기준으로 표시된다).
+ADMIN_COUNT_CAP = 10_000
 
 
 def _format_is_bot(model: Any, _attr: Any) -> str:
@@ -196,6 +202,69 @@ class UserAccessLogAdmin(ModelView, model=UserAccessLog):
         UserAccessLog.response_time_ms: _format_response_time,
     }
 
+    # =========================================================================
+    # 쿼리 설정
+    # =========================================================================
+    async def count(self, request: Request, stmt: Select | None = None) -> int:
+        """
+        목록 총 개수를 ``ADMIN_COUNT_CAP`` 건까지만 셉니다.
+
+        SQLAdmin 은 필터·검색·정렬이 적용된 목록 쿼리를 서브쿼리로 감싸 개수를
+        셉니다. 정렬은 개수에 영향이 없으므로 빼고, id 만 ``ADMIN_COUNT_CAP`` 건까지
+        읽도록 바꿔 로그 테이블이 커져도 개수 조회 비용이 일정하게 유지되게 합니다.
+        SQLAdmin 이 쿼리 형태를 바꿔 서브쿼리 하나로 감싸지 않았다면 받은 그대로 셉니다.
+
+        Note:
+            상한을 넘으면 총 개수·페이지 수가 ``ADMIN_COUNT_CAP`` 으로 표시되고
+            (화면에 별도 표시는 없음) 그 뒤 페이지는 필터·검색으로 좁혀 봐야 합니다.
+        """
+        froms = stmt.get_final_froms() if stmt is not None else []
+        if len(froms) != 1 or not isinstance(getattr(froms[0], "element", None), Select):
+            return await super().count(request, stmt)
+        bounded = (
+            froms[0]
+            .element.with_only_columns(UserAccessLog.id, maintain_column_froms=True)
+            .order_by(None)
+            .limit(ADMIN_COUNT_CAP)
+        )
+        return await super().count(request, select(func.count()).select_from(bounded.subquery()))
+
+
+class UserAccessLogStatAdmin(ModelView, model=UserAccessLogStat):
+    """
+    UserAccessLogStat 관리자 뷰
+
+    주기 태스크가 채우는 통계 집계 테이블을 조회만 하는 관리자 인터페이스입니다.
+    (집계는 재계산 시 통째로 교체되므로 화면에서 생성 · 수정 · 삭제하지 않습니다.)
+    """
+
+    name = "접속 통계 집계"
+    name_plural = "접속 통계 집계"
+    icon = "fa-solid fa-chart-pie"
+
+    column_list = [
+        UserAccessLogStat.dimension,
+        UserAccessLogStat.value,
+        UserAccessLogStat.count,
+        UserAccessLogStat.refreshed_at,
+    ]
+    column_default_sort = [(UserAccessLogStat.dimension, False), (UserAccessLogStat.count, True)]
+    column_filters = [UserAccessLogStat.dimension]
+
+    can_create = False
+    can_edit = False
+    can_delete = False
+    can_view_details = True
+    can_export = True
+    export_types = ["csv", "json"]
+
+    column_labels = {
+        UserAccessLogStat.dimension: "집계 차원",
+        UserAccessLogStat.value: "값",
+        UserAccessLogStat.count: "접속 수",
+        UserAccessLogStat.refreshed_at: "집계 시각",
+    }
+
 
 # 컨벤션: 패키지 __init__.py 가 이 리스트를 재노출하면 main.py 가 SQLAdmin 에 등록한다.
-admin_views: list[type] = [UserAccessLogAdmin]
+admin_views: list[type] = [UserAccessLogAdmin, UserAccessLogStatAdmin]
@@ -5,18 +5,29 @@ view 는 HTTP 역할만 한다: 파라미터 수신 → 의존성으로 주입
 비즈니스 로직과 트랜잭션 경계는 services / dependencies 가 담당한다(UnitOfWork 제거).
 """
 
-from typing import Any
+import hashlib
+from collections.abc import AsyncIterator, Sequence
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Header, Path, Query, Response
+from fastapi.responses import StreamingResponse
 
 from app.core.exception import ErrorResponse
-from app.domains.home.dependencies.access_log_dependencies import get_access_log_service
+from app.domains.home.dependencies.access_log_dependencies import (
+    AccessLogServiceOpener,
+    get_access_log_service,
+    get_access_log_service_opener,
+)
 from app.domains.home.schemas.user_access_log_schema import (
     AccessLogStats,
     UserAccessLogListResponse,
     UserAccessLogResponse,
 )
-from app.domains.home.services.user_access_log_service import UserAccessLogService
+from app.domains.home.services.user_access_log_service import (
+    AccessLogRow,
+    UserAccessLogService,
+)
+from app.utils.pagination import encode_cursor
 
 router = APIRouter()
 
@@ -24,43 +35,115 @@ _ERR: dict[int | str, dict[str, Any]] = {
     500: {"model": ErrorResponse, "description": "서버 내부 오류"}
 }
 
+# 엔드포인트마다 반복되는 페이지 파라미터 — 선언을 한 번만 만들어 공유한다.
+_Skip = Annotated[int, Query(ge=0, description="건너뛸 레코드 수(offset)")]
+_Limit = Annotated[int, Query(ge=1, le=100, description="조회할 레코드 수(1-100)")]
+_ExportLimit = Annotated[int, Query(ge=1, le=10_000, description="내보낼 레코드 수(1-10000)")]
+
+# FastAPI 는 핸들러가 반환한 Pydantic 모델을 dict 로 덤프한 뒤 response_model 로
+# 다시 검증한다. 목록 라우트는 조회한 행을 그대로 반환해 그 검증(from_attributes)
+# 한 번으로 끝내고, 이미 응답 모델을 만든 곳은 Response 로 직접 직렬화해
+# 재검증을 건너뛴다. response_model 은 OpenAPI 문서용으로 그대로 둔다.
+
 
 @router.get(
     "/access-logs",
     response_model=UserAccessLogListResponse,
     responses=_ERR,
     summary="접속 로그 목록 조회",
-    description="접속 로그 목록을 페이지네이션하여 조회합니다.",
+    description=(
+        "접속 로그 목록을 최신순으로 페이지네이션하여 조회합니다. "
+        "ip_address · user_id 를 주면 해당 조건으로 좁혀 조회합니다."
+    ),
     operation_id="getAccessLogs",
 )
 async def get_access_logs(
-    skip: int = Query(0, ge=0, description="건너뛸 레코드 수(offset)"),
-    limit: int = Query(50, ge=1, le=100, description="조회할 레코드 수(1-100)"),
+    skip: _Skip = 0,
+    limit: _Limit = 50,
+    ip_address: str | None = Query(None, description="IP 주소 필터", example="192.168.1.1"),
+    user_id: str | None = Query(None, description="사용자 ID(UUID) 필터"),
+    cursor: str | None = Query(
+        None, description="이전 응답의 next_cursor — 주면 OFFSET 없이 그 다음 행부터 조회"
+    ),
+    optimize_for_speed: bool = Query(
+        False, description="true 면 전체 개수(COUNT) 조회를 건너뜀 — total 은 null, has_more 사용"
+    ),
     service: UserAccessLogService = Depends(get_access_log_service),
-) -> UserAccessLogListResponse:
-    logs, total = await service.get_access_logs(skip=skip, limit=limit)
-    return UserAccessLogListResponse(
-        items=[UserAccessLogResponse.model_validate(log) for log in logs],
+) -> Response:
+    # 한 건 더 읽어 다음 페이지 존재 여부를 COUNT 없이 판단한다
+    logs, total = await service.stream_access_logs(
+        skip=skip,
+        limit=limit + 1,
+        ip_address=ip_address,
+        user_id=user_id,
+        cursor=cursor,
+        with_total=not optimize_for_speed,
+    )
+    # 조회 행 목록과 응답 목록을 동시에 쥐지 않도록 행을 받는 대로 변환한다
+    items = [UserAccessLogResponse.model_validate(log, from_attributes=True) async for log in logs]
+    has_more = len(items) > limit
+    del items[limit:]
+    next_cursor = encode_cursor(items[-1].created_at, items[-1].id) if has_more else None
+    body = UserAccessLogListResponse(
+        items=items,
         total=total,
         skip=skip,
         limit=limit,
+        has_more=has_more,
+        next_cursor=next_cursor,
     )
+    return Response(body.model_dump_json(), media_type="application/json")
 
 
+@router.get(
+    "/access-logs/export",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "한 줄에 로그 1건"},
+        **_ERR,
+    },
+    summary="접속 로그 NDJSON 내보내기",
+    description=(
+        "접속 로그를 최신순으로 한 줄에 하나씩(NDJSON) 스트리밍합니다. "
+        "DB 커서에서 읽는 대로 전송하므로 대량 조회에도 메모리는 한 행분만 씁니다."
+    ),
+    operation_id="exportAccessLogs",
+)
+async def export_access_logs(
+    limit: _ExportLimit = 1000,
+    ip_address: str | None = Query(None, description="IP 주소 필터", example="192.168.1.1"),
+    user_id: str | None = Query(None, description="사용자 ID(UUID) 필터"),
+    open_service: AccessLogServiceOpener = Depends(get_access_log_service_opener),
+) -> StreamingResponse:
+    async def lines() -> AsyncIterator[bytes]:
+        async with open_service() as service:
+            logs, _ = await service.stream_access_logs(
+                limit=limit, ip_address=ip_address, user_id=user_id, with_total=False
+            )
+            async for log in logs:
+                item = UserAccessLogResponse.model_validate(log, from_attributes=True)
+                yield item.model_dump_json().encode() + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+# 아래 recent · by-ip · by-user 라우트는 기존 클라이언트 호환용으로만 남겨 둔다.
+# 조회 조건은 모두 GET /access-logs 의 쿼리 필터로 표현되며, 같은 리포지토리
+# 쿼리(list_logs)를 공유한다.
 @router.get(
     "/access-logs/recent",
     response_model=list[UserAccessLogResponse],
     responses=_ERR,
     summary="최근 접속 로그 조회",
-    description="최근 접속 로그를 시간 역순으로 조회합니다.",
+    description="최근 접속 로그를 시간 역순으로 조회합니다. `GET /access-logs?limit=` 와 같습니다.",
+    deprecated=True,
     operation_id="getRecentAccessLogs",
 )
 async def get_recent_access_logs(
-    limit: int = Query(50, ge=1, le=100, description="조회할 레코드 수(1-100)"),
+    limit: _Limit = 50,
     service: UserAccessLogService = Depends(get_access_log_service),
-) -> list[UserAccessLogResponse]:
-    logs = await service.get_recent_logs(limit=limit)
-    return [UserAccessLogResponse.model_validate(log) for log in logs]
+) -> Sequence[AccessLogRow]:
+    return await service.get_recent_logs(limit=limit)
 
 
 @router.get(
@@ -68,17 +151,17 @@ async def get_recent_access_logs(
     response_model=list[UserAccessLogResponse],
     responses=_ERR,
     summary="IP별 접속 로그 조회",
-    description="특정 IP 주소의 접속 로그를 조회합니다.",
+    description="특정 IP 주소의 접속 로그를 조회합니다. `GET /access-logs?ip_address=` 를 사용하세요.",
+    deprecated=True,
     operation_id="getAccessLogsByIp",
 )
 async def get_access_logs_by_ip(
     ip_address: str = Path(..., description="조회할 IP 주소", example="192.168.1.1"),
-    skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
-    limit: int = Query(50, ge=1, le=100, description="조회할 레코드 수(1-100)"),
+    skip: _Skip = 0,
+    limit: _Limit = 50,
     service: UserAccessLogService = Depends(get_access_log_service),
-) -> list[UserAccessLogResponse]:
-    logs = await service.get_logs_by_ip(ip_address=ip_address, skip=skip, limit=limit)
-    return [UserAccessLogResponse.model_validate(log) for log in logs]
+) -> Sequence[AccessLogRow]:
+    return await service.get_logs_by_ip(ip_address=ip_address, skip=skip, limit=limit)
 
 
 @router.get(
@@ -86,17 +169,17 @@ async def get_access_logs_by_ip(
     response_model=list[UserAccessLogResponse],
     responses=_ERR,
     summary="사용자별 접속 로그 조회",
-    description="특정 사용자의 접속 로그를 조회합니다.",
+    description="특정 사용자의 접속 로그를 조회합니다. `GET /access-logs?user_id=` 를 사용하세요.",
+    deprecated=True,
     operation_id="getAccessLogsByUser",
 )
 async def get_access_logs_by_user(
     user_id: str = Path(..., description="조회할 사용자 ID(UUID)"),
-    skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
-    limit: int = Query(50, ge=1, le=100, description="조회할 레코드 수(1-100)"),
+    skip: _Skip = 0,
+    limit: _Limit = 50,
     service: UserAccessLogService = Depends(get_access_log_service),
-) -> list[UserAccessLogResponse]:
-    logs = await service.get_logs_by_user(user_id=user_id, skip=skip, limit=limit)
-    return [UserAccessLogResponse.model_validate(log) for log in logs]
+) -> Sequence[AccessLogRow]:
+    return await service.get_logs_by_user(user_id=user_id, skip=skip, limit=limit)
 
 
 @router.get(
@@ -104,10 +187,20 @@ async def get_access_logs_by_user(
     response_model=AccessLogStats,
     responses=_ERR,
     summary="접속 로그 통계",
-    description="장치 유형/OS/브라우저별 접속 로그 통계를 조회합니다.",
+    description=(
+        "장치 유형/OS/브라우저별 접속 로그 통계를 조회합니다. "
+        "주기 집계 테이블 기준이므로 최대 ACCESS_LOG_STATS_REFRESH_SECONDS 만큼 늦게 반영되고, "
+        "응답은 ACCESS_LOG_STATS_CACHE_SECONDS 동안 캐시됩니다. "
+        "ETag 를 If-None-Match 로 보내면 변경이 없을 때 304 를 돌려줍니다."
+    ),
     operation_id="getAccessLogStats",
 )
 async def get_access_log_stats(
+    if_none_match: str | None = Header(None, description="이전 응답의 ETag"),
     service: UserAccessLogService = Depends(get_access_log_service),
-) -> AccessLogStats:
-    return await service.get_stats()
+) -> Response:
+    body = (await service.get_cached_stats()).model_dump_json().encode()
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
@@ -1,23 +1,41 @@
 """Home 접속 로그 기능 의존성 (인터페이스 집합체).
 
 services 의 기능 클래스를 session 으로 생성·초기화·결합하여 view 에 제공한다.
-yield 후 성공 시 커밋 — 제거된 UnitOfWork 의 트랜잭션 경계를 대체한다.
-예외 시에는 get_session 의 teardown 이 롤백을 수행한다.
+Home 엔드포인트는 모두 조회라 읽기 전용 세션(get_read_session)을 쓴다 — 라우터가
+켜져 있으면 replica 로 나가고, 쓰기를 시도하면 즉시 실패한다. 커밋할 것이 없으므로
+yield 후 커밋 단계도 두지 않는다(접속 로그 저장은 access_log_sink 가 담당).
+
+FastAPI 는 yield 의존성을 응답 본문을 보내기 전에 정리하므로, 본문을 스트리밍하는
+view 는 서비스 대신 서비스를 여는 함수(opener)를 받아 스트리밍 동안 직접 세션을 연다.
 """
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.db.session import get_session
+from app.core.db.session import get_read_session
 from app.domains.home.services.user_access_log_service import UserAccessLogService
 
 
 async def get_access_log_service(
-    session: AsyncSession = Depends(get_session),
-) -> AsyncGenerator[UserAccessLogService, None]:
-    """UserAccessLogService 를 구성해 view 에 제공하고, 요청 성공 시 커밋한다."""
-    service = UserAccessLogService(session)
-    yield service
-    await session.commit()
+    session: AsyncSession = Depends(get_read_session),
+) -> UserAccessLogService:
+    """읽기 전용 세션으로 UserAccessLogService 를 구성해 view 에 제공한다."""
+    return UserAccessLogService(session)
+
+
+AccessLogServiceOpener = Callable[[], AbstractAsyncContextManager[UserAccessLogService]]
+
+
+@asynccontextmanager
+async def open_access_log_service() -> AsyncIterator[UserAccessLogService]:
+    """읽기 전용 세션으로 UserAccessLogService 를 열고, 블록을 벗어나면 세션을 닫는다."""
+    async with asynccontextmanager(get_read_session)() as session:
+        yield UserAccessLogService(session)
+
+
+def get_access_log_service_opener() -> AccessLogServiceOpener:
+    """스트리밍 view 용 — 응답 본문을 보내는 동안 쓸 서비스를 여는 함수를 제공한다."""
+    return open_access_log_service
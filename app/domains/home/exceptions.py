@@ -27,6 +27,7 @@ class HomeErrorCode(StrEnum):
 
     INVALID_DATE_RANGE = "HOME_INVALID_DATE_RANGE"
     ACCESS_LOG_NOT_FOUND = "HOME_ACCESS_LOG_NOT_FOUND"
+    INVALID_CURSOR = "HOME_INVALID_CURSOR"
 
 
 class InvalidDateRangeException(BadRequestException):
@@ -36,6 +37,13 @@ class InvalidDateRangeException(BadRequestException):
     message = "시작 날짜는 종료 날짜보다 이전이어야 합니다."
 
 
+class InvalidCursorException(BadRequestException):
+    """페이지네이션 커서를 해석할 수 없는 경우"""
+
+    error_code = HomeErrorCode.INVALID_CURSOR
+    message = "페이지네이션 커서가 올바르지 않습니다."
+
+
 class AccessLogNotFoundException(NotFoundException):
     """접속 로그를 찾을 수 없는 경우"""
 
@@ -2,6 +2,6 @@
 Home 모듈 모델
 """
 
-from app.domains.home.models.models import UserAccessLog
+from app.domains.home.models.models import UserAccessLog, UserAccessLogStat
 
-__all__ = ["UserAccessLog"]
+__all__ = ["UserAccessLog", "UserAccessLogStat"]
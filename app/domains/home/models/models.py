@@ -1,18 +1,23 @@
 """
 Home 모듈 데이터베이스 모델
 
-접속자 정보를 저장하는 UserAccessLog 모델을 정의합니다.
+접속자 정보를 저장하는 UserAccessLog 모델과, 통계 조회용 집계(rollup) 테이블
+UserAccessLogStat 모델을 정의합니다.
 """
 
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text
+from sqlalchemy import Boolean, DateTime, Enum, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.db.session import Base
+from app.core.models.models_base import new_uuid7_hex
 from config import timezone_settings
 
+# 접속 로그 미들웨어(parse_user_agent)가 기록하는 장치 유형 값 전체.
+# MySQL 에서는 네이티브 ENUM(행당 1바이트)으로 저장되고, Python 쪽 값은 그대로 문자열이다.
+DEVICE_TYPES = ("desktop", "mobile", "tablet", "other")
+
 
 class UserAccessLog(Base):
     """
@@ -28,7 +33,7 @@ class UserAccessLog(Base):
         os_version: 운영체제 버전
         browser_name: 브라우저 이름 (Chrome, Firefox, Safari 등)
         browser_version: 브라우저 버전
-        device_type: 장치 유형 (desktop, mobile, tablet)
+        device_type: 장치 유형 (desktop, mobile, tablet, other)
         device_brand: 장치 브랜드 (Apple, Samsung 등)
         device_model: 장치 모델명
         is_bot: 봇/크롤러 여부
@@ -44,28 +49,38 @@ class UserAccessLog(Base):
         session_id: 세션 ID
         user_id: 로그인한 사용자 ID
         accept_language: Accept-Language 헤더
+        correlation_id: 요청 상관관계 ID (traceparent trace-id / X-Request-ID)
         created_at: 접속 시간
     """
 
     __tablename__ = "user_access_logs"
 
+    # 추가 전용 로그 테이블: id · created_at 은 Python 측 default 로 채우므로 INSERT 후
+    # 서버 생성값을 다시 읽을(RETURNING/SELECT) 필요가 없고, 행 단위 ORM 삭제를 하지
+    # 않으므로 삭제 건수 확인(confirm_deleted_rows)도 끈다.
+    __mapper_args__ = {"eager_defaults": False, "confirm_deleted_rows": False}
+
     # 테이블 인덱스 정의
     __table_args__ = (
         Index("ix_user_access_logs_created_at", "created_at"),
-        Index("ix_user_access_logs_ip_address", "ip_address"),
+        # IP별 조회도 사용자별과 같은 형태(필터 + 최신순)라 정렬 컬럼까지 묶는다
+        Index("ix_user_access_logs_ip_created_at", "ip_address", "created_at"),
+        # 통계 집계(GROUP BY 차원)가 테이블 대신 훑는 인덱스 — 대체할 복합 인덱스가 없다
         Index("ix_user_access_logs_os_name", "os_name"),
         Index("ix_user_access_logs_browser_name", "browser_name"),
         Index("ix_user_access_logs_device_type", "device_type"),
         Index("ix_user_access_logs_country", "country"),
-        Index("ix_user_access_logs_session_id", "session_id"),
-        Index("ix_user_access_logs_user_id", "user_id"),
+        # 사용자별 조회(WHERE user_id = ? ORDER BY created_at DESC LIMIT ?)를 정렬 없이
+        # 인덱스 역방향 스캔으로 끝내도록 정렬 컬럼까지 묶는다 (user_id 단독 조회도 커버)
+        Index("ix_user_access_logs_user_id_created_at", "user_id", "created_at"),
+        Index("ix_user_access_logs_correlation_id", "correlation_id"),
     )
 
-    # 기본키
+    # 기본키 (삽입이 많은 테이블이므로 시간순 UUIDv7 을 하이픈 없는 32자 hex 로 생성)
     id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=new_uuid7_hex,
     )
 
     # 네트워크 정보
@@ -108,9 +123,9 @@ class UserAccessLog(Base):
 
     # 장치 정보
     device_type: Mapped[str | None] = mapped_column(
-        String(20),
+        Enum(*DEVICE_TYPES, name="device_type"),
         nullable=True,
-        comment="desktop, mobile, tablet",
+        comment="desktop, mobile, tablet, other",
     )
     device_brand: Mapped[str | None] = mapped_column(
         String(50),
@@ -185,6 +200,13 @@ class UserAccessLog(Base):
         nullable=True,
     )
 
+    # 요청 추적 정보
+    correlation_id: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        comment="요청 상관관계 ID (traceparent trace-id / X-Request-ID)",
+    )
+
     # 타임스탬프
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -197,3 +219,34 @@ class UserAccessLog(Base):
             f"<UserAccessLog(id={self.id}, ip={self.ip_address}, "
             f"path={self.request_path}, created_at={self.created_at})>"
         )
+
+
+class UserAccessLogStat(Base):
+    """
+    접속 로그 통계 집계(rollup) 모델
+
+    ``/access-logs/stats`` 가 요청마다 원본 로그 테이블 전체를 GROUP BY 하지 않도록,
+    주기 태스크(home.aggregate_access_stats)가 차원별 건수를 미리 집계해 둔다.
+    조회 비용은 원본 행 수가 아니라 그룹 수에 비례한다.
+
+    Attributes:
+        dimension: 집계 차원 (device_type, os_name, browser_name)
+        value: 차원 값 (값이 없는 로그는 "unknown")
+        count: 접속 수
+        refreshed_at: 집계 시각
+    """
+
+    __tablename__ = "user_access_log_stats"
+
+    dimension: Mapped[str] = mapped_column(String(20), primary_key=True, comment="집계 차원")
+    value: Mapped[str] = mapped_column(String(50), primary_key=True, comment="차원 값")
+    count: Mapped[int] = mapped_column(Integer, nullable=False, comment="접속 수")
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: timezone_settings.now(),
+        nullable=False,
+        comment="집계 시각",
+    )
+
+    def __repr__(self) -> str:
+        return f"<UserAccessLogStat({self.dimension}={self.value}, count={self.count})>"
@@ -4,18 +4,100 @@ UserAccessLog Repository
 접속 로그 데이터 접근 로직을 캡슐화합니다.
 """
 
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
-
-from sqlalchemy import and_, func, select
+from functools import cache
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    Select,
+    String,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    tuple_,
+    union_all,
+)
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.repositories.repository_base import BaseRepository
-from app.domains.home.models.models import UserAccessLog
+from app.domains.home.models.models import UserAccessLog, UserAccessLogStat
 from app.utils.logs import get_logger
+from config import timezone_settings
 
 logger = get_logger("user_access_log_repository")
 
+# 키셋 페이지네이션 커서: 이전 페이지 마지막 행의 (created_at, id)
+Cursor = tuple[datetime, str]
+
+# 목록 조회가 읽는 컬럼 — 응답 스키마(UserAccessLogResponse) 필드와 같다.
+# user_agent · referer · query_string(TEXT) 등 응답에 없는 컬럼은 읽지 않는다.
+# 목록은 조회 후 응답 변환만 하므로 ORM 인스턴스(identity map 등록 · 속성 계측)
+# 대신 이 컬럼들의 Row 로 읽는다. Row 도 속성 접근(row.created_at)을 지원한다.
+LIST_COLUMNS = (
+    "id",
+    "ip_address",
+    "os_name",
+    "os_version",
+    "browser_name",
+    "browser_version",
+    "device_type",
+    "device_brand",
+    "is_bot",
+    "country",
+    "city",
+    "request_path",
+    "request_method",
+    "response_status",
+    "response_time_ms",
+    "user_id",
+    "correlation_id",
+    "created_at",
+)
+
+# 목록 조회 결과 행 (LIST_COLUMNS 컬럼, 읽기 전용)
+AccessLogRow = Row[Any]
+
+
+@cache
+def _list_template(by_ip: bool, by_user: bool, by_date: bool, seek: bool) -> Select:
+    """목록 조회 구문 템플릿을 조건 조합마다 한 번만 만듭니다.
+
+    값은 모두 bindparam 으로 넘기므로 요청마다 select() 표현식 트리를 다시 조립하지
+    않고, 같은 구문 객체를 재사용해 컴파일 캐시 키 계산도 가볍게 끝난다.
+    """
+    model = UserAccessLog
+    stmt = select(*(getattr(model, name) for name in LIST_COLUMNS))
+    if by_ip:
+        stmt = stmt.where(model.ip_address == bindparam("ip_address"))
+    if by_user:
+        stmt = stmt.where(model.user_id == bindparam("user_id"))
+    if by_date:
+        stmt = stmt.where(
+            model.created_at >= bindparam("start_date"),
+            model.created_at <= bindparam("end_date"),
+        )
+    if seek:
+        stmt = stmt.where(
+            tuple_(model.created_at, model.id)
+            < tuple_(
+                bindparam("cursor_created_at", type_=model.created_at.type),
+                bindparam("cursor_id", type_=model.id.type),
+            )
+        )
+    return (
+        stmt.order_by(model.created_at.desc(), model.id.desc())
+        .offset(bindparam("skip"))
+        .limit(bindparam("limit"))
+    )
+
 
 class UserAccessLogRepository(BaseRepository[UserAccessLog]):
     """
@@ -35,12 +117,105 @@ class UserAccessLogRepository(BaseRepository[UserAccessLog]):
         """
         super().__init__(session)
 
+    def _list_query(
+        self,
+        skip: int,
+        limit: int,
+        ip_address: str | None = None,
+        user_id: str | None = None,
+        date_range: tuple[datetime, datetime] | None = None,
+        cursor: Cursor | None = None,
+    ) -> tuple[Select, dict[str, Any]]:
+        """주어진 조건에 맞는 목록 구문 템플릿과 바인드 값을 고릅니다.
+
+        정렬 키는 ``(created_at, id)`` 이며, 커서가 있으면 그 키보다 앞선(더 오래된)
+        행부터 읽는다. (ip_address|user_id, created_at) 인덱스는 InnoDB 에서 PK 를
+        꼬리에 달고 있으므로 필터 · 커서 · 정렬이 모두 인덱스 범위 스캔으로 끝난다.
+        """
+        params: dict[str, Any] = {"skip": skip, "limit": limit}
+        if ip_address is not None:
+            params["ip_address"] = ip_address
+        if user_id is not None:
+            params["user_id"] = user_id
+        if date_range is not None:
+            params["start_date"], params["end_date"] = date_range
+        if cursor is not None:
+            params["cursor_created_at"], params["cursor_id"] = cursor
+        stmt = _list_template(
+            by_ip=ip_address is not None,
+            by_user=user_id is not None,
+            by_date=date_range is not None,
+            seek=cursor is not None,
+        )
+        return stmt, params
+
+    async def list_logs(
+        self,
+        ip_address: str | None = None,
+        user_id: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Cursor | None = None,
+    ) -> Sequence[AccessLogRow]:
+        """
+        조건(IP · 사용자)에 맞는 접속 로그를 최신순으로 조회합니다.
+
+        IP별 · 사용자별 · 최근 로그 조회가 모두 이 쿼리 하나를 공유합니다.
+
+        Args:
+            ip_address: 조회할 IP 주소 (None 이면 조건 없음)
+            user_id: 조회할 사용자 ID (None 이면 조건 없음)
+            skip: 건너뛸 레코드 수 (깊은 페이지는 cursor 권장)
+            limit: 최대 조회 수
+            cursor: 이전 페이지 마지막 행의 (created_at, id) — 그 다음 행부터 조회
+
+        Returns:
+            접속 로그 행 리스트
+        """
+        stmt, params = self._list_query(skip, limit, ip_address, user_id, cursor=cursor)
+        result = await self._read(stmt, params)
+        logs = result.all()
+
+        logger.debug("[list_logs] 조회 완료: count=%d", len(logs))
+        return logs
+
+    async def stream_logs(
+        self,
+        ip_address: str | None = None,
+        user_id: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Cursor | None = None,
+        yield_per: int = 50,
+    ) -> AsyncIterator[AccessLogRow]:
+        """
+        ``list_logs()`` 와 같은 조건 · 정렬의 접속 로그를 스트리밍으로 조회합니다.
+
+        Args:
+            ip_address: 조회할 IP 주소 (None 이면 조건 없음)
+            user_id: 조회할 사용자 ID (None 이면 조건 없음)
+            skip: 건너뛸 레코드 수 (깊은 페이지는 cursor 권장)
+            limit: 최대 조회 수
+            cursor: 이전 페이지 마지막 행의 (created_at, id) — 그 다음 행부터 조회
+            yield_per: 한 번에 가져올 행 수
+
+        Yields:
+            접속 로그 행
+        """
+        stmt, params = self._list_query(skip, limit, ip_address, user_id, cursor=cursor)
+        with self.session.no_autoflush:
+            result = await self.session.stream(
+                stmt, params, execution_options={"yield_per": yield_per}
+            )
+        async for log in result:
+            yield log
+
     async def get_by_ip(
         self,
         ip_address: str,
         skip: int = 0,
         limit: int = 100,
-    ) -> Sequence[UserAccessLog]:
+    ) -> Sequence[AccessLogRow]:
         """
         IP 주소로 접속 로그를 조회합니다.
 
@@ -50,29 +225,17 @@ class UserAccessLogRepository(BaseRepository[UserAccessLog]):
             limit: 최대 조회 수
 
         Returns:
-            UserAccessLog 리스트
+            접속 로그 행 리스트
         """
-        logger.debug(f"[get_by_ip] 조회 시작: ip={ip_address}")
-
-        stmt = (
-            select(self.model)
-            .where(self.model.ip_address == ip_address)
-            .order_by(self.model.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.session.execute(stmt)
-        logs = result.scalars().all()
-
-        logger.debug(f"[get_by_ip] 조회 완료: count={len(logs)}")
-        return logs
+        logger.debug("[get_by_ip] 조회 시작: ip=%s", ip_address)
+        return await self.list_logs(ip_address=ip_address, skip=skip, limit=limit)
 
     async def get_by_user_id(
         self,
         user_id: str,
         skip: int = 0,
         limit: int = 100,
-    ) -> Sequence[UserAccessLog]:
+    ) -> Sequence[AccessLogRow]:
         """
         사용자 ID로 접속 로그를 조회합니다.
 
@@ -82,22 +245,10 @@ class UserAccessLogRepository(BaseRepository[UserAccessLog]):
             limit: 최대 조회 수
 
         Returns:
-            UserAccessLog 리스트
+            접속 로그 행 리스트
         """
-        logger.debug(f"[get_by_user_id] 조회 시작: user_id={user_id}")
-
-        stmt = (
-            select(self.model)
-            .where(self.model.user_id == user_id)
-            .order_by(self.model.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-        )
-        result = await self.session.execute(stmt)
-        logs = result.scalars().all()
-
-        logger.debug(f"[get_by_user_id] 조회 완료: count={len(logs)}")
-        return logs
+        logger.debug("[get_by_user_id] 조회 시작: user_id=%s", user_id)
+        return await self.list_logs(user_id=user_id, skip=skip, limit=limit)
 
     async def get_by_date_range(
         self,
@@ -105,39 +256,127 @@ class UserAccessLogRepository(BaseRepository[UserAccessLog]):
         end_date: datetime,
         skip: int = 0,
         limit: int = 100,
-    ) -> Sequence[UserAccessLog]:
+        cursor: Cursor | None = None,
+    ) -> Sequence[AccessLogRow]:
         """
         날짜 범위로 접속 로그를 조회합니다.
 
         Args:
             start_date: 시작 날짜
             end_date: 종료 날짜
-            skip: 건너뛸 레코드 수
+            skip: 건너뛸 레코드 수 (깊은 페이지는 cursor 권장)
             limit: 최대 조회 수
+            cursor: 이전 페이지 마지막 행의 (created_at, id) — 그 다음 행부터 조회
 
         Returns:
-            UserAccessLog 리스트
+            접속 로그 행 리스트
         """
-        logger.debug(f"[get_by_date_range] 조회 시작: {start_date} ~ {end_date}")
+        logger.debug("[get_by_date_range] 조회 시작: %s ~ %s", start_date, end_date)
 
-        stmt = (
-            select(self.model)
-            .where(
-                and_(
-                    self.model.created_at >= start_date,
-                    self.model.created_at <= end_date,
-                )
-            )
-            .order_by(self.model.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+        stmt, params = self._list_query(
+            skip, limit, date_range=(start_date, end_date), cursor=cursor
         )
-        result = await self.session.execute(stmt)
-        logs = result.scalars().all()
+        result = await self._read(stmt, params)
+        logs = result.all()
 
-        logger.debug(f"[get_by_date_range] 조회 완료: count={len(logs)}")
+        logger.debug("[get_by_date_range] 조회 완료: count=%d", len(logs))
         return logs
 
+    # 통계 차원 이름 → 집계 대상 컬럼 속성명. 각 컬럼의 단일 인덱스는 InnoDB 에서
+    # PK 를 꼬리에 달고 있어 COUNT(*) 집계가 테이블 행을 읽지 않고 인덱스만으로 끝난다
+    _STAT_DIMENSIONS = ("device_type", "os_name", "browser_name")
+
+    def _dimension_value(self, name: str) -> ColumnElement[str]:
+        """차원 컬럼 값(NULL 은 ``'unknown'``)을 DB 에서 계산하는 GROUP BY 식."""
+        # 상수를 바인드 파라미터가 아닌 리터럴로 넣어야 SELECT 와 GROUP BY 식이 같아진다.
+        # 'unknown' 은 ENUM(device_type) 값이 아니므로 결과 타입을 문자열로 지정한다.
+        return func.coalesce(getattr(self.model, name), literal_column("'unknown'"), type_=String)
+
+    def _dimension_counts_stmt(self) -> CompoundSelect:
+        """차원별 GROUP BY 를 ``(dimension, value, count)`` 행으로 묶은 UNION ALL 쿼리."""
+        selects = []
+        for name in self._STAT_DIMENSIONS:
+            value = self._dimension_value(name)
+            selects.append(
+                select(
+                    literal(name).label("dimension"),
+                    value.label("value"),
+                    func.count().label("count"),
+                ).group_by(value)
+            )
+        return union_all(*selects)
+
+    async def count_by_dimensions(self) -> dict[str, dict[str, int]]:
+        """
+        장치 유형 · OS · 브라우저별 접속 수를 한 번의 쿼리로 집계합니다.
+
+        세 GROUP BY 를 차원 이름 리터럴을 붙여 ``UNION ALL`` 로 묶으므로 DB 왕복이
+        한 번뿐입니다. (하나의 AsyncSession 은 동시 쿼리를 지원하지 않으므로 gather 로
+        나눠 보내는 대신 문장을 합칩니다.)
+
+        Returns:
+            ``{"device_type": {...}, "os_name": {...}, "browser_name": {...}}``
+            (값이 없는 행은 "unknown" 으로 집계)
+        """
+        logger.debug("[count_by_dimensions] 집계 시작")
+
+        result = await self.session.execute(self._dimension_counts_stmt())
+        counts = self._group_counts(result.all())
+
+        logger.debug("[count_by_dimensions] 집계 완료: %s", counts)
+        return counts
+
+    async def read_stats_rollup(self) -> dict[str, dict[str, int]]:
+        """
+        집계 테이블(user_access_log_stats)에서 차원별 접속 수를 읽습니다.
+
+        Returns:
+            ``count_by_dimensions()`` 와 같은 형태. 한 번도 집계하지 않았으면 빈 딕셔너리
+        """
+        stmt = select(UserAccessLogStat.dimension, UserAccessLogStat.value, UserAccessLogStat.count)
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        if not rows:
+            return {}
+        return self._group_counts(rows)
+
+    async def refresh_stats_rollup(self) -> None:
+        """
+        원본 로그를 다시 집계해 집계 테이블을 교체합니다(커밋은 호출자가 수행).
+
+        집계는 일반 SELECT 로 먼저 읽고, 결과 몇 행만 DELETE 후 executemany INSERT
+        로 넣습니다. ``INSERT ... SELECT`` 는 REPEATABLE READ 의 InnoDB 에서 원본
+        테이블의 읽은 인덱스 레코드마다 공유 next-key 잠금을 걸어, 집계가 도는 동안
+        접속 로그 적재를 막습니다. 일반 SELECT 는 잠금 없는 일관된 읽기입니다.
+        DELETE 와 INSERT 는 같은 트랜잭션이므로 커밋 전까지 조회 쪽은 이전 집계를 봅니다.
+        """
+        logger.debug("[refresh_stats_rollup] 집계 갱신 시작")
+
+        result = await self.session.execute(self._dimension_counts_stmt())
+        refreshed_at = timezone_settings.now()
+        rows = [
+            {"dimension": dimension, "value": value, "count": count, "refreshed_at": refreshed_at}
+            for dimension, value, count in result.all()
+        ]
+        await self.session.execute(delete(UserAccessLogStat))
+        if rows:
+            await self.session.execute(insert(UserAccessLogStat), rows)
+
+        logger.debug("[refresh_stats_rollup] 집계 갱신 완료: %d행", len(rows))
+
+    def _group_counts(self, rows: Sequence[Any]) -> dict[str, dict[str, int]]:
+        """``(dimension, value, count)`` 행을 차원별 딕셔너리로 묶습니다."""
+        counts: dict[str, dict[str, int]] = {name: {} for name in self._STAT_DIMENSIONS}
+        for dimension, value, count in rows:
+            counts[dimension][value] = count
+        return counts
+
+    async def _count_by(self, name: str) -> dict[str, int]:
+        """한 차원의 값별 접속 수 (NULL 은 DB 에서 ``'unknown'`` 그룹으로 합친다)."""
+        value = self._dimension_value(name)
+        result = await self.session.execute(select(value, func.count()).group_by(value))
+        return dict(result.tuples().all())
+
     async def count_by_device_type(self) -> dict[str, int]:
         """
         장치 유형별 접속 수를 집계합니다.
@@ -147,13 +386,9 @@ class UserAccessLogRepository(BaseRepository[UserAccessLog]):
         """
         logger.debug("[count_by_device_type] 집계 시작")
 
-        stmt = select(self.model.device_type, func.count(self.model.id)).group_by(
-            self.model.device_type
-        )
-        result = await self.session.execute(stmt)
-        counts = {row[0] or "unknown": row[1] for row in result.all()}
+        counts = await self._count_by("device_type")
 
-        logger.debug(f"[count_by_device_type] 집계 완료: {counts}")
+        logger.debug("[count_by_device_type] 집계 완료: %s", counts)
         return counts
 
     async def count_by_os(self) -> dict[str, int]:
@@ -165,11 +400,9 @@ class UserAccessLogRepository(BaseRepository[UserAccessLog]):
         """
         logger.debug("[count_by_os] 집계 시작")
 
-        stmt = select(self.model.os_name, func.count(self.model.id)).group_by(self.model.os_name)
-        result = await self.session.execute(stmt)
-        counts = {row[0] or "unknown": row[1] for row in result.all()}
+        counts = await self._count_by("os_name")
 
-        logger.debug(f"[count_by_os] 집계 완료: {counts}")
+        logger.debug("[count_by_os] 집계 완료: %s", counts)
         return counts
 
     async def count_by_browser(self) -> dict[str, int]:
@@ -181,16 +414,12 @@ class UserAccessLogRepository(BaseRepository[UserAccessLog]):
         """
         logger.debug("[count_by_browser] 집계 시작")
 
-        stmt = select(self.model.browser_name, func.count(self.model.id)).group_by(
-            self.model.browser_name
-        )
-        result = await self.session.execute(stmt)
-        counts = {row[0] or "unknown": row[1] for row in result.all()}
+        counts = await self._count_by("browser_name")
 
-        logger.debug(f"[count_by_browser] 집계 완료: {counts}")
+        logger.debug("[count_by_browser] 집계 완료: %s", counts)
         return counts
 
-    async def get_recent_logs(self, limit: int = 50) -> Sequence[UserAccessLog]:
+    async def get_recent_logs(self, limit: int = 50) -> Sequence[AccessLogRow]:
         """
         최근 접속 로그를 조회합니다.
 
@@ -198,13 +427,7 @@ class UserAccessLogRepository(BaseRepository[UserAccessLog]):
             limit: 최대 조회 수
 
         Returns:
-            UserAccessLog 리스트
+            접속 로그 행 리스트
         """
-        logger.debug(f"[get_recent_logs] 조회 시작: limit={limit}")
-
-        stmt = select(self.model).order_by(self.model.created_at.desc()).limit(limit)
-        result = await self.session.execute(stmt)
-        logs = result.scalars().all()
-
-        logger.debug(f"[get_recent_logs] 조회 완료: count={len(logs)}")
-        return logs
+        logger.debug("[get_recent_logs] 조회 시작: limit=%s", limit)
+        return await self.list_logs(limit=limit)
@@ -57,6 +57,9 @@ class UserAccessLogCreate(UserAccessLogBase):
     # 추가 헤더
     accept_language: str | None = Field(None, description="Accept-Language 헤더")
 
+    # 요청 추적 정보
+    correlation_id: str | None = Field(None, description="요청 상관관계 ID")
+
 
 class UserAccessLogResponse(BaseModel):
     """UserAccessLog 응답 스키마"""
@@ -79,6 +82,7 @@ class UserAccessLogResponse(BaseModel):
     response_status: int | None = Field(None, description="응답 상태 코드")
     response_time_ms: int | None = Field(None, description="응답 시간 (ms)")
     user_id: str | None = Field(None, description="사용자 ID")
+    correlation_id: str | None = Field(None, description="요청 상관관계 ID")
     created_at: datetime = Field(..., description="생성 시간")
 
 
@@ -86,9 +90,13 @@ class UserAccessLogListResponse(BaseModel):
     """UserAccessLog 목록 응답 스키마"""
 
     items: list[UserAccessLogResponse] = Field(..., description="로그 목록")
-    total: int = Field(..., description="전체 개수")
+    total: int | None = Field(..., description="전체 개수 (optimize_for_speed=true 면 null)")
     skip: int = Field(..., description="건너뛴 개수")
     limit: int = Field(..., description="조회 개수")
+    has_more: bool = Field(False, description="다음 페이지 존재 여부")
+    next_cursor: str | None = Field(
+        None, description="다음 페이지 커서 (cursor 파라미터로 전달, 마지막 페이지면 null)"
+    )
 
 
 class DeviceTypeStats(BaseModel):
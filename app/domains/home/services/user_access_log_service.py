@@ -5,16 +5,21 @@ UserAccessLog Service
 트랜잭션 경계(commit/rollback)는 호출하는 의존성 또는 background_session 이 책임진다.
 """
 
-from collections.abc import Sequence
+import asyncio
+import time
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.services.services_base import BaseService
-from app.domains.home.exceptions import InvalidDateRangeException
+from app.domains.home.exceptions import InvalidCursorException, InvalidDateRangeException
 from app.domains.home.models.models import UserAccessLog
-from app.domains.home.repositories.user_access_log_repository import UserAccessLogRepository
+from app.domains.home.repositories.user_access_log_repository import (
+    AccessLogRow,
+    UserAccessLogRepository,
+)
 from app.domains.home.schemas.user_access_log_schema import (
     AccessLogStats,
     BrowserStats,
@@ -22,6 +27,32 @@ from app.domains.home.schemas.user_access_log_schema import (
     OSStats,
     UserAccessLogCreate,
 )
+from app.utils.pagination import decode_cursor
+from config import middleware_settings
+
+# get_cached_stats() 의 프로세스 로컬 캐시: {"stats": (만료 시각(monotonic), 통계)}
+_stats_cache: dict[str, tuple[float, AccessLogStats]] = {}
+
+# 목록 전체 개수 캐시: {정렬된 필터 항목: (만료 시각(monotonic), 개수)}
+# 키가 요청 필터 값이므로 크기를 묶는다 — 넣을 때 만료 항목을 치우고, 그래도 차 있으면
+# 가장 오래 넣은 항목부터 버린다 (dict 삽입 순서).
+_COUNT_CACHE_MAX = 256
+_CountKey = tuple[tuple[str, Any], ...]
+_count_cache: dict[_CountKey, tuple[float, int]] = {}
+# 같은 필터로 진행 중인 COUNT — 동시에 놓친 요청은 새로 세지 않고 이 결과를 기다린다
+_count_inflight: dict[_CountKey, asyncio.Future[int]] = {}
+
+
+def _store_count(key: _CountKey, total: int, ttl: int) -> None:
+    """개수를 캐시에 넣되 만료 항목을 치우고 ``_COUNT_CACHE_MAX`` 를 넘지 않게 한다."""
+    now = time.monotonic()
+    _count_cache.pop(key, None)
+    if len(_count_cache) >= _COUNT_CACHE_MAX:
+        for stale in [k for k, (expires, _) in _count_cache.items() if expires <= now]:
+            del _count_cache[stale]
+        while len(_count_cache) >= _COUNT_CACHE_MAX:
+            del _count_cache[next(iter(_count_cache))]
+    _count_cache[key] = (now + ttl, total)
 
 
 class UserAccessLogService(BaseService):
@@ -40,6 +71,14 @@ class UserAccessLogService(BaseService):
         self.log.debug("접속 로그 생성: path=%s", data_dict.get("request_path"))
         return await self.repository.create(data_dict)
 
+    async def create_access_logs(self, rows: list[dict[str, Any]]) -> None:
+        """접속 로그를 일괄 생성한다(배치 수집기용, 커밋은 호출자가 수행).
+
+        저장 후 다시 읽지 않으므로 ORM 인스턴스·refresh 없이 Core INSERT 로 적재한다.
+        """
+        self.log.debug("접속 로그 일괄 생성: %d건", len(rows))
+        await self.repository.bulk_insert(rows)
+
     async def get_access_logs(
         self,
         skip: int = 0,
@@ -47,11 +86,89 @@ class UserAccessLogService(BaseService):
     ) -> tuple[Sequence[UserAccessLog], int]:
         """접속 로그 목록과 전체 개수를 조회한다."""
         self.log.debug("접속 로그 목록 조회: skip=%s, limit=%s", skip, limit)
-        logs = await self.repository.get_all(skip=skip, limit=limit)
-        total = await self.repository.count()
+        return await self.repository.get_page(skip=skip, limit=limit)
+
+    async def stream_access_logs(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        ip_address: str | None = None,
+        user_id: str | None = None,
+        cursor: str | None = None,
+        with_total: bool = True,
+    ) -> tuple[AsyncIterator[AccessLogRow], int | None]:
+        """조건에 맞는 접속 로그를 최신순 스트리밍으로, 조건부 전체 개수와 함께 반환한다.
+
+        ``cursor`` 가 있으면 OFFSET 대신 그 커서 다음 행부터 읽는다(키셋 페이지네이션).
+        스트리밍 중에는 커넥션이 결과 읽기에 묶이므로 개수를 먼저 센다.
+        ``with_total=False`` 면 COUNT 를 건너뛰고 개수 자리에 None 을 돌려준다.
+        """
+        self.log.debug(
+            "접속 로그 스트리밍 조회: ip=%s, user_id=%s, skip=%s, limit=%s, cursor=%s",
+            ip_address,
+            user_id,
+            skip,
+            limit,
+            cursor,
+        )
+        try:
+            seek = decode_cursor(cursor) if cursor is not None else None
+        except ValueError as e:
+            raise InvalidCursorException(detail={"cursor": cursor}) from e
+        filters = {
+            key: value
+            for key, value in (("ip_address", ip_address), ("user_id", user_id))
+            if value is not None
+        }
+        total = await self._count_logs(filters) if with_total else None
+        logs = self.repository.stream_logs(
+            ip_address=ip_address, user_id=user_id, skip=skip, limit=limit, cursor=seek
+        )
         return logs, total
 
-    async def get_recent_logs(self, limit: int = 50) -> Sequence[UserAccessLog]:
+    async def _count_logs(self, filters: dict[str, Any]) -> int:
+        """필터별 전체 개수를 ACCESS_LOG_COUNT_CACHE_SECONDS 동안 공유한다 (single-flight).
+
+        같은 필터의 목록 요청이 몰리면 COUNT 가 요청 수만큼 반복된다. 진행 중인 COUNT 가
+        있으면 그 결과를 기다리고, 끝난 값은 짧은 TTL 동안 재사용한다. 추가 전용 로그라
+        TTL 만큼 늦은 개수는 목록 응답에 문제가 되지 않는다.
+        """
+        ttl = middleware_settings.ACCESS_LOG_COUNT_CACHE_SECONDS
+        if ttl <= 0:
+            return await self.repository.count(**filters)
+        key = tuple(sorted(filters.items()))
+        cached = _count_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        pending = _count_inflight.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # 먼저 센 요청이 끊긴 경우에만 직접 센다 (이 요청 자체의 취소는 그대로 전파)
+                if not pending.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                return await self.repository.count(**filters)
+
+        future: asyncio.Future[int] = asyncio.get_running_loop().create_future()
+        _count_inflight[key] = future
+        try:
+            total = await self.repository.count(**filters)
+        except Exception as e:
+            # 기다리던 요청도 같은 오류를 받는다 (기다린 요청이 없어도 경고가 남지 않게 회수)
+            future.set_exception(e)
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        finally:
+            del _count_inflight[key]
+        future.set_result(total)
+        _store_count(key, total, ttl)
+        return total
+
+    async def get_recent_logs(self, limit: int = 50) -> Sequence[AccessLogRow]:
         """최근 접속 로그를 조회한다."""
         self.log.debug("최근 접속 로그 조회: limit=%s", limit)
         return await self.repository.get_recent_logs(limit=limit)
@@ -61,7 +178,7 @@ class UserAccessLogService(BaseService):
         ip_address: str,
         skip: int = 0,
         limit: int = 100,
-    ) -> Sequence[UserAccessLog]:
+    ) -> Sequence[AccessLogRow]:
         """IP 주소로 접속 로그를 조회한다."""
         self.log.debug("IP별 접속 로그 조회: ip=%s", ip_address)
         return await self.repository.get_by_ip(ip_address=ip_address, skip=skip, limit=limit)
@@ -71,7 +188,7 @@ class UserAccessLogService(BaseService):
         user_id: str,
         skip: int = 0,
         limit: int = 100,
-    ) -> Sequence[UserAccessLog]:
+    ) -> Sequence[AccessLogRow]:
         """사용자 ID로 접속 로그를 조회한다."""
         self.log.debug("사용자별 접속 로그 조회: user_id=%s", user_id)
         return await self.repository.get_by_user_id(user_id=user_id, skip=skip, limit=limit)
@@ -82,7 +199,7 @@ class UserAccessLogService(BaseService):
         end_date: datetime,
         skip: int = 0,
         limit: int = 100,
-    ) -> Sequence[UserAccessLog]:
+    ) -> Sequence[AccessLogRow]:
         """날짜 범위로 접속 로그를 조회한다."""
         if start_date > end_date:
             self.log.warning("잘못된 날짜 범위: start=%s end=%s", start_date, end_date)
@@ -95,12 +212,21 @@ class UserAccessLogService(BaseService):
         )
 
     async def get_stats(self) -> AccessLogStats:
-        """접속 로그 통계를 조회한다."""
+        """접속 로그 통계를 조회한다.
+
+        주기 태스크가 갱신하는 집계 테이블을 읽고, 아직 한 번도 집계되지 않았으면
+        원본 로그를 직접 집계한다.
+        """
         self.log.debug("접속 로그 통계 조회 시작")
-        total_count = await self.repository.count()
-        device_counts = await self.repository.count_by_device_type()
-        os_counts = await self.repository.count_by_os()
-        browser_counts = await self.repository.count_by_browser()
+        counts = await self.repository.read_stats_rollup()
+        if not counts:
+            self.log.debug("집계 테이블이 비어 있어 원본 로그를 직접 집계")
+            counts = await self.repository.count_by_dimensions()
+        device_counts = counts["device_type"]
+        os_counts = counts["os_name"]
+        browser_counts = counts["browser_name"]
+        # 한 차원의 그룹(NULL 포함)은 전체 행을 나누므로 합계가 곧 전체 건수다
+        total_count = sum(device_counts.values())
         return AccessLogStats(
             total_count=total_count,
             device_types=[
@@ -109,3 +235,30 @@ class UserAccessLogService(BaseService):
             os_list=[OSStats(os_name=k, count=v) for k, v in os_counts.items()],
             browsers=[BrowserStats(browser_name=k, count=v) for k, v in browser_counts.items()],
         )
+
+    async def get_cached_stats(self) -> AccessLogStats:
+        """``get_stats()`` 결과를 ACCESS_LOG_STATS_CACHE_SECONDS 동안 프로세스 메모리에서 재사용한다.
+
+        대시보드처럼 통계를 짧은 주기로 폴링하는 엔드포인트용이다. 집계 테이블 자체가
+        주기적으로만 갱신되므로 짧은 TTL 동안 같은 값을 돌려줘도 신선도는 거의 같다.
+        """
+        cached = _stats_cache.get("stats")
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        stats = await self.get_stats()
+        ttl = middleware_settings.ACCESS_LOG_STATS_CACHE_SECONDS
+        if ttl > 0:
+            _stats_cache["stats"] = (time.monotonic() + ttl, stats)
+        return stats
+
+    @staticmethod
+    def invalidate_stats_cache() -> None:
+        """``get_cached_stats()`` · ``_count_logs()`` 캐시를 비운다."""
+        _stats_cache.clear()
+        _count_cache.clear()
+
+    async def refresh_stats(self) -> None:
+        """통계 집계 테이블을 원본 로그 기준으로 다시 채운다(커밋은 호출자가 수행)."""
+        self.log.debug("접속 로그 통계 집계 갱신")
+        await self.repository.refresh_stats_rollup()
+        self.invalidate_stats_cache()
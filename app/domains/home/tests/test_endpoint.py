@@ -0,0 +1,157 @@
+"""Home 접속 로그 조회 엔드포인트 테스트.
+
+조회 엔드포인트가 읽기 전용 세션(get_read_session)으로 동작하는지
+in-memory sqlite(get_read_session 오버라이드)로 검증한다.
+"""
+
+import json
+from contextlib import asynccontextmanager
+
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.db.session import Base, get_read_session, get_session
+from app.domains.home.dependencies.access_log_dependencies import get_access_log_service_opener
+from app.domains.home.models.models import UserAccessLog
+from app.domains.home.services.user_access_log_service import UserAccessLogService
+from main import app
+
+
+@pytest_asyncio.fixture
+async def maker():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with maker() as session:
+        session.add(UserAccessLog(ip_address="1.2.3.4", request_path="/x", request_method="GET"))
+        await session.commit()
+    yield maker
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(maker):
+    async def _override_get_read_session():
+        async with maker() as session:
+            yield session
+
+    async def _fail_get_session():
+        raise AssertionError("조회 엔드포인트는 쓰기 세션을 열지 않아야 함")
+        yield  # pragma: no cover
+
+    @asynccontextmanager
+    async def _open_service():
+        async with maker() as session:
+            yield UserAccessLogService(session)
+
+    UserAccessLogService.invalidate_stats_cache()
+    app.dependency_overrides[get_read_session] = _override_get_read_session
+    app.dependency_overrides[get_access_log_service_opener] = lambda: _open_service
+    app.dependency_overrides[get_session] = _fail_get_session
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+    app.dependency_overrides.clear()
+
+
+async def test_list_access_logs_uses_read_session(client):
+    resp = await client.get("/api/v1/home/access-logs")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["total"] == 1
+    assert body["items"][0]["ip_address"] == "1.2.3.4"
+
+
+async def test_list_access_logs_applies_query_filters(client):
+    matched = await client.get("/api/v1/home/access-logs", params={"ip_address": "1.2.3.4"})
+    missed = await client.get("/api/v1/home/access-logs", params={"ip_address": "9.9.9.9"})
+
+    assert matched.json()["total"] == 1
+    assert missed.json() == {
+        "items": [],
+        "total": 0,
+        "skip": 0,
+        "limit": 50,
+        "has_more": False,
+        "next_cursor": None,
+    }
+
+
+async def test_list_access_logs_follows_next_cursor(client, maker):
+    async with maker() as session:
+        session.add(UserAccessLog(ip_address="5.6.7.8", request_path="/y", request_method="GET"))
+        await session.commit()
+
+    first = (await client.get("/api/v1/home/access-logs", params={"limit": 1})).json()
+    second = (
+        await client.get(
+            "/api/v1/home/access-logs", params={"limit": 1, "cursor": first["next_cursor"]}
+        )
+    ).json()
+
+    assert first["has_more"] and first["next_cursor"], "다음 행이 있으면 커서를 돌려줘야 함"
+    assert len(second["items"]) == 1
+    assert second["items"][0]["id"] != first["items"][0]["id"]
+    assert second["has_more"] is False and second["next_cursor"] is None
+
+
+async def test_list_access_logs_can_skip_total_count(client):
+    resp = await client.get("/api/v1/home/access-logs", params={"optimize_for_speed": True})
+
+    body = resp.json()
+    assert body["total"] is None
+    assert len(body["items"]) == 1
+    assert body["has_more"] is False
+
+
+async def test_list_access_logs_rejects_malformed_cursor(client):
+    resp = await client.get("/api/v1/home/access-logs", params={"cursor": "%%%"})
+
+    assert resp.status_code == 400
+    assert resp.json()["error_code"] == "HOME_INVALID_CURSOR"
+
+
+async def test_export_streams_ndjson_lines(client, maker):
+    async with maker() as session:
+        session.add(UserAccessLog(ip_address="5.6.7.8", request_path="/y", request_method="GET"))
+        await session.commit()
+
+    resp = await client.get("/api/v1/home/access-logs/export")
+    filtered = await client.get("/api/v1/home/access-logs/export", params={"ip_address": "5.6.7.8"})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert {row["ip_address"] for row in rows} == {"1.2.3.4", "5.6.7.8"}
+    assert [json.loads(line)["request_path"] for line in filtered.text.splitlines()] == ["/y"]
+
+
+async def test_stats_uses_read_session(client):
+    resp = await client.get("/api/v1/home/access-logs/stats")
+
+    assert resp.status_code == 200
+
+
+async def test_stats_revalidates_with_etag(client):
+    first = await client.get("/api/v1/home/access-logs/stats")
+    etag = first.headers["etag"]
+    second = await client.get("/api/v1/home/access-logs/stats", headers={"If-None-Match": etag})
+
+    assert first.json()["total_count"] == 1
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+
+
+async def test_recent_access_logs_are_converted_from_orm_rows(client):
+    resp = await client.get("/api/v1/home/access-logs/recent")
+
+    assert resp.status_code == 200
+    assert [log["request_path"] for log in resp.json()] == ["/x"]
@@ -40,12 +40,14 @@ class ReplyService(BaseService):
         self,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[Sequence[Reply], int]:
+        cursor: str | None = None,
+        with_total: bool = True,
+    ) -> tuple[Sequence[Reply], int | None]:
         """댓글 목록과 전체 개수를 조회한다."""
-        self.log.debug("댓글 목록 조회: skip=%s limit=%s", skip, limit)
-        replies = await self.repository.get_all(skip=skip, limit=limit)
-        total = await self.repository.count()
-        return replies, total
+        self.log.debug("댓글 목록 조회: skip=%s limit=%s cursor=%s", skip, limit, cursor)
+        return await self.repository.get_page(
+            skip=skip, limit=limit, cursor=cursor, with_total=with_total
+        )
 
     async def update_reply(self, reply_id: str, data: ReplyUpdate) -> Reply:
         """댓글을 부분 수정한다. 없으면 ReplyNotFoundException."""
@@ -38,6 +38,10 @@ class SnsPostListResponse(BaseModel):
     """피드 게시물 목록 응답(페이지네이션)."""
 
     items: list[SnsPostResponse]
-    total: int
+    total: int | None = Field(..., description="전체 개수 (optimize_for_speed=true 면 null)")
     skip: int
     limit: int
+    has_more: bool = Field(False, description="다음 페이지 존재 여부")
+    next_cursor: str | None = Field(
+        None, description="다음 페이지 커서 (cursor 파라미터로 전달, 마지막 페이지면 null)"
+    )
@@ -40,12 +40,14 @@ class SnsService(BaseService):
         self,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[Sequence[SnsPost], int]:
+        cursor: str | None = None,
+        with_total: bool = True,
+    ) -> tuple[Sequence[SnsPost], int | None]:
         """피드 게시물 목록과 전체 개수를 조회한다."""
-        self.log.debug("피드 게시물 목록 조회: skip=%s limit=%s", skip, limit)
-        posts = await self.repository.get_all(skip=skip, limit=limit)
-        total = await self.repository.count()
-        return posts, total
+        self.log.debug("피드 게시물 목록 조회: skip=%s limit=%s cursor=%s", skip, limit, cursor)
+        return await self.repository.get_page(
+            skip=skip, limit=limit, cursor=cursor, with_total=with_total
+        )
 
     async def update_post(self, post_id: str, data: SnsPostUpdate) -> SnsPost:
         """피드 게시물을 부분 수정한다. 없으면 SnsPostNotFoundException."""
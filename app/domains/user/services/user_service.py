@@ -45,12 +45,14 @@ class UserService(BaseService):
         self,
         skip: int = 0,
         limit: int = 100,
-    ) -> tuple[Sequence[User], int]:
+        cursor: str | None = None,
+        with_total: bool = True,
+    ) -> tuple[Sequence[User], int | None]:
         """사용자 목록과 전체 개수를 조회한다."""
-        self.log.debug("사용자 목록 조회: skip=%s limit=%s", skip, limit)
-        users = await self.repository.get_all(skip=skip, limit=limit)
-        total = await self.repository.count()
-        return users, total
+        self.log.debug("사용자 목록 조회: skip=%s limit=%s cursor=%s", skip, limit, cursor)
+        return await self.repository.get_page(
+            skip=skip, limit=limit, cursor=cursor, with_total=with_total
+        )
 
     async def update_user(self, user_id: str, data: UserUpdate) -> User:
         """사용자를 부분 수정한다. 없으면 UserNotFoundException."""
@@ -7,6 +7,8 @@
 - LoggerMixin: 클래스가 self.log 로 클래스명 자동 주입(방식 C).
 - 비클래스 코드는 ContextFilter(방식 A)가 호출 프레임에서 클래스명을 자동 추출.
 - 로그 헤더: [시간 TZ] LEVEL [app=..] [module:class:func:line] message
+- 메시지 인자는 f-string 대신 %-인자로 넘긴다: ``log.info("user=%s id=%d", u, i)``.
+  레벨에서 걸러진 호출은 문자열을 만들지 않는다(ruff G 규칙으로 강제).
 """
 
 from app.utils.logs.config import LOG_FORMAT
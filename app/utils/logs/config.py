@@ -4,16 +4,24 @@ ENV(development/test/staging/production)에 따라 레벨·핸들러·타임존
 - development (uv run fastapi dev): 콘솔, DEBUG, 밀리초, 로컬 TZ(KST)
 - test: 콘솔, 간결, 파일 off, 로컬 TZ
 - staging/production: 콘솔 + 회전 파일 + 에러 파일, INFO, UTC
+
+파일 핸들러(BufferedRotatingFileHandler — 레코드마다 flush 하지 않음)는 root 에 직접
+달지 않고 ``QueueHandler`` 뒤에 둔다. 요청 경로의 로그 호출은 큐에 넣기만 하고, 실제
+파일 쓰기는 ``QueueListener`` 스레드가 맡는다(리스너 시작은 setup.configure_logging). ContextFilter 는 호출 프레임을 보므로 큐에 넣기 전,
+호출 스레드의 QueueHandler 에서만 실행한다(파일 핸들러에는 달지 않는다).
 """
 
 from __future__ import annotations
 
-from config import app_settings, log_settings, timezone_settings
+import logging
+
+from config import app_settings, log_settings
 
 # 확정 포맷 (#3): [시간 TZ] LEVEL [app=..] [module:class:func:line] message
+# %-스타일: 포맷마다 str.format(**record.__dict__) 대신 dict % 치환 한 번으로 끝난다.
 LOG_FORMAT = (
-    "[{asctime} {tzname}] {levelname:5} [app={appname}] "
-    "[{module}:{classname}:{funcName}:{lineno}] {message}"
+    "[%(asctime)s %(tzname)s] %(levelname)-5s [app=%(appname)s] "
+    "[%(module)s:%(classname)s:%(funcName)s:%(lineno)d] %(message)s"
 )
 
 
@@ -44,29 +52,37 @@ def build_dictconfig() -> dict:
 
     if env in ("production", "staging") and log_settings.LOG_FILE_ENABLED:
         log_dir = log_settings.get_log_dir()
-        today = timezone_settings.now().strftime("%Y-%m-%d")
+        # 파일명의 {date} 는 핸들러가 레코드 날짜로 채우고 자정마다 바꾼다
         max_bytes = log_settings.LOG_MAX_SIZE_MB * 1024 * 1024
         handlers["file"] = {
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": str(log_dir / log_settings.LOG_APP_FILENAME.format(date=today)),
+            "class": "app.utils.logs.handlers.BufferedRotatingFileHandler",
+            "filename": str(log_dir / log_settings.LOG_APP_FILENAME),
             "maxBytes": max_bytes,
             "backupCount": log_settings.LOG_BACKUP_COUNT,
             "encoding": "utf-8",
             "formatter": "app",
-            "filters": ["context"],
             "level": log_settings.LOG_FILE_LEVEL,
         }
         handlers["error_file"] = {
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": str(log_dir / log_settings.LOG_ERROR_FILENAME.format(date=today)),
+            "class": "app.utils.logs.handlers.BufferedRotatingFileHandler",
+            "filename": str(log_dir / log_settings.LOG_ERROR_FILENAME),
             "maxBytes": max_bytes,
             "backupCount": log_settings.LOG_BACKUP_COUNT,
             "encoding": "utf-8",
             "formatter": "app",
-            "filters": ["context"],
             "level": "ERROR",
         }
-        root_handlers += ["file", "error_file"]
+        # 큐 앞에서 두 파일 핸들러 중 낮은 레벨로 거른다. QueueHandler.prepare() 는
+        # 레코드를 포맷하므로, 어느 파일에도 쓰이지 않을 레코드는 포맷·큐잉 전에 버린다.
+        file_level = logging.getLevelNamesMapping().get(log_settings.LOG_FILE_LEVEL, 0)
+        handlers["file_queue"] = {
+            "class": "logging.handlers.QueueHandler",
+            "handlers": ["file", "error_file"],
+            "respect_handler_level": True,
+            "filters": ["context"],
+            "level": min(file_level, logging.ERROR),
+        }
+        root_handlers.append("file_queue")
 
     return {
         "version": 1,
@@ -1,7 +1,7 @@
 """타임존 인식 Formatter.
 
 asctime 을 설정된 타임존(또는 UTC)으로 렌더하고, 약어(KST/UTC)를 record.tzname 에 주입한다.
-style 은 '{' 고정. appname/classname 이 비어 있으면 안전 기본값으로 채운다.
+style 은 '%' (표준 기본값). appname/classname 이 비어 있으면 안전 기본값으로 채운다.
 """
 
 from __future__ import annotations
@@ -23,7 +23,7 @@ class TzFormatter(logging.Formatter):
         use_utc: bool = False,
         with_ms: bool = False,
     ) -> None:
-        super().__init__(fmt=fmt, datefmt=datefmt, style="{")
+        super().__init__(fmt=fmt, datefmt=datefmt)
         self.use_utc = use_utc
         self.with_ms = with_ms
 
@@ -40,8 +40,11 @@ class TzFormatter(logging.Formatter):
         return rendered
 
     def format(self, record: logging.LogRecord) -> str:
+        # 레코드 시각 기준 약어 (서머타임 경계도 맞음). strftime 보다 tzname() 이 가볍다.
         record.tzname = (
-            "UTC" if self.use_utc else (datetime.now(self._tz()).strftime("%Z") or "KST")
+            "UTC"
+            if self.use_utc
+            else (datetime.fromtimestamp(record.created, self._tz()).tzname() or "KST")
         )
         if not getattr(record, "appname", None):
             record.appname = "app"
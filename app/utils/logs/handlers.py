@@ -0,0 +1,173 @@
+"""버퍼링 회전 파일 핸들러.
+
+표준 ``RotatingFileHandler`` 는 레코드마다 ``flush()`` 해 로그 1건이 write 시스템 콜
+1회가 된다. ``BufferedRotatingFileHandler`` 는 큰 버퍼(기본 64 KiB)로 파일을 열고
+평소에는 flush 를 미루다가 다음 경우에만 디스크로 내보낸다.
+
+- ERROR 이상 레코드 (장애 직전 로그 유실 방지)
+- 마지막 flush 후 ``flush_interval`` 초가 지난 뒤의 레코드
+- 로그가 끊긴 동안에는 백그라운드 flusher 스레드가 ``flush_interval`` 마다
+- 회전(doRollover) · close 시
+
+파일명에 ``{date}`` 가 있으면 설정 타임존의 날짜(YYYY-MM-DD)로 채우고, 자정이 지나면
+다음 레코드부터 새 날짜 파일로 옮겨 쓴다(장기 실행 프로세스도 날짜별 파일 유지).
+
+flusher 는 프로세스당 스레드 하나가 살아 있는 핸들러 전체를 돌며, fork 된 자식에서는
+다시 시작된다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import stat
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta
+from logging.handlers import RotatingFileHandler
+from typing import Any
+
+from config import timezone_settings
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+_handlers: weakref.WeakSet[BufferedRotatingFileHandler] = weakref.WeakSet()
+_flusher: threading.Thread | None = None
+_flusher_lock = threading.Lock()
+
+
+def _flush_loop() -> None:
+    while True:
+        interval = min((h.flush_interval for h in list(_handlers)), default=DEFAULT_FLUSH_INTERVAL)
+        time.sleep(interval)
+        for handler in list(_handlers):
+            handler.flush_if_due()
+
+
+def _ensure_flusher() -> None:
+    global _flusher
+    with _flusher_lock:
+        if _flusher is None or not _flusher.is_alive():
+            _flusher = threading.Thread(target=_flush_loop, name="log-flusher", daemon=True)
+            _flusher.start()
+
+
+def _reset_flusher_in_child() -> None:
+    """fork 된 자식에는 flusher 스레드가 없으므로 핸들러가 있으면 다시 띄운다."""
+    global _flusher, _flusher_lock
+    _flusher, _flusher_lock = None, threading.Lock()
+    if _handlers:
+        _ensure_flusher()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_flusher_in_child)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """flush 를 ERROR 레코드 · 주기 단위로 모아 write 시스템 콜을 줄인 회전 파일 핸들러.
+
+    회전 판단은 표준 ``shouldRollover()`` 의 ``stream.tell()`` 대신 이 핸들러가 쓴
+    바이트 수로 한다. 텍스트 스트림의 ``tell()`` 은 버퍼를 먼저 flush 하므로 레코드마다
+    버퍼링이 풀리고, 표준 구현은 크기를 재려고 레코드를 한 번 더 포맷하기도 한다.
+    """
+
+    def __init__(
+        self,
+        filename: str | os.PathLike[str],
+        *args: Any,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        flush_level: int = logging.ERROR,
+        **kwargs: Any,
+    ) -> None:
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._last_flush = time.monotonic()
+        self._bytes_written = 0
+        self._rotatable = True
+        filename = os.fspath(filename)
+        # 날짜 파일이면 다음 자정 시각을 기억해 두고, 레코드마다는 숫자 비교만 한다
+        self._date_template = filename if "{date}" in filename else None
+        self._next_day_at = float("inf")
+        if self._date_template is not None:
+            filename = self._dated_filename(time.time())
+        super().__init__(filename, *args, **kwargs)
+        _handlers.add(self)
+        _ensure_flusher()
+
+    def _open(self) -> Any:
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        # 열 때 한 번만 파일 크기를 읽고, 이후는 쓴 바이트 수로 누적한다
+        st = os.fstat(stream.fileno())
+        self._bytes_written = st.st_size
+        self._rotatable = stat.S_ISREG(st.st_mode)  # /dev/null 등은 회전하지 않음
+        return stream
+
+    def _dated_filename(self, now: float) -> str:
+        """``now`` 가 속한 날짜로 파일명을 채우고 다음 자정 시각을 갱신한다."""
+        tz = timezone_settings.tz
+        today = datetime.fromtimestamp(now, tz).date()
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time(), tz)
+        self._next_day_at = midnight.timestamp()
+        return os.path.abspath(self._date_template.format(date=today.isoformat()))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if record.created >= self._next_day_at:
+                # 날짜가 바뀌었다: 지난 파일을 닫고 새 날짜 파일을 연다
+                if self.stream is not None:
+                    self.stream.close()
+                    self.stream = None
+                self.baseFilename = self._dated_filename(record.created)
+            if self.stream is None:
+                self.stream = self._open()
+            size = len(msg.encode(self.stream.encoding, self.errors or "strict"))
+            if (
+                self.maxBytes > 0
+                and self._rotatable
+                and self._bytes_written
+                and self._bytes_written + size >= self.maxBytes
+            ):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes_written += size
+            if (
+                record.levelno >= self.flush_level
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        super().flush()
+        self._last_flush = time.monotonic()
+
+    def flush_if_due(self) -> None:
+        """마지막 flush 후 ``flush_interval`` 이 지났으면 버퍼를 내보낸다 (flusher 스레드용)."""
+        if time.monotonic() - self._last_flush < self.flush_interval:
+            return
+        self.acquire()
+        try:
+            self.flush()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        _handlers.discard(self)
+        super().close()
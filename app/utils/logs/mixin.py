@@ -2,19 +2,27 @@
 
 클래스가 LoggerMixin 을 상속하면 self.log 로 클래스명이 주입된 로거를 쓸 수 있다.
 LoggerAdapter 의 extra 로 classname 을 넣으므로 프레임 탐색(방식 A) 없이 오버헤드 0.
+어댑터는 클래스마다 한 번만 만들어 재사용하므로, 비활성 레벨 호출(운영의 debug 등)은
+로거의 레벨 캐시 조회 한 번으로 끝난다.
 """
 
 from __future__ import annotations
 
 import logging
+from functools import cache
 
 from app.utils.logs.setup import get_logger
 
 
+@cache
+def _class_logger(cls: type) -> logging.LoggerAdapter:
+    """클래스별 LoggerAdapter (모듈 로거 + classname)."""
+    return logging.LoggerAdapter(get_logger(cls.__module__), {"classname": cls.__name__})
+
+
 class LoggerMixin:
     """self.log 로 클래스명이 주입된 LoggerAdapter 를 제공한다."""
 
     @property
     def log(self) -> logging.LoggerAdapter:
-        logger = get_logger(type(self).__module__)
-        return logging.LoggerAdapter(logger, {"classname": type(self).__name__})
+        return _class_logger(type(self))
@@ -2,16 +2,62 @@
 
 configure_logging() 이 환경별 dictConfig 를 root 로거에 1회 적용하고,
 get_logger() 는 그 설정을 공유하는 자식 로거를 돌려준다(핸들러는 root 에만).
+파일 로깅이 켜져 있으면 QueueHandler 의 리스너 스레드를 시작하고, 프로세스 종료 시
+큐에 남은 레코드를 모두 쓴 뒤 멈춘다.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import os
+import queue
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
 
 from app.utils.logs.config import LOG_FORMAT, _env, _level, build_dictconfig
 
 _configured = False
+# 현재 구성의 파일 로그 리스너 (파일 로깅이 꺼져 있으면 None)
+_listener: QueueListener | None = None
+# get_logger() 가 돌려준 로거 (재구성해도 Logger 객체는 그대로라 비우지 않는다)
+_loggers: dict[str, logging.Logger] = {}
+
+
+def _stop_listener() -> None:
+    """리스너가 큐에 남은 레코드를 모두 처리하게 한 뒤 스레드를 멈춘다."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _start_listener() -> None:
+    """dictConfig 가 만든 root 의 QueueHandler 리스너를 시작한다."""
+    global _listener
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, QueueHandler) and handler.listener is not None:
+            _listener = handler.listener
+            _listener.start()
+            return
+
+
+def _restart_listener_in_child() -> None:
+    """fork 된 자식 프로세스(Celery prefork 등)에서 파일 로그 리스너를 다시 띄운다.
+
+    자식에는 리스너 스레드가 복제되지 않고, 부모 스레드가 잡고 있던 큐 잠금이
+    남아 있을 수 있으므로 큐와 리스너를 새로 만든다.
+    """
+    global _listener
+    if _listener is None:
+        return
+    handlers, respect_level = _listener.handlers, _listener.respect_handler_level
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, QueueHandler):
+            handler.queue = queue.Queue()
+            _listener = QueueListener(handler.queue, *handlers, respect_handler_level=respect_level)
+            _listener.start()
+            return
 
 
 def configure_logging(force: bool = False) -> None:
@@ -19,18 +65,32 @@ def configure_logging(force: bool = False) -> None:
     global _configured
     if _configured and not force:
         return
+    # 재구성 시 이전 리스너가 닫힐 파일 핸들러에 쓰지 않도록 먼저 멈춘다
+    _stop_listener()
     dictConfig(build_dictconfig())
+    _start_listener()
     _configured = True
 
 
+atexit.register(_stop_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_in_child)
+
+
 def get_logger(name: str = "app") -> logging.Logger:
     """설정된 로깅을 공유하는 로거를 반환한다.
 
+    ``logging.getLogger`` 는 호출마다 logging 모듈 잠금을 잡으므로, 한 번 돌려준
+    로거는 이름별 dict 에 담아 두고 이후 호출은 잠금 없는 dict 조회로 끝낸다.
+
     Args:
         name: 로거 이름(모듈명 권장). 헤더의 app 은 소스 경로에서 자동 산출된다.
     """
-    configure_logging()
-    return logging.getLogger(name)
+    logger = _loggers.get(name)
+    if logger is None:
+        configure_logging()
+        logger = _loggers.setdefault(name, logging.getLogger(name))
+    return logger
 
 
 def setup_uvicorn_logging() -> dict:
@@ -38,10 +98,8 @@ def setup_uvicorn_logging() -> dict:
     env = _env()
     level = _level()
     use_utc = env in ("production", "staging")
-    access_fmt = (
-        "[{asctime} {tzname}] {levelname:5} [app=uvicorn] "
-        '{client_addr} - "{request_line}" {status_code}'
-    )
+    # uvicorn.access 메시지(args 치환 결과)가 이미 '<client> - "<request line>" <status>' 다
+    access_fmt = "[%(asctime)s %(tzname)s] %(levelname)-5s [app=uvicorn] %(message)s"
     return {
         "version": 1,
         "disable_existing_loggers": False,
@@ -1,5 +1,6 @@
 """페이지네이션 유틸 패키지."""
 
+from app.utils.pagination.cursor import decode_cursor, encode_cursor
 from app.utils.pagination.pagination import Pagination
 
-__all__ = ["Pagination"]
+__all__ = ["Pagination", "decode_cursor", "encode_cursor"]
@@ -0,0 +1,56 @@
+"""키셋(seek) 페이지네이션 커서 인코딩 유틸.
+
+OFFSET 페이지네이션은 깊은 페이지일수록 버릴 행을 DB 가 모두 읽어야 한다. 키셋 방식은
+마지막으로 받은 행의 정렬 키 ``(created_at, id)`` 를 커서로 넘겨
+``WHERE (created_at, id) < (:ts, :id)`` 로 이어서 읽으므로 페이지 깊이와 무관하게 비용이
+일정하다. 이 모듈은 그 정렬 키를 URL 에 실을 수 있는 불투명 문자열로 바꾸기만 하며,
+SQLAlchemy 등 외부 계층에 의존하지 않는다(`app/utils/` 순수성 규칙).
+
+Example:
+    from app.utils.pagination import decode_cursor, encode_cursor
+
+    token = encode_cursor(last.created_at, last.id)
+    created_at, id = decode_cursor(token)
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import datetime
+
+_SEPARATOR = "|"
+
+
+def encode_cursor(created_at: datetime, id: str) -> str:
+    """정렬 키를 URL-safe base64 커서 문자열로 인코딩한다.
+
+    Args:
+        created_at: 마지막 행의 정렬 시각
+        id: 마지막 행의 ID (같은 시각 행 사이의 순서 결정용)
+
+    Returns:
+        패딩(=)을 뗀 URL-safe base64 문자열
+    """
+    raw = f"{created_at.isoformat()}{_SEPARATOR}{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """``encode_cursor()`` 가 만든 커서를 정렬 키로 되돌린다.
+
+    Args:
+        cursor: 커서 문자열
+
+    Returns:
+        ``(created_at, id)`` 튜플
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, id = raw.split(_SEPARATOR, 1)
+        return datetime.fromisoformat(created_at), id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"잘못된 커서: {cursor!r}") from e
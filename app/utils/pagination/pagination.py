@@ -21,7 +21,6 @@ Example:
 
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass, field
 from typing import Generic, TypeVar
 
@@ -69,7 +68,8 @@ class Pagination(Generic[T]):
         Returns:
             파생 필드(total_pages/has_next/has_prev)가 채워진 ``Pagination`` 인스턴스.
         """
-        total_pages = math.ceil(total / page_size) if total > 0 and page_size > 0 else 1
+        # 정수 올림 나눗셈 — float 변환 없이 계산해 아주 큰 total 도 정확하다
+        total_pages = -(-total // page_size) if total > 0 and page_size > 0 else 1
         return cls(
             items=list(items),
             total=total,
@@ -15,20 +15,70 @@
     3. Field의 default 값
 """
 
+import threading
+from collections.abc import Mapping
 from datetime import datetime
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import quote
 from zoneinfo import ZoneInfo
 
+from dotenv import dotenv_values
 from pydantic import Field, model_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+from pydantic_settings.sources.utils import parse_env_vars
+from sqlalchemy.engine import URL
+
+# 설정 블록이 공유하는 .env 파일 (현재 작업 디렉터리 기준)
+ENV_FILE = Path(".env")
+
+
+@lru_cache(maxsize=1)
+def _dotenv_vars() -> Mapping[str, str | None]:
+    """
+    .env 를 처음 필요할 때 한 번만 파싱합니다 (파일이 없으면 빈 매핑).
+
+    값은 설정 객체에만 전달하고 os.environ 에는 올리지 않습니다. 비밀번호 같은 값이
+    프로세스 전체와 자식 프로세스(celery 워커 등)로 새지 않게 하기 위함입니다.
+    """
+    if not ENV_FILE.is_file():
+        return {}
+    return parse_env_vars(dotenv_values(ENV_FILE, encoding="utf-8"))
+
+
+class _EnvFileSettings(BaseSettings):
+    """
+    한 번 파싱한 .env 값을 공유하는 설정 기반 클래스
+
+    클래스마다 ``env_file`` 을 두면 pydantic-settings 가 설정 블록을 만들 때마다 같은
+    파일을 다시 파싱하므로, 기본 dotenv 소스에 ``_dotenv_vars()`` 결과를 넣어 줍니다.
+    ``_env_file`` 을 직접 넘기면 (예: ``_env_file=()`` 로 .env 무시) 그 값을 따릅니다.
+    """
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        if isinstance(dotenv_settings, DotEnvSettingsSource) and dotenv_settings.env_file is None:
+            dotenv_settings.env_vars = _dotenv_vars()
+        return init_settings, env_settings, dotenv_settings, file_secret_settings
 
 
 # =============================================================================
 # 타임존 설정
 # =============================================================================
-class TimezoneSettings(BaseSettings):
+class TimezoneSettings(_EnvFileSettings):
     """
     타임존 설정
 
@@ -36,11 +86,7 @@ class TimezoneSettings(BaseSettings):
     로그 시간, 데이터 생성 시간 등에 적용됩니다.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
     # 타임존 문자열 (예: Asia/Seoul, UTC, America/New_York)
     TIME_ZONE: str = Field(
@@ -48,9 +94,9 @@ class TimezoneSettings(BaseSettings):
         description="애플리케이션 전역 타임존",
     )
 
-    @property
+    @cached_property
     def tz(self) -> ZoneInfo:
-        """ZoneInfo 객체 반환"""
+        """ZoneInfo 객체 반환 (처음 읽을 때 한 번 만들고 인스턴스 속성으로 재사용)"""
         return ZoneInfo(self.TIME_ZONE)
 
     def now(self) -> datetime:
@@ -89,7 +135,7 @@ Router → Service → Repository → Database
 ### 기술 스택
 
 - **FastAPI**: 고성능 비동기 웹 프레임워크
-- **SQLAlchemy 2.0**: 비동기 ORM (aiomysql)
+- **SQLAlchemy 2.0**: 비동기 ORM (asyncmy)
 - **Pydantic v2**: 데이터 검증 및 설정 관리
 - **Scalar**: API 문서 UI
 
@@ -105,18 +151,14 @@ Router → Service → Repository → Database
 # =============================================================================
 # 기본 설정
 # =============================================================================
-class AppSettings(BaseSettings):
+class AppSettings(_EnvFileSettings):
     """
     애플리케이션 기본 설정
 
     프로젝트 메타데이터와 전역 동작 모드를 관리합니다.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
     # 프로젝트 이름 (Scalar 문서 제목, 관리자 페이지 제목)
     PROJECT_NAME: str = Field(
@@ -176,18 +218,6 @@ class AppSettings(BaseSettings):
 # =============================================================================
 # 데이터베이스 설정
 # =============================================================================
-def format_host(host: str) -> str:
-    """DSN 에 넣을 호스트 표기를 만든다.
-
-    IP(IPv4)·도메인은 그대로 두고, IPv6 만 대괄호로 감싼다. 감싸지 않으면 주소 안의
-    콜론과 포트 구분자가 뒤섞여 ``@::1:3306`` 같은 깨진 DSN 이 만들어진다.
-    """
-    host = host.strip()
-    if host.startswith("["):  # 이미 대괄호 표기
-        return host
-    return f"[{host}]" if ":" in host else host
-
-
 def split_host_port(entry: str, default_port: int) -> tuple[str, int]:
     """``"host"`` / ``"host:port"`` 항목을 (호스트, 포트)로 분해한다.
 
@@ -227,7 +257,7 @@ def split_host_port(entry: str, default_port: int) -> tuple[str, int]:
 def mask_dsn(url: str) -> str:
     """DSN 의 비밀번호를 가린다 (로그·헬스체크 노출용).
 
-    예: ``mysql+aiomysql://app:s3cr3t@db:3306/shop`` → ``mysql+aiomysql://app:***@db:3306/shop``
+    예: ``mysql+asyncmy://app:s3cr3t@db:3306/shop`` → ``mysql+asyncmy://app:***@db:3306/shop``
     """
     scheme, separator, rest = url.partition("://")
     if not separator or "@" not in rest:
@@ -239,11 +269,35 @@ def mask_dsn(url: str) -> str:
     return f"{scheme}://{user}:***@{location}"
 
 
-class DatabaseSettings(BaseSettings):
+# 접속 문자셋 (이모지 등 4바이트 UTF-8 지원). 모든 MySQL DSN 의 쿼리로 붙인다.
+MYSQL_CHARSET = "utf8mb4"
+
+
+def mysql_dsn(user: str, password: str, host: str, port: int, database: str) -> str:
+    """asyncmy DSN 문자열을 만든다.
+
+    ``URL.create`` 로 조립하므로 비밀번호의 ``@`` · ``/`` 같은 예약 문자는 퍼센트
+    인코딩되고, IPv6 호스트는 대괄호로 감싸진다(``@::1:3306`` 같은 깨진 DSN 방지).
+    호스트는 대괄호 표기(``[::1]``)로 줘도 된다.
+    """
+    return URL.create(
+        "mysql+asyncmy",
+        username=user,
+        password=password,
+        host=host.strip().strip("[]"),
+        port=port,
+        database=database,
+        query={"charset": MYSQL_CHARSET},
+    ).render_as_string(hide_password=False)
+
+
+class DatabaseSettings(_EnvFileSettings):
     """
     데이터베이스 연결 설정
 
-    MySQL 비동기 연결을 위한 aiomysql 드라이버를 사용합니다.
+    MySQL 비동기 연결에는 asyncmy 드라이버를 사용합니다 (aiomysql 과 같은 프로토콜을
+    구현하지만 패킷 파싱이 Cython 으로 되어 있어 행 디코딩 비용이 작다).
+    문자셋은 드라이버와 무관하게 같게 적용되도록 URL 쿼리(``?charset=utf8mb4``)로 고정한다.
 
     읽기/쓰기 분리(DB 라우터):
         DB_ROUTER_ENABLED=false  → 단일 서버. 모든 쿼리가 primary 로 간다(기본값).
@@ -254,11 +308,7 @@ class DatabaseSettings(BaseSettings):
     라우팅 구현은 ``app/core/db/router.py`` 를 참고하세요.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
     # === primary(쓰기) 서버 ===
     # MySQL 서버 호스트 (IP 또는 도메인)
@@ -291,6 +341,51 @@ class DatabaseSettings(BaseSettings):
         description="데이터베이스 이름",
     )
 
+    # === 커넥션 풀 크기 ===
+    # 비동기 드라이버는 적은 커넥션으로도 DB 를 포화시키므로 풀을 작게 잡는다.
+    # 풀이 크면 DB 측 스레드 전환만 늘어 p99 가 나빠진다. 요청용 풀(primary 와
+    # replica 각각)과 백그라운드 풀을 따로 설정한다.
+    DB_POOL_SIZE: int = Field(
+        default=10,
+        ge=1,
+        description="요청용 엔진의 기본 유지 커넥션 수",
+    )
+    DB_MAX_OVERFLOW: int = Field(
+        default=10,
+        ge=0,
+        description="요청용 엔진의 추가 허용 커넥션 수",
+    )
+    DB_BACKGROUND_POOL_SIZE: int = Field(
+        default=4,
+        ge=1,
+        description="백그라운드 엔진의 기본 유지 커넥션 수",
+    )
+    DB_BACKGROUND_MAX_OVERFLOW: int = Field(
+        default=4,
+        ge=0,
+        description="백그라운드 엔진의 추가 허용 커넥션 수",
+    )
+
+    # === 쿼리 컴파일 캐시 ===
+    # 엔진마다 두는 컴파일된 SQL 캐시(SQLAlchemy query_cache_size)의 항목 수.
+    # 같은 구조의 구문은 한 번만 SQL 문자열로 컴파일하고 이후에는 캐시를 재사용한다.
+    # 모델 수 × Repository 메서드 × 로딩 옵션 조합이 기본값(500)을 넘으면 캐시가
+    # 계속 밀려나 요청마다 재컴파일되므로 넉넉하게 잡는다.
+    DB_QUERY_CACHE_SIZE: int = Field(
+        default=1200,
+        ge=0,
+        description="엔진별 컴파일된 SQL 캐시 크기 (0 이면 비활성)",
+    )
+
+    # === 커넥션 생존 확인 ===
+    # 요청용 엔진은 체크아웃마다 ping 하지 않고, 이 시간(초)보다 오래 놀던 커넥션만
+    # ping 한다 (방금 반납된 커넥션은 살아 있다고 간주). 0 이면 매번 ping.
+    DB_POOL_PING_IDLE_SECONDS: float = Field(
+        default=0.5,
+        ge=0,
+        description="체크아웃 시 ping 을 생략할 최근 사용 구간 (초)",
+    )
+
     # === DB 라우터 (읽기/쓰기 분리) ===
     # 라우터 사용 여부. false 면 세션이 단일 엔진에 직접 바인딩된다(기존 동작).
     DB_ROUTER_ENABLED: bool = Field(
@@ -355,23 +450,27 @@ class DatabaseSettings(BaseSettings):
     def ALEMBIC_URL(self) -> str:
         """Alembic 마이그레이션이 사용할 동기 DSN.
 
-        Alembic 은 동기로 실행되므로 aiomysql(비동기 드라이버)을 쓸 수 없다.
+        Alembic 은 동기로 실행되므로 asyncmy(비동기 드라이버)를 쓸 수 없다.
         primary DSN 의 드라이버만 pymysql 로 바꿔서 같은 서버를 가리킨다.
         마이그레이션은 항상 primary 에서 실행한다 — replica 는 읽기 전용이다.
         """
         if self.ALEMBIC_DATABASE_URL:
             return self.ALEMBIC_DATABASE_URL
-        return self.MYSQL_WRITER_URL.replace("+aiomysql", "+pymysql")
+        return self.MYSQL_WRITER_URL.replace("+asyncmy", "+pymysql")
 
-    @property
+    @cached_property
     def MYSQL_URL(self) -> str:
-        """SQLAlchemy 비동기 연결 URL (aiomysql 드라이버) — primary(쓰기) 서버
+        """SQLAlchemy 비동기 연결 URL (asyncmy 드라이버) — primary(쓰기) 서버
 
         호스트는 IP·도메인 모두 가능하다 (IPv6 는 자동으로 대괄호 처리).
+        설정은 기동 후 바뀌지 않으므로 처음 읽을 때 한 번만 조립한다.
         """
-        return (
-            f"mysql+aiomysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}"
-            f"@{format_host(self.MYSQL_HOST)}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
+        return mysql_dsn(
+            self.MYSQL_USER,
+            self.MYSQL_PASSWORD,
+            self.MYSQL_HOST,
+            self.MYSQL_PORT,
+            self.MYSQL_DATABASE,
         )
 
     @property
@@ -384,7 +483,7 @@ class DatabaseSettings(BaseSettings):
         """공백을 정리한 유효 replica 항목만 추린다."""
         return [entry.strip() for entry in self.MYSQL_REPLICA_HOSTS if entry.strip()]
 
-    @property
+    @cached_property
     def MYSQL_REPLICA_URLS(self) -> list[str]:
         """replica(읽기) 서버 URL 목록. 복제가 비활성이면 빈 목록."""
         if not self.replication_active:
@@ -394,11 +493,10 @@ class DatabaseSettings(BaseSettings):
         password = self.MYSQL_REPLICA_PASSWORD or self.MYSQL_PASSWORD
         database = self.MYSQL_REPLICA_DATABASE or self.MYSQL_DATABASE
 
-        urls = []
-        for entry in self._replica_entries:
-            host, port = split_host_port(entry, self.MYSQL_REPLICA_PORT)
-            urls.append(f"mysql+aiomysql://{user}:{password}@{host}:{port}/{database}")
-        return urls
+        return [
+            mysql_dsn(user, password, *split_host_port(entry, self.MYSQL_REPLICA_PORT), database)
+            for entry in self._replica_entries
+        ]
 
     @property
     def replication_active(self) -> bool:
@@ -456,18 +554,14 @@ class DatabaseSettings(BaseSettings):
 # =============================================================================
 # CORS 설정
 # =============================================================================
-class CORSSettings(BaseSettings):
+class CORSSettings(_EnvFileSettings):
     """
     CORS (Cross-Origin Resource Sharing) 설정
 
     프론트엔드와 백엔드가 다른 도메인에서 실행될 때 필요합니다.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
     # 허용할 Origin 목록 (["*"]는 모든 Origin 허용)
     CORS_ALLOW_ORIGINS: list[str] = Field(
@@ -526,7 +620,7 @@ class CORSSettings(BaseSettings):
 # =============================================================================
 # 로깅 설정
 # =============================================================================
-class LogSettings(BaseSettings):
+class LogSettings(_EnvFileSettings):
     """
     로깅 설정
 
@@ -541,11 +635,7 @@ class LogSettings(BaseSettings):
         - CRITICAL: 심각한 문제
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
     # === 출력 대상 설정 ===
     # 콘솔(stdout) 로그 출력 활성화
@@ -613,13 +703,13 @@ class LogSettings(BaseSettings):
     # === 포맷 설정 ===
     # 콘솔 로그 출력 형식
     LOG_CONSOLE_FORMAT: str = Field(
-        default="[{asctime}] {levelname:8} [{name}:{funcName}:{lineno}] {message}",
+        default="[%(asctime)s] %(levelname)-8s [%(name)s:%(funcName)s:%(lineno)d] %(message)s",
         description="콘솔 로그 포맷",
     )
 
     # 파일 로그 출력 형식
     LOG_FILE_FORMAT: str = Field(
-        default="[{asctime}] {levelname:8} [{name}:{funcName}:{lineno}] {message}",
+        default="[%(asctime)s] %(levelname)-8s [%(name)s:%(funcName)s:%(lineno)d] %(message)s",
         description="파일 로그 포맷",
     )
 
@@ -661,18 +751,14 @@ class LogSettings(BaseSettings):
 # =============================================================================
 # 미들웨어 설정
 # =============================================================================
-class MiddlewareSettings(BaseSettings):
+class MiddlewareSettings(_EnvFileSettings):
     """
     미들웨어 설정
 
     접속 로그 수집 등 미들웨어 관련 설정을 관리합니다.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
     # 접속 로그 수집 활성화
     ACCESS_LOG_ENABLED: bool = Field(
@@ -683,7 +769,7 @@ class MiddlewareSettings(BaseSettings):
     # 접속 로그 수집 제외 경로
     ACCESS_LOG_EXCLUDE_PATHS: list[str] = Field(
         default=["/health", "/docs", "/redoc", "/openapi.json", "/favicon.ico"],
-        description="로그 수집 제외 경로",
+        description="로그 수집 제외 경로 (정확히 일치, '/*' 로 끝나면 하위 경로 전체)",
     )
 
     # 접속 로그 수집 제외 확장자
@@ -692,6 +778,27 @@ class MiddlewareSettings(BaseSettings):
         description="로그 수집 제외 확장자",
     )
 
+    # 접속 로그 통계 집계 테이블 갱신 주기 (Celery beat, 0 이면 주기 갱신 안 함)
+    ACCESS_LOG_STATS_REFRESH_SECONDS: int = Field(
+        default=300,
+        ge=0,
+        description="접속 로그 통계 집계 테이블 갱신 주기(초, 0=비활성)",
+    )
+
+    # /access-logs/stats 응답의 프로세스 로컬 캐시 TTL (0 이면 캐시 안 함)
+    ACCESS_LOG_STATS_CACHE_SECONDS: int = Field(
+        default=30,
+        ge=0,
+        description="접속 로그 통계 응답 캐시 TTL(초, 0=비활성)",
+    )
+
+    # /access-logs 전체 개수(COUNT)의 프로세스 로컬 캐시 TTL (0 이면 캐시 안 함)
+    ACCESS_LOG_COUNT_CACHE_SECONDS: int = Field(
+        default=2,
+        ge=0,
+        description="접속 로그 목록 전체 개수 캐시 TTL(초, 0=비활성)",
+    )
+
     # 레이트 리밋(slowapi) 활성화
     RATE_LIMIT_ENABLED: bool = Field(
         default=True,
@@ -708,18 +815,14 @@ class MiddlewareSettings(BaseSettings):
 # =============================================================================
 # Redis 설정
 # =============================================================================
-class RedisSettings(BaseSettings):
+class RedisSettings(_EnvFileSettings):
     """
     Redis 연결 설정
 
     캐시, 세션, 메시지 큐 등에 사용됩니다.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
     # Redis 서버 호스트
     REDIS_HOST: str = Field(
@@ -745,29 +848,26 @@ class RedisSettings(BaseSettings):
         description="Redis 비밀번호",
     )
 
-    @property
+    @cached_property
     def REDIS_URL(self) -> str:
-        """Redis 연결 URL"""
+        """Redis 연결 URL (처음 읽을 때 한 번 만들고 재사용, 비밀번호는 퍼센트 인코딩)"""
         if self.REDIS_PASSWORD:
-            return f"redis://:{self.REDIS_PASSWORD}@{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
+            password = quote(self.REDIS_PASSWORD, safe="")
+            return f"redis://:{password}@{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
         return f"redis://{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB}"
 
 
 # =============================================================================
 # JWT 인증 설정
 # =============================================================================
-class JWTSettings(BaseSettings):
+class JWTSettings(_EnvFileSettings):
     """JWT 토큰(access/refresh) 설정.
 
     OAuth2 password flow 기반 인증에 사용됩니다.
     비밀 키는 운영 환경에서 반드시 안전한 값으로 교체하세요.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
     # Access Token 서명 키
     ACCESS_TOKEN_SECRET_KEY: str = Field(
@@ -799,14 +899,10 @@ class JWTSettings(BaseSettings):
 # =============================================================================
 # API 설정
 # =============================================================================
-class ApiSettings(BaseSettings):
+class ApiSettings(_EnvFileSettings):
     """REST API 관련 설정."""
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
     # REST API 버전 (URL prefix 에 사용: /api/v1/...)
     API_VERSION: str = Field(
@@ -818,7 +914,7 @@ class ApiSettings(BaseSettings):
 # =============================================================================
 # 세션 설정
 # =============================================================================
-class SessionSettings(BaseSettings):
+class SessionSettings(_EnvFileSettings):
     """세션 쿠키 설정.
 
     Note:
@@ -827,11 +923,7 @@ class SessionSettings(BaseSettings):
         있으므로 config 가 로드해 둔다(설정의 단일 출처 유지).
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
     # 세션 쿠키 이름
     SESSION_COOKIE_NAME: str = Field(
@@ -855,7 +947,7 @@ class SessionSettings(BaseSettings):
 # =============================================================================
 # SMTP 이메일 설정
 # =============================================================================
-class SMTPSettings(BaseSettings):
+class SMTPSettings(_EnvFileSettings):
     """이메일 발송(SMTP) 설정.
 
     Note:
@@ -863,11 +955,7 @@ class SMTPSettings(BaseSettings):
         구현할 때 `from config import smtp_settings` 로 가져다 쓴다.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
     # SMTP 서버 주소 (로컬 개발: localhost, Gmail: smtp.gmail.com)
     SMTP_SERVER: str = Field(
@@ -931,18 +1019,14 @@ class SMTPSettings(BaseSettings):
 # =============================================================================
 # 이미지 업로드 설정
 # =============================================================================
-class UploadSettings(BaseSettings):
+class UploadSettings(_EnvFileSettings):
     """파일·이미지 업로드 설정.
 
     Note:
         업로드 핸들러는 아직 없다. 설정만 config 에 로드해 둔다.
     """
 
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-    )
+    model_config = SettingsConfigDict(extra="ignore")
 
     # 업로드 파일 저장 경로 (프로젝트 루트 기준 상대 경로)
     UPLOAD_DIR: str = Field(
@@ -990,94 +1074,118 @@ class UploadSettings(BaseSettings):
 
 
 # =============================================================================
-# 설정 인스턴스 팩토리 (싱글톤)
+# 전역 설정 인스턴스 (싱글톤, 첫 접근 시 생성)
+# =============================================================================
+# 예: from config import app_settings
+# 모듈 import 만으로는 아무 설정도 만들지 않는다. `*_settings` 를 처음 읽을 때
+# 모듈 __getattr__ (PEP 562) 가 해당 블록만 만들어 모듈 전역에 넣으므로, 이후
+# 접근은 일반 전역 조회로 끝나고 쓰지 않는 블록은 .env 파싱·검증 비용이 없다.
+_SETTINGS_CLASSES: dict[str, type[BaseSettings]] = {
+    "timezone_settings": TimezoneSettings,
+    "app_settings": AppSettings,
+    "db_settings": DatabaseSettings,
+    "cors_settings": CORSSettings,
+    "log_settings": LogSettings,
+    "redis_settings": RedisSettings,
+    "middleware_settings": MiddlewareSettings,
+    "jwt_settings": JWTSettings,
+    "api_settings": ApiSettings,
+    "session_settings": SessionSettings,
+    "smtp_settings": SMTPSettings,
+    "upload_settings": UploadSettings,
+}
+_settings_lock = threading.Lock()
+
+if TYPE_CHECKING:
+    timezone_settings: TimezoneSettings
+    app_settings: AppSettings
+    db_settings: DatabaseSettings
+    cors_settings: CORSSettings
+    log_settings: LogSettings
+    redis_settings: RedisSettings
+    middleware_settings: MiddlewareSettings
+    jwt_settings: JWTSettings
+    api_settings: ApiSettings
+    session_settings: SessionSettings
+    smtp_settings: SMTPSettings
+    upload_settings: UploadSettings
+
+
+def _load_settings(name: str) -> Any:
+    """``name`` 설정 인스턴스를 만들어 모듈 전역에 넣고 반환 (이미 있으면 그대로)."""
+    with _settings_lock:
+        instance = globals().get(name)
+        if instance is None:
+            instance = globals()[name] = _SETTINGS_CLASSES[name]()
+        return instance
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SETTINGS_CLASSES:
+        return _load_settings(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# =============================================================================
+# 의존성 주입용 getter
 # =============================================================================
-@lru_cache
+# Depends(get_app_settings) 처럼 호출 가능한 객체가 필요한 곳용 (테스트는
+# dependency_overrides 로 교체). 처음 호출하면 해당 설정 인스턴스를 만든다.
 def get_timezone_settings() -> TimezoneSettings:
-    """타임존 설정 인스턴스 반환 (캐싱)"""
-    return TimezoneSettings()
+    """타임존 설정 인스턴스 반환"""
+    return _load_settings("timezone_settings")
 
 
-@lru_cache
 def get_app_settings() -> AppSettings:
-    """앱 설정 인스턴스 반환 (캐싱)"""
-    return AppSettings()
+    """앱 설정 인스턴스 반환"""
+    return _load_settings("app_settings")
 
 
-@lru_cache
 def get_db_settings() -> DatabaseSettings:
-    """DB 설정 인스턴스 반환 (캐싱)"""
-    return DatabaseSettings()
+    """DB 설정 인스턴스 반환"""
+    return _load_settings("db_settings")
 
 
-@lru_cache
 def get_cors_settings() -> CORSSettings:
-    """CORS 설정 인스턴스 반환 (캐싱)"""
-    return CORSSettings()
+    """CORS 설정 인스턴스 반환"""
+    return _load_settings("cors_settings")
 
 
-@lru_cache
 def get_log_settings() -> LogSettings:
-    """로그 설정 인스턴스 반환 (캐싱)"""
-    return LogSettings()
+    """로그 설정 인스턴스 반환"""
+    return _load_settings("log_settings")
 
 
-@lru_cache
 def get_redis_settings() -> RedisSettings:
-    """Redis 설정 인스턴스 반환 (캐싱)"""
-    return RedisSettings()
+    """Redis 설정 인스턴스 반환"""
+    return _load_settings("redis_settings")
 
 
-@lru_cache
 def get_middleware_settings() -> MiddlewareSettings:
-    """미들웨어 설정 인스턴스 반환 (캐싱)"""
-    return MiddlewareSettings()
+    """미들웨어 설정 인스턴스 반환"""
+    return _load_settings("middleware_settings")
 
 
-@lru_cache
 def get_jwt_settings() -> JWTSettings:
-    """JWT 설정 인스턴스 반환 (캐싱)"""
-    return JWTSettings()
+    """JWT 설정 인스턴스 반환"""
+    return _load_settings("jwt_settings")
 
 
-@lru_cache
 def get_api_settings() -> ApiSettings:
-    """API 설정 인스턴스 반환 (캐싱)"""
-    return ApiSettings()
+    """API 설정 인스턴스 반환"""
+    return _load_settings("api_settings")
 
 
-@lru_cache
 def get_session_settings() -> SessionSettings:
-    """세션 설정 인스턴스 반환 (캐싱)"""
-    return SessionSettings()
+    """세션 설정 인스턴스 반환"""
+    return _load_settings("session_settings")
 
 
-@lru_cache
 def get_smtp_settings() -> SMTPSettings:
-    """SMTP 설정 인스턴스 반환 (캐싱)"""
-    return SMTPSettings()
+    """SMTP 설정 인스턴스 반환"""
+    return _load_settings("smtp_settings")
 
 
-@lru_cache
 def get_upload_settings() -> UploadSettings:
-    """업로드 설정 인스턴스 반환 (캐싱)"""
-    return UploadSettings()
-
-
-# =============================================================================
-# 편의를 위한 전역 설정 인스턴스
-# =============================================================================
-# 모듈 import 시 바로 사용 가능한 설정 인스턴스
-# 예: from config import app_settings
-timezone_settings = get_timezone_settings()
-app_settings = get_app_settings()
-db_settings = get_db_settings()
-cors_settings = get_cors_settings()
-log_settings = get_log_settings()
-redis_settings = get_redis_settings()
-middleware_settings = get_middleware_settings()
-jwt_settings = get_jwt_settings()
-api_settings = get_api_settings()
-session_settings = get_session_settings()
-smtp_settings = get_smtp_settings()
-upload_settings = get_upload_settings()
+    """업로드 설정 인스턴스 반환"""
+    return _load_settings("upload_settings")
@@ -4,21 +4,24 @@
 최종 취합하고, 애플리케이션의 주요 설정(미들웨어·예외 핸들러·문서·lifespan·Admin)을 구성한다.
 """
 
+import asyncio
+import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from scalar_fastapi import get_scalar_api_reference
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from app.core.db.session import create_db_tables, dispose_engine, engine
-from app.core.exception import AppException, ErrorResponse, ValidationException
-from app.core.middlewares.background_tasks import access_log_tasks
+from app.core.db.session import background_engine, create_db_tables, dispose_engine
+from app.core.exception import AppException, ValidationException
+from app.core.middlewares.access_log_batcher import access_log_batcher
 from app.core.middlewares.cors_middleware import CustomCORSMiddleware
 from app.core.middlewares.user_info_middleware import setup_user_info_middleware
 from app.core.rate_limit import limiter
@@ -41,11 +44,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     시작 시:
         - DEBUG=True: 데이터베이스 테이블 자동 생성 (개발 환경용)
         - DEBUG=False: 테이블 생성 건너뜀 (운영 환경은 Alembic 사용)
+        - 접속로그 배치 수집기 시작
 
     종료 시:
+        - 접속로그 큐 flush 후 수집기 정리
         - 데이터베이스 엔진 리소스 정리
     """
     logger.info("[Startup] 애플리케이션 시작 (DEBUG=%s)", app_settings.DEBUG)
+    # uvicorn[standard] 는 uvloop 가 설치돼 있으면 자동 선택한다(Windows 제외) — 실제 루프를 남긴다
+    loop_type = type(asyncio.get_running_loop())
+    logger.info("[Startup] 이벤트 루프: %s.%s", loop_type.__module__, loop_type.__qualname__)
 
     # DEBUG 모드일 때만 테이블 자동 생성
     # 운영 환경에서는 Alembic 마이그레이션 사용 권장
@@ -59,40 +67,57 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     else:
         logger.info("[Startup] 테이블 자동 생성 건너뜀 (DEBUG=False, Alembic 사용)")
 
+    access_log_batcher.start()
+
     yield
 
     logger.info("[Shutdown] 애플리케이션 종료 시작")
-    # 엔진 정리 전에 진행 중인 백그라운드 로그 태스크를 drain (W1) —
+    # 엔진 정리 전에 접속로그 큐를 flush (W1) —
     # dispose 와의 경합으로 인한 마지막 로그 유실을 줄인다.
-    await access_log_tasks.drain()
+    await access_log_batcher.stop()
     await dispose_engine()
     logger.info("[Shutdown] 애플리케이션 종료 완료")
 
 
+@lru_cache(maxsize=128)
+def _http_error_body(status_code: int, message: str) -> bytes:
+    """HTTP 예외 응답 본문을 (상태 코드, 메시지)별로 한 번만 직렬화합니다.
+
+    404/405 처럼 봇 스캔으로 몰리는 응답은 대부분 같은 기본 문구라 바이트를 재사용한다.
+    """
+    return orjson.dumps({"error_code": f"HTTP_{status_code}", "message": message, "detail": None})
+
+
 def _register_exception_handlers(app: FastAPI) -> None:
     """4가지 글로벌 예외 핸들러를 등록합니다."""
 
     @app.exception_handler(AppException)
-    async def app_exception_handler(request: Request, exc: AppException) -> ORJSONResponse:
+    async def app_exception_handler(request: Request, exc: AppException) -> Response:
         """
         애플리케이션 커스텀 예외 핸들러
 
         AppException 및 하위 예외들을 처리하여 일관된 에러 응답을 반환합니다.
+        기본 메시지 그대로인 예외는 클래스별로 미리 직렬화한 본문을 그대로 보냅니다.
         """
-        logger.error(
-            "[AppException] %s: %s",
-            exc.error_code,
-            exc.message,
-            extra={
-                "path": request.url.path,
-                "method": request.method,
-                "error_code": exc.error_code,
-                "detail": exc.detail,
-            },
-        )
+        # 레벨에서 걸러지면 extra dict 도 만들지 않는다 (path 는 URL 객체 대신 scope 에서 읽음)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "[AppException] %s: %s",
+                exc.error_code,
+                exc.message,
+                extra={
+                    "path": request.scope["path"],
+                    "method": request.method,
+                    "error_code": exc.error_code,
+                    "detail": exc.detail,
+                },
+            )
+        body = exc.cached_body()
+        if body is not None:
+            return Response(body, status_code=exc.status_code, media_type="application/json")
         return ORJSONResponse(
             status_code=exc.status_code,
-            content=exc.to_response().model_dump(),
+            content=exc.to_dict(),
         )
 
     @app.exception_handler(RequestValidationError)
@@ -104,58 +129,59 @@ def _register_exception_handlers(app: FastAPI) -> None:
 
         Pydantic 유효성 검증 실패 시 일관된 에러 응답을 반환합니다.
         """
-        errors = exc.errors()
+        # field 는 클라이언트 계약(점 구분 문자열)이라 유지하고, 생성기 대신 map 으로 잇는다
         detail = [
             {
-                "field": ".".join(str(loc) for loc in error["loc"]),
+                "field": ".".join(map(str, error["loc"])),
                 "message": error["msg"],
                 "type": error["type"],
             }
-            for error in errors
+            for error in exc.errors()
         ]
-        logger.warning(
-            "[ValidationError] 요청 유효성 검증 실패",
-            extra={
-                "path": request.url.path,
-                "method": request.method,
-                "errors": detail,
-            },
-        )
-        validation_exc = ValidationException(
-            message="요청 데이터 유효성 검증에 실패했습니다.",
-            detail=detail,
-        )
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "[ValidationError] 요청 유효성 검증 실패",
+                extra={
+                    "path": request.scope["path"],
+                    "method": request.method,
+                    "errors": detail,
+                },
+            )
+        # 응답 dict 만 필요하므로 ValidationException 인스턴스를 만들지 않고 바로 채운다
         return ORJSONResponse(
-            status_code=validation_exc.status_code,
-            content=validation_exc.to_response().model_dump(),
+            status_code=ValidationException.status_code,
+            content={
+                "error_code": ValidationException.error_code,
+                "message": "요청 데이터 유효성 검증에 실패했습니다.",
+                "detail": detail,
+            },
         )
 
     @app.exception_handler(StarletteHTTPException)
-    async def http_exception_handler(
-        request: Request, exc: StarletteHTTPException
-    ) -> ORJSONResponse:
+    async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
         """
         HTTP 예외 핸들러
 
         FastAPI/Starlette의 기본 HTTP 예외를 일관된 형식으로 변환합니다.
+        예외의 헤더(405 의 Allow, 401 의 WWW-Authenticate 등)는 그대로 전달합니다.
         """
-        logger.warning(
-            "[HTTPException] %s: %s",
-            exc.status_code,
-            exc.detail,
-            extra={
-                "path": request.url.path,
-                "method": request.method,
-                "status_code": exc.status_code,
-            },
-        )
-        return ORJSONResponse(
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "[HTTPException] %s: %s",
+                exc.status_code,
+                exc.detail,
+                extra={
+                    "path": request.scope["path"],
+                    "method": request.method,
+                    "status_code": exc.status_code,
+                },
+            )
+        message = str(exc.detail) if exc.detail else "HTTP 오류가 발생했습니다."
+        return Response(
+            _http_error_body(exc.status_code, message),
             status_code=exc.status_code,
-            content=ErrorResponse(
-                error_code=f"HTTP_{exc.status_code}",
-                message=str(exc.detail) if exc.detail else "HTTP 오류가 발생했습니다.",
-                detail=None,
-            ).model_dump(),
+            headers=exc.headers,
+            media_type="application/json",
         )
 
     @app.exception_handler(Exception)
@@ -166,24 +192,25 @@ def _register_exception_handlers(app: FastAPI) -> None:
         처리되지 않은 모든 예외를 캐치하여 500 에러 응답을 반환합니다.
         운영 환경에서는 상세 정보를 숨깁니다.
         """
-        logger.exception(
-            "[UnhandledException] %s",
-            type(exc).__name__,
-            extra={
-                "path": request.url.path,
-                "method": request.method,
-                "exception_type": type(exc).__name__,
-            },
-        )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.exception(
+                "[UnhandledException] %s",
+                type(exc).__name__,
+                extra={
+                    "path": request.scope["path"],
+                    "method": request.method,
+                    "exception_type": type(exc).__name__,
+                },
+            )
         # DEBUG 모드에서만 상세 정보 노출 (운영 환경에서는 민감 정보 유출 방지)
         detail = str(exc) if app_settings.DEBUG else None
         return ORJSONResponse(
             status_code=500,
-            content=ErrorResponse(
-                error_code="INTERNAL_SERVER_ERROR",
-                message="내부 서버 오류가 발생했습니다.",
-                detail=detail,
-            ).model_dump(),
+            content={
+                "error_code": "INTERNAL_SERVER_ERROR",
+                "message": "내부 서버 오류가 발생했습니다.",
+                "detail": detail,
+            },
         )
 
 
@@ -196,6 +223,7 @@ class HealthResponse(BaseModel):
 
 def _add_health_and_docs(app: FastAPI) -> None:
     """헬스체크 엔드포인트와 Scalar API 문서를 등록합니다."""
+    health_body = HealthResponse(status="healthy", version=app_settings.VERSION).model_dump_json()
 
     @app.get(
         "/health",
@@ -205,20 +233,22 @@ def _add_health_and_docs(app: FastAPI) -> None:
         description="서버의 정상 동작 여부를 확인합니다.",
         operation_id="healthCheck",
     )
-    async def health_check() -> HealthResponse:
+    async def health_check() -> Response:
         """
         헬스체크 엔드포인트
 
+        프로브가 자주 호출하므로 프로세스 동안 변하지 않는 본문을 미리 직렬화해 둔다
+        (response_model 은 문서화용 — Response 를 직접 반환하면 검증·직렬화를 건너뛴다).
+
         Returns:
             서버 상태 정보
         """
-        return HealthResponse(
-            status="healthy",
-            version=app_settings.VERSION,
-        )
+        return Response(health_body, media_type="application/json")
 
     # Scalar API 문서 (DEBUG 모드에서만 활성화)
     if app_settings.DEBUG:
+        # 문서 화면은 DEBUG 에서만 쓰므로 운영 프로세스는 scalar_fastapi 를 import 하지 않는다
+        from scalar_fastapi import get_scalar_api_reference
 
         @app.get("/docs", include_in_schema=False)
         async def scalar_docs():
@@ -279,10 +309,12 @@ logger.info("registered %d app routers", len(APPS))
 _add_health_and_docs(app)
 
 # SQLAdmin 관리자 페이지 (ADMIN 설정에 따라 활성화)
+# 관리자 화면은 백그라운드 풀을 함께 쓴다 — 무거운 목록/내보내기 쿼리가 API 요청
+# 풀을 점유하지 않으면서, 관리자 전용 풀을 따로 두지도 않는다.
 if app_settings.ADMIN:
     from sqladmin import Admin
 
-    admin = Admin(app, engine, title=f"{app_settings.PROJECT_NAME} Admin")
+    admin = Admin(app, background_engine, title=f"{app_settings.PROJECT_NAME} Admin")
     for _app in APPS:
         for view in getattr(_app, "admin_views", []):
             admin.add_view(view)
@@ -301,5 +333,8 @@ if __name__ == "__main__":
         host=app_settings.SERVER_HOST,
         port=app_settings.SERVER_PORT,
         reload=app_settings.DEBUG,
+        # auto: uvloop · httptools 가 설치돼 있으면 사용하고, 없으면 asyncio · h11 로 대체
+        loop="auto",
+        http="auto",
         log_config=setup_uvicorn_logging(),
     )
@@ -30,9 +30,10 @@ target_metadata = Base.metadata
 # Resolve the database URL.
 # 환경변수를 직접 읽지 않는다 — 설정은 config.py 가 단독으로 로드한다.
 # db_settings.ALEMBIC_URL 이 ALEMBIC_DATABASE_URL 오버라이드(로컬/CI 의 SQLite 등)와
-# primary DSN 의 동기 드라이버 치환(aiomysql → pymysql)을 모두 처리한다.
+# primary DSN 의 동기 드라이버 치환(asyncmy → pymysql)을 모두 처리한다.
+# 비밀번호의 퍼센트 인코딩(%40 등)은 ConfigParser 보간과 겹치므로 %% 로 이스케이프한다.
 # ---------------------------------------------------------------------------
-config.set_main_option("sqlalchemy.url", db_settings.ALEMBIC_URL)
+config.set_main_option("sqlalchemy.url", db_settings.ALEMBIC_URL.replace("%", "%%"))
 
 
 def run_migrations_offline() -> None:
@@ -0,0 +1,35 @@
+"""replace user_access_logs user_id index with (user_id, created_at)
+
+Revision ID: 3e8a61c4d2f7
+Revises: c7d2e5a1f9b8
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3e8a61c4d2f7'
+down_revision: str | Sequence[str] | None = 'c7d2e5a1f9b8'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema — composite index for per-user newest-first lookups."""
+    op.create_index(
+        'ix_user_access_logs_user_id_created_at',
+        'user_access_logs',
+        ['user_id', 'created_at'],
+        unique=False,
+    )
+    # 복합 인덱스의 선두 컬럼이 user_id 이므로 단일 인덱스는 중복
+    op.drop_index('ix_user_access_logs_user_id', table_name='user_access_logs')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_user_access_logs_user_id', 'user_access_logs', ['user_id'], unique=False)
+    op.drop_index('ix_user_access_logs_user_id_created_at', table_name='user_access_logs')
@@ -0,0 +1,35 @@
+"""add user_access_log_stats rollup table
+
+Revision ID: 5d0c92f6b1a8
+Revises: 9b41d7e0a5c3
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5d0c92f6b1a8'
+down_revision: str | Sequence[str] | None = '9b41d7e0a5c3'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema — pre-aggregated access-log stats read by /access-logs/stats."""
+    op.create_table(
+        'user_access_log_stats',
+        sa.Column('dimension', sa.String(length=20), nullable=False, comment='집계 차원'),
+        sa.Column('value', sa.String(length=50), nullable=False, comment='차원 값'),
+        sa.Column('count', sa.Integer(), nullable=False, comment='접속 수'),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False, comment='집계 시각'),
+        sa.PrimaryKeyConstraint('dimension', 'value'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('user_access_log_stats')
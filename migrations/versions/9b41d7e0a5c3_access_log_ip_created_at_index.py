@@ -0,0 +1,37 @@
+"""replace user_access_logs ip_address index with (ip_address, created_at)
+
+Revision ID: 9b41d7e0a5c3
+Revises: 3e8a61c4d2f7
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9b41d7e0a5c3'
+down_revision: str | Sequence[str] | None = '3e8a61c4d2f7'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema — composite index for per-IP newest-first lookups."""
+    op.create_index(
+        'ix_user_access_logs_ip_created_at',
+        'user_access_logs',
+        ['ip_address', 'created_at'],
+        unique=False,
+    )
+    # 복합 인덱스의 선두 컬럼이 ip_address 이므로 단일 인덱스는 중복
+    op.drop_index('ix_user_access_logs_ip_address', table_name='user_access_logs')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        'ix_user_access_logs_ip_address', 'user_access_logs', ['ip_address'], unique=False
+    )
+    op.drop_index('ix_user_access_logs_ip_created_at', table_name='user_access_logs')
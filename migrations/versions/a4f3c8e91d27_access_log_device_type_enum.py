@@ -0,0 +1,50 @@
+"""store user_access_logs.device_type as ENUM
+
+Revision ID: a4f3c8e91d27
+Revises: 5d0c92f6b1a8
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4f3c8e91d27'
+down_revision: str | Sequence[str] | None = '5d0c92f6b1a8'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+DEVICE_TYPES = ('desktop', 'mobile', 'tablet', 'other')
+
+
+def upgrade() -> None:
+    """Upgrade schema — VARCHAR(20) → ENUM (1 byte per row and index entry).
+
+    Existing rows only hold values written by the access-log middleware
+    (DEVICE_TYPES or NULL), so MySQL converts them in place.
+    """
+    op.alter_column(
+        'user_access_logs',
+        'device_type',
+        type_=sa.Enum(*DEVICE_TYPES, name='device_type'),
+        existing_type=sa.String(length=20),
+        existing_nullable=True,
+        comment='desktop, mobile, tablet, other',
+        existing_comment='desktop, mobile, tablet',
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'user_access_logs',
+        'device_type',
+        type_=sa.String(length=20),
+        existing_type=sa.Enum(*DEVICE_TYPES, name='device_type'),
+        existing_nullable=True,
+        comment='desktop, mobile, tablet',
+        existing_comment='desktop, mobile, tablet, other',
+    )
@@ -0,0 +1,43 @@
+"""add user_access_logs.correlation_id
+
+Revision ID: c7d2e5a1f9b8
+Revises: b2f1a9c0d3e4
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2e5a1f9b8'
+down_revision: str | Sequence[str] | None = 'b2f1a9c0d3e4'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema — add request correlation id to access logs."""
+    op.add_column(
+        'user_access_logs',
+        sa.Column(
+            'correlation_id',
+            sa.String(length=64),
+            nullable=True,
+            comment='요청 상관관계 ID (traceparent trace-id / X-Request-ID)',
+        ),
+    )
+    op.create_index(
+        'ix_user_access_logs_correlation_id',
+        'user_access_logs',
+        ['correlation_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_access_logs_correlation_id', table_name='user_access_logs')
+    op.drop_column('user_access_logs', 'correlation_id')
@@ -0,0 +1,33 @@
+"""drop unused user_access_logs session_id index
+
+Revision ID: e7b2d9c4a1f6
+Revises: a4f3c8e91d27
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2d9c4a1f6'
+down_revision: str | Sequence[str] | None = 'a4f3c8e91d27'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema — no query filters on session_id by equality or prefix.
+
+    The only reader is the admin search, which uses LIKE '%...%' and cannot
+    use a B-tree index, so the index only adds per-INSERT maintenance.
+    """
+    op.drop_index('ix_user_access_logs_session_id', table_name='user_access_logs')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        'ix_user_access_logs_session_id', 'user_access_logs', ['session_id'], unique=False
+    )
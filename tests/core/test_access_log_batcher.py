@@ -0,0 +1,282 @@
+"""AccessLogBatcher 회귀 테스트.
+
+요청마다 세션을 여는 대신 큐에 모아 일괄 저장하는지,
+- 배치 크기 상한을 지키고,
+- 큐가 가득 차면 요청 경로를 막지 않고 드롭·집계하며,
+- 종료 시 남은 큐를 flush 하는지 검증한다.
+"""
+
+import asyncio
+import logging
+
+import pytest
+from sqlalchemy.exc import DataError, OperationalError
+
+from app.core.exception import DatabaseException
+from app.core.middlewares import access_log_batcher as batcher_module
+from app.core.middlewares.access_log_batcher import AccessLogBatcher
+from app.core.middlewares.access_log_record import AccessLogRecord, AccessLogRecordPool
+from app.core.middlewares.access_log_sink import get_access_log_sink, set_access_log_sink
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.batches: list[list[dict]] = []
+
+    async def save(self, data: dict) -> None:
+        self.batches.append([data])
+
+    async def save_many(self, rows: list[dict]) -> None:
+        self.batches.append(list(rows))
+
+
+def _record(i: int) -> AccessLogRecord:
+    return AccessLogRecord(request_path=f"/{i}")
+
+
+@pytest.fixture
+def sink():
+    original = get_access_log_sink()
+    recording = RecordingSink()
+    set_access_log_sink(recording)
+    yield recording
+    set_access_log_sink(original)
+
+
+async def test_enqueue_before_start_is_rejected() -> None:
+    batcher = AccessLogBatcher()
+
+    assert batcher.enqueue(_record(0)) is False, "start() 전에는 적재하지 않아야 함"
+    assert batcher.dropped == 0
+
+
+async def test_enqueue_before_start_warns_once(caplog) -> None:
+    batcher = AccessLogBatcher()
+
+    with caplog.at_level(logging.WARNING, logger=batcher_module.logger.name):
+        for i in range(3):
+            batcher.enqueue(_record(i))
+
+    assert [r.levelno for r in caplog.records] == [
+        logging.WARNING
+    ], "미시작 드롭 경고는 한 번만 남겨야 함"
+
+
+async def test_rows_are_flushed_in_bounded_batches(sink: RecordingSink) -> None:
+    batcher = AccessLogBatcher(max_batch=3, max_wait=0.01)
+    batcher.start()
+
+    for i in range(7):
+        assert batcher.enqueue(_record(i)) is True
+
+    await batcher.stop(timeout=1.0)
+
+    assert [len(b) for b in sink.batches] == [3, 3, 1], "배치 크기 상한(3)을 지켜야 함"
+    assert [row["request_path"] for b in sink.batches for row in b] == [f"/{i}" for i in range(7)]
+
+
+async def test_queue_full_drops_without_blocking(sink: RecordingSink) -> None:
+    batcher = AccessLogBatcher(maxsize=2)
+    batcher.start()
+
+    accepted = [batcher.enqueue(_record(i)) for i in range(5)]
+
+    assert accepted.count(True) == 2, "큐 상한(2)까지만 수락해야 함"
+    assert batcher.dropped == 3, "초과분 3건은 드롭·집계되어야 함"
+    await batcher.stop(timeout=1.0)
+
+
+async def test_queue_full_warnings_are_rate_limited(sink: RecordingSink, caplog) -> None:
+    batcher = AccessLogBatcher(maxsize=1)
+    batcher.start()
+
+    with caplog.at_level(logging.WARNING, logger=batcher_module.logger.name):
+        for i in range(5):
+            batcher.enqueue(_record(i))
+        # 경고 간격이 지난 것처럼 마지막 경고 시각을 되돌린다
+        batcher._last_drop_warn -= batcher_module.DROP_WARN_INTERVAL_SECONDS
+        batcher.enqueue(_record(5))
+
+    messages = [r.getMessage() for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(messages) == 2, "드롭마다가 아니라 간격마다 한 번만 경고해야 함"
+    assert "드롭 1건(누적 1)" in messages[0]
+    assert "드롭 4건(누적 5)" in messages[1], "간격 사이 드롭 건수를 묶어 보고해야 함"
+    await batcher.stop(timeout=1.0)
+
+
+async def test_stop_flushes_pending_rows_and_stops_worker(sink: RecordingSink) -> None:
+    batcher = AccessLogBatcher(max_batch=100, max_wait=10.0)
+    batcher.start()
+    batcher.enqueue(_record(0))
+    await asyncio.sleep(0)
+
+    await batcher.stop(timeout=0.5)
+
+    assert not batcher.running
+    assert batcher.enqueue(_record(1)) is False, "stop() 이후 적재는 거부되어야 함"
+
+
+async def test_flush_continues_after_sink_failure(sink: RecordingSink) -> None:
+    calls = 0
+
+    async def flaky(rows: list[dict]) -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("db down")
+        sink.batches.append(rows)
+
+    sink.save_many = flaky  # type: ignore[method-assign]
+    batcher = AccessLogBatcher(max_batch=1, max_wait=0.01)
+    batcher.start()
+    batcher.enqueue(_record(0))
+    batcher.enqueue(_record(1))
+
+    await batcher.stop(timeout=1.0)
+
+    assert [[row["request_path"] for row in b] for b in sink.batches] == [
+        ["/1"]
+    ], "저장 실패 후에도 소비자 루프가 계속되어야 함"
+
+
+async def test_flushed_and_dropped_records_return_to_pool(sink: RecordingSink) -> None:
+    pool = AccessLogRecordPool()
+    batcher = AccessLogBatcher(max_batch=10, max_wait=0.01, maxsize=2, pool=pool)
+    batcher.start()
+
+    for i in range(3):
+        batcher.enqueue(_record(i))
+    assert pool.available == 1, "드롭된 레코드는 즉시 풀로 돌아가야 함"
+
+    await batcher.stop(timeout=1.0)
+
+    assert pool.available == 3, "저장된 레코드도 풀로 돌아가야 함"
+    assert pool.acquire() == AccessLogRecord(), "풀에서 꺼낸 레코드는 초기화되어 있어야 함"
+
+
+async def test_workers_flush_batches_concurrently(sink: RecordingSink) -> None:
+    gate = asyncio.Event()
+    in_flight = 0
+    peak = 0
+
+    async def slow(rows: list[dict]) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await gate.wait()
+        in_flight -= 1
+        sink.batches.append(rows)
+
+    sink.save_many = slow  # type: ignore[method-assign]
+    batcher = AccessLogBatcher(max_batch=1, max_wait=0.01, workers=2)
+    batcher.start()
+    for i in range(4):
+        batcher.enqueue(_record(i))
+
+    await asyncio.sleep(0.05)
+    assert peak == 2, "워커 수(2)만큼 동시에 저장해야 함"
+    gate.set()
+
+    await batcher.stop(timeout=1.0)
+
+    assert not batcher.running
+    assert sorted(row["request_path"] for b in sink.batches for row in b) == [
+        f"/{i}" for i in range(4)
+    ]
+
+
+async def test_stop_times_out_and_cancels_stuck_workers(sink: RecordingSink) -> None:
+    async def stuck(rows: list[dict]) -> None:
+        await asyncio.Event().wait()
+
+    sink.save_many = stuck  # type: ignore[method-assign]
+    batcher = AccessLogBatcher(max_batch=1, max_wait=0.01, workers=1)
+    batcher.start()
+    batcher.enqueue(_record(0))
+    await asyncio.sleep(0.02)
+
+    await batcher.stop(timeout=0.1)
+
+    assert not batcher.running, "타임아웃 후 워커는 취소되어야 함"
+
+
+def _database_error(cause: Exception) -> DatabaseException:
+    try:
+        raise DatabaseException() from cause
+    except DatabaseException as e:
+        return e
+
+
+class StrictSink(RecordingSink):
+    """경로가 길이 상한을 넘는 행이 있으면 배치 전체를 거부하는 sink (strict 모드 MySQL 흉내)."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        super().__init__()
+        self.error = error
+
+    async def save(self, data: dict) -> None:
+        if len(data["request_path"]) > 5:
+            raise _database_error(DataError("INSERT", {}, Exception("Data too long")))
+        await super().save(data)
+
+    async def save_many(self, rows: list[dict]) -> None:
+        if self.error is not None:
+            raise self.error
+        for row in rows:
+            if len(row["request_path"]) > 5:
+                raise _database_error(DataError("INSERT", {}, Exception("Data too long")))
+        await super().save_many(rows)
+
+
+async def _run_batch(paths: list[str]) -> None:
+    batcher = AccessLogBatcher(max_batch=10, max_wait=0.01)
+    batcher.start()
+    for path in paths:
+        batcher.enqueue(AccessLogRecord(request_path=path))
+    await batcher.stop(timeout=1.0)
+
+
+async def test_one_bad_row_does_not_lose_the_batch() -> None:
+    original = get_access_log_sink()
+    sink = StrictSink()
+    set_access_log_sink(sink)
+    try:
+        await _run_batch(["/a", "/" + "x" * 100, "/b"])
+    finally:
+        set_access_log_sink(original)
+
+    assert [row["request_path"] for b in sink.batches for row in b] == [
+        "/a",
+        "/b",
+    ], "나쁜 행만 버리고 나머지는 건별로 저장해야 함"
+
+
+async def test_connection_errors_are_not_retried_row_by_row() -> None:
+    original = get_access_log_sink()
+    sink = StrictSink(error=_database_error(OperationalError("INSERT", {}, Exception("gone"))))
+    set_access_log_sink(sink)
+    try:
+        await _run_batch(["/a", "/b"])
+    finally:
+        set_access_log_sink(original)
+
+    assert sink.batches == [], "행과 무관한 오류는 건별 재시도 없이 배치를 버려야 함"
+
+
+async def test_sink_without_save_many_is_saved_row_by_row() -> None:
+    class SaveOnlySink:
+        def __init__(self) -> None:
+            self.rows: list[dict] = []
+
+        async def save(self, data: dict) -> None:
+            self.rows.append(data)
+
+    original = get_access_log_sink()
+    sink = SaveOnlySink()
+    set_access_log_sink(sink)
+    try:
+        await _run_batch(["/a", "/b"])
+    finally:
+        set_access_log_sink(original)
+
+    assert [row["request_path"] for row in sink.rows] == ["/a", "/b"]
@@ -0,0 +1,33 @@
+"""요청 상관관계 ID 결정 로직 단위 테스트."""
+
+from app.core.middlewares.correlation import get_correlation_id, resolve_correlation_id
+
+TRACE_ID = "4bf92f3577b34da6a3ce929d0e0e4736"
+TRACEPARENT = f"00-{TRACE_ID}-00f067aa0ba902b7-01"
+
+
+def test_traceparent_trace_id_takes_precedence() -> None:
+    assert resolve_correlation_id(TRACEPARENT, "req-1") == TRACE_ID
+
+
+def test_invalid_traceparent_falls_back_to_request_id() -> None:
+    zero = f"00-{'0' * 32}-00f067aa0ba902b7-01"
+
+    assert resolve_correlation_id(zero, "req-1") == "req-1", "all-zero trace-id 는 무효"
+    assert resolve_correlation_id("garbage", " req-1 ") == "req-1"
+
+
+def test_request_id_is_truncated_to_column_length() -> None:
+    assert len(resolve_correlation_id(None, "x" * 200)) == 64
+
+
+def test_missing_headers_generate_new_id() -> None:
+    first = resolve_correlation_id(None, None)
+    second = resolve_correlation_id(None, "   ")
+
+    assert len(first) == 32
+    assert first != second, "요청마다 새 ID 를 생성해야 함"
+
+
+def test_correlation_id_is_empty_outside_request() -> None:
+    assert get_correlation_id() == ""
@@ -0,0 +1,128 @@
+"""install_idle_ping · install_conditional_reset · pool_status 회귀 테스트.
+
+체크아웃마다 ping 하지 않고, idle 구간을 넘긴 커넥션만 ping 하며
+ping 실패 시 커넥션을 교체하는지, 반납 시 열린 트랜잭션만 롤백하는지,
+풀 상태를 정확히 보고하는지 검증한다.
+"""
+
+import pytest
+from sqlalchemy import AsyncAdaptedQueuePool, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.db import pool as pool_module
+from app.core.db.pool import install_conditional_reset, install_idle_ping, pool_status
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", pool_pre_ping=False)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def pings(engine, monkeypatch) -> list[object]:
+    calls: list[object] = []
+
+    def do_ping(dbapi_connection) -> bool:
+        calls.append(dbapi_connection)
+        return True
+
+    monkeypatch.setattr(engine.sync_engine.dialect, "do_ping", do_ping)
+    return calls
+
+
+async def _roundtrip(engine) -> None:
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def test_recently_checked_in_connection_is_not_pinged(engine, pings) -> None:
+    install_idle_ping(engine, idle_seconds=60)
+
+    for _ in range(3):
+        await _roundtrip(engine)
+
+    assert pings == [], "idle 구간 안에서 재사용되는 커넥션은 ping 하지 않아야 함"
+
+
+async def test_idle_connection_is_pinged_on_checkout(engine, pings, monkeypatch) -> None:
+    install_idle_ping(engine, idle_seconds=60)
+    await _roundtrip(engine)
+
+    now = pool_module.time.monotonic()
+    monkeypatch.setattr(pool_module.time, "monotonic", lambda: now + 61)
+    await _roundtrip(engine)
+
+    assert len(pings) == 1, "idle 구간을 넘긴 커넥션은 체크아웃 시 한 번 ping 해야 함"
+
+
+async def test_failed_ping_replaces_connection(engine, monkeypatch) -> None:
+    install_idle_ping(engine, idle_seconds=0)
+    await _roundtrip(engine)
+    async with engine.connect() as conn:
+        first = (await conn.get_raw_connection()).driver_connection
+
+    monkeypatch.setattr(engine.sync_engine.dialect, "do_ping", lambda dbapi_connection: False)
+    # 체크아웃 재시도 시에는 새 커넥션(반납 이력 없음)이라 ping 하지 않는다
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        second = (await conn.get_raw_connection()).driver_connection
+
+    assert second is not first, "ping 실패한 커넥션은 폐기하고 새로 연결해야 함"
+
+
+async def _commit_and_checkin(engine, monkeypatch, in_transaction: bool) -> list[str]:
+    """커밋 후 반납하면서 드라이버가 보고할 트랜잭션 상태를 지정하고, 롤백 호출을 모은다."""
+    rollbacks: list[str] = []
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        await conn.commit()
+        raw = await conn.get_raw_connection()
+        adapted = type(raw.dbapi_connection)
+        original = adapted.rollback
+
+        def rollback(self) -> None:
+            rollbacks.append("rollback")
+            original(self)
+
+        monkeypatch.setattr(adapted, "rollback", rollback)
+        monkeypatch.setattr(
+            raw.driver_connection, "get_transaction_status", lambda: in_transaction, raising=False
+        )
+    return rollbacks
+
+
+async def test_conditional_reset_skips_rollback_after_commit(monkeypatch) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", pool_reset_on_return=None)
+    install_conditional_reset(engine)
+    try:
+        rollbacks = await _commit_and_checkin(engine, monkeypatch, in_transaction=False)
+    finally:
+        await engine.dispose()
+
+    assert rollbacks == [], "트랜잭션이 닫힌 커넥션은 반납 시 롤백하지 않아야 함"
+
+
+async def test_conditional_reset_rolls_back_open_transaction(monkeypatch) -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", pool_reset_on_return=None)
+    install_conditional_reset(engine)
+    try:
+        rollbacks = await _commit_and_checkin(engine, monkeypatch, in_transaction=True)
+    finally:
+        await engine.dispose()
+
+    assert rollbacks == ["rollback"], "트랜잭션이 열린 커넥션은 반납 시 롤백해야 함"
+
+
+async def test_pool_status_reports_checked_out_connections() -> None:
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", poolclass=AsyncAdaptedQueuePool, pool_size=2
+    )
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            assert pool_status(engine) == {"size": 2, "checked_out": 1, "overflow": -1}
+        assert pool_status(engine)["checked_out"] == 0
+    finally:
+        await engine.dispose()
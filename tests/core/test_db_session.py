@@ -0,0 +1,52 @@
+"""세션 모듈(get_session · 테이블 생성) 회귀 테스트.
+
+요청 경로에서 소요 시간 측정은 DEBUG 로그가 켜졌을 때만 하고,
+예외 시에는 롤백 후 원래 예외를 그대로 다시 던지는지,
+시작 시 테이블 생성은 없는 테이블만 만드는지 검증한다.
+"""
+
+import logging
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.db import session as session_module
+
+
+async def test_get_session_skips_timing_when_debug_disabled(monkeypatch) -> None:
+    monkeypatch.setattr(session_module.logger, "isEnabledFor", lambda level: False)
+
+    def fail() -> float:
+        raise AssertionError("DEBUG 가 꺼져 있으면 perf_counter 를 호출하지 않아야 함")
+
+    monkeypatch.setattr(session_module.time, "perf_counter", fail)
+    gen = session_module.get_session()
+
+    await gen.__anext__()
+    await gen.aclose()
+
+
+async def test_get_session_logs_rollback_and_reraises(caplog) -> None:
+    gen = session_module.get_session()
+    await gen.__anext__()
+
+    with caplog.at_level(logging.ERROR, logger=session_module.logger.name):
+        with pytest.raises(ValueError, match="boom"):
+            await gen.athrow(ValueError("boom"))
+
+    assert "[get_session] ROLLBACK - error: ValueError: boom" in caplog.text
+
+
+async def test_create_missing_tables_only_creates_absent_tables() -> None:
+    import app.domains.home.models.models  # noqa: F401
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        async with engine.begin() as conn:
+            first = await conn.run_sync(session_module._create_missing_tables)
+            second = await conn.run_sync(session_module._create_missing_tables)
+    finally:
+        await engine.dispose()
+
+    assert "user_access_logs" in first
+    assert second == [], "이미 있는 테이블은 다시 만들지 않아야 함"
@@ -0,0 +1,66 @@
+"""AppException 응답 생성 단위 테스트."""
+
+import pickle
+
+import orjson
+
+from app.core.exception import (
+    AppException,
+    ConflictException,
+    DuplicateException,
+    ErrorResponse,
+    NotFoundException,
+)
+from app.domains.blog.exceptions import PostNotFoundException
+
+
+def test_subclass_does_not_reuse_parent_cached_body() -> None:
+    parent = orjson.loads(ConflictException().cached_body())
+    child = orjson.loads(DuplicateException().cached_body())
+
+    assert child["error_code"] == "DUPLICATE"
+    assert parent["error_code"] == "CONFLICT"
+
+
+def test_to_dict_carries_overrides() -> None:
+    custom = NotFoundException(message="게시글 없음", detail={"id": 1})
+    recoded = NotFoundException(error_code="POST_NOT_FOUND")
+
+    assert custom.to_dict() == {
+        "error_code": "NOT_FOUND",
+        "message": "게시글 없음",
+        "detail": {"id": 1},
+    }
+    assert recoded.to_dict()["error_code"] == "POST_NOT_FOUND"
+    assert ErrorResponse.model_validate(custom.to_dict()).detail == {"id": 1}
+
+
+def test_base_exception_defaults() -> None:
+    exc = AppException()
+
+    assert exc.status_code == 500
+    assert str(exc) == AppException.message
+
+
+def test_str_and_pickle_roundtrip_keep_message_and_overrides() -> None:
+    exc = NotFoundException(message="게시글 없음", detail={"id": 1}, status_code=410)
+
+    restored = pickle.loads(pickle.dumps(exc))
+
+    assert str(exc) == "게시글 없음"
+    assert type(restored) is NotFoundException
+    assert str(restored) == "게시글 없음"
+    assert restored.detail == {"id": 1}
+    assert restored.status_code == 410
+
+
+def test_cached_body_matches_serialized_default_response() -> None:
+    exc = PostNotFoundException()
+
+    assert exc.cached_body() == orjson.dumps(exc.to_dict())
+    assert orjson.loads(AppException().cached_body())["error_code"] == "INTERNAL_ERROR"
+
+
+def test_cached_body_is_skipped_for_overridden_exceptions() -> None:
+    assert NotFoundException(detail={"id": 1}).cached_body() is None
+    assert NotFoundException(message="다른 메시지").cached_body() is None
@@ -0,0 +1,46 @@
+"""Base.to_dict 컬럼 이름 캐시 테스트."""
+
+from app.core.models.models_base import Base
+from app.domains.home.models.models import UserAccessLog
+
+
+def test_column_names_are_cached_for_every_mapped_model() -> None:
+    for mapper in Base.registry.mappers:
+        model = mapper.class_
+        assert model._column_names == tuple(c.name for c in model.__table__.columns)
+
+
+def test_to_dict_uses_cached_columns() -> None:
+    log = UserAccessLog(ip_address="1.2.3.4", request_path="/x", request_method="GET")
+
+    data = log.to_dict()
+
+    assert tuple(data) == UserAccessLog._column_names
+    assert data["ip_address"] == "1.2.3.4"
+    assert data["request_path"] == "/x"
+
+
+def test_uuid7_hex_is_version_7_and_time_ordered(monkeypatch) -> None:
+    from uuid import UUID
+
+    from app.core.models import models_base
+
+    now = models_base.time.time_ns()
+    monkeypatch.setattr(models_base.time, "time_ns", lambda: now)
+    earlier = models_base.new_uuid7_hex()
+    monkeypatch.setattr(models_base.time, "time_ns", lambda: now + 1_000_000)
+    later = models_base.new_uuid7_hex()
+
+    parsed = UUID(hex=earlier)
+    assert len(earlier) == 32
+    assert parsed.version == 7
+    assert parsed.variant == "specified in RFC 4122"
+    assert int(earlier[:12], 16) == now // 1_000_000
+    assert earlier < later, "다음 밀리초에 만든 값이 항상 더 커야 함"
+
+
+def test_access_log_mapper_skips_post_insert_fetch_and_delete_checks() -> None:
+    mapper = UserAccessLog.__mapper__
+
+    assert mapper.eager_defaults is False
+    assert mapper.confirm_deleted_rows is False
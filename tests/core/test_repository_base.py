@@ -0,0 +1,491 @@
+"""BaseRepository 쿼리 동작 검증.
+
+in-memory sqlite 에 blog ``Post`` 테이블을 만들어 공통 CRUD 경로를 검증한다.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import ForeignKey, String, event, select
+from sqlalchemy.engine.default import CACHE_HIT
+from sqlalchemy.exc import MultipleResultsFound
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+
+from app.core.db.session import Base
+from app.core.repositories.repository_base import (
+    BaseRepository,
+    _page_template,
+    _resolve_column_options,
+    _resolve_load_option,
+)
+from app.domains.blog.models.models import Post
+from app.domains.blog.repositories.post_repository import PostRepository
+
+
+# 프로젝트 모델에는 관계가 없으므로 Eager Loading 검증용 모델을 따로 둔다
+class _RelBase(DeclarativeBase):
+    pass
+
+
+class Author(_RelBase):
+    __tablename__ = "authors"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    books: Mapped[list["Book"]] = relationship(back_populates="author")
+
+
+class Book(_RelBase):
+    __tablename__ = "books"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    author_id: Mapped[str] = mapped_column(ForeignKey("authors.id"))
+    author: Mapped[Author] = relationship(back_populates="books")
+    chapters: Mapped[list["Chapter"]] = relationship()
+
+
+class Chapter(_RelBase):
+    __tablename__ = "chapters"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    book_id: Mapped[str] = mapped_column(ForeignKey("books.id"))
+
+
+class AuthorRepository(BaseRepository[Author]):
+    model = Author
+
+
+@pytest_asyncio.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_RelBase.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(engine):
+    maker = async_sessionmaker(engine, expire_on_commit=False)
+    async with maker() as s:
+        yield s
+
+
+@pytest.fixture
+def statements(engine) -> list[str]:
+    """실행된 SQL 문을 기록한다."""
+    captured: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        captured.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    yield captured
+    event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+def _posts(n: int) -> list[dict]:
+    return [{"title": f"t{i}", "content": f"c{i}"} for i in range(n)]
+
+
+async def test_bulk_create_returns_instances_without_per_row_refresh(session, statements) -> None:
+    repo = PostRepository(session)
+
+    posts = await repo.bulk_create(_posts(3))
+
+    assert [p.title for p in posts] == ["t0", "t1", "t2"], "입력 순서대로 반환해야 함"
+    assert all(isinstance(p, Post) and p.id and p.created_at for p in posts)
+    assert not [
+        s for s in statements if s.lstrip().upper().startswith("SELECT")
+    ], "행마다 refresh SELECT 를 보내지 않아야 함"
+
+
+async def test_bulk_create_without_returning_support_flushes_once(
+    engine, session, statements, monkeypatch
+) -> None:
+    monkeypatch.setattr(engine.sync_engine.dialect, "insert_executemany_returning", False)
+    repo = PostRepository(session)
+
+    posts = await repo.bulk_create(_posts(2))
+
+    assert [p.title for p in posts] == ["t0", "t1"]
+    assert all(p.id and p.created_at for p in posts)
+    assert not any("RETURNING" in s.upper() for s in statements)
+    assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+
+
+async def test_bulk_create_with_empty_list_is_noop(session, statements) -> None:
+    assert await PostRepository(session).bulk_create([]) == []
+    assert statements == []
+
+
+async def test_exists_uses_limit_one_instead_of_count(session, statements) -> None:
+    repo = PostRepository(session)
+    [post] = await repo.bulk_create(_posts(1))
+    statements.clear()
+
+    assert await repo.exists(post.id) is True
+    assert await repo.exists("missing") is False
+    assert await repo.exists_by(title="t0") is True
+    assert await repo.exists_by(title="nope") is False
+    assert all("count(" not in s.lower() and "LIMIT" in s.upper() for s in statements)
+
+
+async def test_count_counts_primary_key_with_filters(session, statements) -> None:
+    repo = PostRepository(session)
+    await repo.bulk_create(_posts(3))
+    statements.clear()
+
+    assert await repo.count() == 3
+    assert await repo.count(title="t1") == 1
+    assert all("count(blog_posts.id)" in s for s in statements)
+
+
+async def test_inexact_count_falls_back_to_exact_without_table_estimates(
+    session, statements
+) -> None:
+    repo = PostRepository(session)
+    await repo.bulk_create(_posts(3))
+    statements.clear()
+
+    assert await repo.count(exact=False) == 3, "추정치가 없는 DB 는 정확히 세야 함"
+    assert await repo.count(exact=False, title="t1") == 1
+    assert not any("information_schema" in s for s in statements)
+
+
+async def test_get_page_returns_rows_and_total_in_one_query(session, statements) -> None:
+    repo = PostRepository(session)
+    await repo.bulk_create(_posts(5))
+    statements.clear()
+
+    posts, total = await repo.get_page(skip=1, limit=2)
+    filtered, filtered_total = await repo.get_page(title="t3")
+
+    assert (len(posts), total) == (2, 5)
+    assert ([p.title for p in filtered], filtered_total) == (["t3"], 1)
+    assert len(statements) == 2, "페이지마다 쿼리 한 번이어야 함"
+    assert all("OVER ()" in s for s in statements)
+
+
+async def test_get_page_cursor_seeks_by_primary_key(session, statements) -> None:
+    repo = PostRepository(session)
+    await repo.bulk_create(_posts(5))
+    first, _ = await repo.get_page(limit=2)
+    statements.clear()
+
+    rest, total = await repo.get_page(limit=10, cursor=first[-1].id)
+
+    assert total == 5
+    assert [p.id for p in first + list(rest)] == sorted(p.id for p in first + list(rest))
+    assert len(rest) == 3
+    assert "blog_posts.id >" in statements[0]
+
+
+async def test_get_page_without_total_skips_counting(session, statements) -> None:
+    repo = PostRepository(session)
+    await repo.bulk_create(_posts(3))
+    first, _ = await repo.get_page(limit=1)
+    statements.clear()
+
+    page, total = await repo.get_page(limit=2, with_total=False)
+    rest, rest_total = await repo.get_page(cursor=first[-1].id, with_total=False)
+
+    assert (len(page), total) == (2, None)
+    assert (len(rest), rest_total) == (2, None)
+    assert len(statements) == 2, "개수를 세지 않으면 페이지마다 쿼리 한 번이어야 함"
+    assert not any("count(" in s.lower() for s in statements)
+
+
+async def test_get_page_reuses_statement_per_filter_signature(session) -> None:
+    repo = PostRepository(session)
+    await repo.bulk_create([*_posts(2), {"title": "t", "content": "c", "author": "kim"}])
+
+    _, by_title = await repo.get_page(title="t1")
+    _, by_other_title = await repo.get_page(title="t0")
+    anonymous, _ = await repo.get_page(author=None)
+
+    assert (by_title, by_other_title) == (1, 1)
+    assert len(anonymous) == 2, "None 필터는 IS NULL 로 비교해야 함"
+    assert _page_template(Post, (("title", False),), False) is _page_template(
+        Post, (("title", False),), False
+    )
+
+
+async def test_get_page_past_last_page_still_reports_total(session) -> None:
+    repo = PostRepository(session)
+    await repo.bulk_create(_posts(2))
+
+    assert await repo.get_page(skip=10, limit=5) == ([], 2)
+    assert await repo.get_page(title="nope") == ([], 0)
+
+
+async def test_create_leaves_id_generation_to_model_default(session) -> None:
+    repo = PostRepository(session)
+    data = {"title": "t", "content": "c"}
+    rows = _posts(2)
+
+    post = await repo.create(data)
+    posts = await repo.bulk_create(rows)
+
+    assert post.id and all(p.id for p in posts)
+    assert "id" not in data and all(
+        "id" not in row for row in rows
+    ), "입력 dict 를 변경하지 않아야 함"
+
+
+def test_load_options_are_resolved_once_per_model_relation_and_strategy() -> None:
+    first = _resolve_load_option(Author, "books.chapters", "joined")
+
+    assert _resolve_load_option(Author, "books.chapters", "joined") is first
+    assert _resolve_load_option(Author, "books.chapters", "selectin") is not first
+
+
+async def test_get_by_id_with_loads_nested_relations(session) -> None:
+    session.add_all(
+        [
+            Author(id="a1"),
+            Book(id="b1", author_id="a1"),
+            Chapter(id="c1", book_id="b1"),
+            Chapter(id="c2", book_id="b1"),
+        ]
+    )
+    await session.commit()
+    session.expunge_all()
+
+    author = await AuthorRepository(session).get_by_id_with("a1", relations=["books.chapters"])
+
+    # 지연 로딩이 일어나면 async 세션에서 MissingGreenlet 이 발생한다
+    assert [b.id for b in author.books] == ["b1"]
+    assert sorted(c.id for c in author.books[0].chapters) == ["c1", "c2"]
+
+
+async def test_get_partial_reuses_cached_column_options(session) -> None:
+    repo = PostRepository(session)
+    await repo.bulk_create(_posts(2))
+    session.expunge_all()
+
+    rows = await repo.get_partial_orm(columns=["id", "title"])
+
+    assert sorted(p.title for p in rows) == ["t0", "t1"]
+    assert _resolve_column_options(Post, ("id", "title"), ()) is _resolve_column_options(
+        Post, ("id", "title"), ()
+    )
+
+
+async def test_create_issues_a_single_statement(session, statements) -> None:
+    post = await PostRepository(session).create({"title": "t", "content": "c"})
+
+    assert post.id and post.created_at
+    assert len(statements) == 1 and "RETURNING" in statements[0].upper()
+
+
+async def test_create_without_returning_support_skips_refresh(
+    engine, session, statements, monkeypatch
+) -> None:
+    monkeypatch.setattr(engine.sync_engine.dialect, "insert_returning", False)
+
+    post = await PostRepository(session).create({"title": "t", "content": "c"})
+
+    assert post.id and post.created_at
+    assert len(statements) == 1 and statements[0].lstrip().upper().startswith("INSERT")
+
+
+async def test_get_in_batches_pages_by_primary_key(session, statements) -> None:
+    repo = PostRepository(session)
+    await repo.bulk_create(_posts(5))
+    statements.clear()
+
+    batches = [batch async for batch in repo.get_in_batches(batch_size=2)]
+
+    ids = [p.id for batch in batches for p in batch]
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert ids == sorted(ids) and len(set(ids)) == 5
+    assert len(statements) == 3, "마지막 부분 배치 뒤에는 추가 조회하지 않아야 함"
+    assert all("blog_posts.id >" in s for s in statements[1:]), "다음 배치는 keyset 으로 찾아야 함"
+
+
+async def test_stream_all_yields_same_rows_as_get_all(session) -> None:
+    repo = PostRepository(session)
+    await repo.bulk_create(_posts(5))
+
+    streamed = [post.id async for post in repo.stream_all(skip=1, limit=3, yield_per=2)]
+
+    assert streamed == [post.id for post in await repo.get_all(skip=1, limit=3)]
+
+
+async def test_joined_strategy_on_collection_falls_back_to_selectin(session, statements) -> None:
+    session.add_all(
+        [
+            Author(id="a1"),
+            Book(id="b1", author_id="a1"),
+            Book(id="b2", author_id="a1"),
+        ]
+    )
+    await session.commit()
+    session.expunge_all()
+    statements.clear()
+
+    authors = await AuthorRepository(session).get_many_with(relations=["books"], strategy="joined")
+
+    assert [a.id for a in authors] == ["a1"], "부모 행이 중복되지 않아야 함"
+    assert sorted(b.id for b in authors[0].books) == ["b1", "b2"]
+    assert not any("JOIN" in s.upper() for s in statements)
+
+
+def test_joined_strategy_is_kept_for_many_to_one() -> None:
+    stmt = select(Book).options(_resolve_load_option(Book, "author", "joined"))
+
+    assert "LEFT OUTER JOIN authors" in str(stmt)
+
+
+async def test_get_partial_returns_core_rows_in_column_order(session) -> None:
+    repo = PostRepository(session)
+    await repo.bulk_create(_posts(2))
+    session.expunge_all()
+
+    rows = await repo.get_partial(columns=["title", "content"], title="t1")
+
+    assert [tuple(r) for r in rows] == [("t1", "c1")]
+    assert rows[0].title == "t1"
+    assert len(session.identity_map) == 0, "ORM 인스턴스를 만들지 않아야 함"
+
+
+async def test_get_by_id_with_uses_identity_map_when_relations_are_loaded(
+    session, statements
+) -> None:
+    session.add_all([Author(id="a1"), Book(id="b1", author_id="a1")])
+    await session.commit()
+    session.expunge_all()
+    repo = AuthorRepository(session)
+
+    await repo.get_by_id("a1")
+    statements.clear()
+    author = await repo.get_by_id_with("a1", relations=["books"])
+    assert len(statements) == 2, "관계가 로드되지 않았으면 DB 에서 다시 읽어야 함"
+
+    statements.clear()
+    again = await repo.get_by_id_with("a1", relations=["books"])
+    same = await repo.get_by_id("a1")
+
+    assert again is author and same is author
+    assert statements == [], "identity map 적중 시 SQL 을 보내지 않아야 함"
+
+
+async def test_reads_do_not_autoflush_pending_changes(engine, statements) -> None:
+    maker = async_sessionmaker(engine, expire_on_commit=False, autoflush=True)
+    async with maker() as autoflush_session:
+        repo = PostRepository(autoflush_session)
+        autoflush_session.add(Post(title="pending", content="c"))
+
+        assert await repo.count() == 0
+        assert await repo.exists_by(title="pending") is False
+        assert not any(s.lstrip().upper().startswith("INSERT") for s in statements)
+
+
+def test_statement_templates_are_built_once_per_repository_subclass() -> None:
+    assert PostRepository._count_stmt is PostRepository._count_stmt
+    assert "blog_posts" in str(PostRepository._exists_stmt)
+    assert "authors" in str(AuthorRepository._select_by_id_stmt)
+    assert "_count_stmt" not in BaseRepository.__dict__, "model 이 없는 클래스는 건너뛰어야 함"
+
+
+async def test_get_by_ids_with_preserves_input_order(session) -> None:
+    repo = PostRepository(session)
+    posts = await repo.bulk_create(_posts(3))
+    ids = [posts[2].id, "missing", posts[0].id, posts[2].id]
+
+    result = await repo.get_by_ids_with(ids)
+
+    assert [p.title for p in result] == ["t2", "t0"]
+
+
+@pytest.mark.parametrize("update_returning", [True, False])
+async def test_update_or_create_updates_without_refresh(
+    engine, session, statements, monkeypatch, update_returning
+) -> None:
+    monkeypatch.setattr(engine.sync_engine.dialect, "update_returning", update_returning)
+    repo = PostRepository(session)
+    await repo.create({"title": "t", "content": "old"})
+    statements.clear()
+
+    post, created = await repo.update_or_create(defaults={"content": "new"}, title="t")
+
+    assert created is False and post.content == "new" and post.updated_at
+    assert [s.lstrip().split()[0].upper() for s in statements] == ["SELECT", "UPDATE"]
+
+
+@pytest.mark.parametrize("update_returning", [True, False])
+async def test_update_or_create_rejects_non_unique_filters(
+    engine, session, monkeypatch, update_returning
+) -> None:
+    """필터에 맞는 행이 여럿이면 전부 갱신하지 않고 MultipleResultsFound 를 낸다."""
+    monkeypatch.setattr(engine.sync_engine.dialect, "update_returning", update_returning)
+    repo = PostRepository(session)
+    await repo.bulk_create([{"title": "t", "content": "old"}, {"title": "t", "content": "old"}])
+
+    with pytest.raises(MultipleResultsFound):
+        await repo.update_or_create(defaults={"content": "new"}, title="t")
+
+    contents = (await session.scalars(select(Post.content).where(Post.title == "t"))).all()
+    assert contents == ["old", "old"]
+
+
+async def test_update_or_create_creates_when_missing(session) -> None:
+    post, created = await PostRepository(session).update_or_create(
+        defaults={"content": "c"}, title="new"
+    )
+
+    assert created is True and post.title == "new" and post.content == "c"
+
+
+async def test_repeated_reads_reuse_compiled_sql(engine, session) -> None:
+    """값만 다른 반복 조회는 엔진의 컴파일 캐시를 적중해야 한다 (bindparam 사용 확인)."""
+    repo = PostRepository(session)
+    await repo.bulk_create(_posts(2))
+    hits: list[bool] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        hits.append(context.cache_hit == CACHE_HIT)
+
+    for i in range(2):
+        await repo.exists(f"id-{i}")
+        await repo.count(title=f"t{i}")
+        await repo.get_many(skip=i, limit=10 + i, title=f"t{i}")
+        await repo.get_by_id_with(f"id-{i}")
+        if i == 0:
+            event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+    assert hits and all(hits), "두 번째 호출부터는 컴파일된 SQL 을 재사용해야 함"
+
+
+async def test_count_with_relation_returns_instance_count_pairs(session) -> None:
+    session.add_all(
+        [
+            Author(id="a1"),
+            Author(id="a2"),
+            Book(id="b1", author_id="a1"),
+            Book(id="b2", author_id="a1"),
+        ]
+    )
+    await session.commit()
+
+    rows = await AuthorRepository(session).count_with_relation("books")
+
+    assert sorted((author.id, count) for author, count in rows) == [("a1", 2), ("a2", 0)]
+
+
+@pytest.mark.parametrize("returning", [True, False])
+async def test_update_id_returns_only_the_primary_key(
+    engine, session, statements, monkeypatch, returning
+) -> None:
+    monkeypatch.setattr(engine.sync_engine.dialect, "update_returning", returning)
+    repo = PostRepository(session)
+    post = await repo.create({"title": "t", "content": "old"})
+    statements.clear()
+
+    assert await repo.update_id(post.id, {"content": "new"}) == post.id
+    assert await repo.update_id("missing", {"content": "new"}) is None
+    assert all(s.lstrip().upper().startswith("UPDATE") for s in statements), "재조회 없음"
+    if returning:
+        assert all(s.split("RETURNING")[1].strip() == "id" for s in statements)
@@ -0,0 +1,73 @@
+"""config 모듈의 지연 생성 설정 인스턴스 테스트.
+
+이미 설정을 읽은 테스트 프로세스와 섞이지 않도록 새 인터프리터에서 import 한다.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import config
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+_SCRIPT = """
+import config
+built = lambda: sorted(n for n in config._SETTINGS_CLASSES if n in vars(config))
+print(built())
+from config import db_settings
+print(built(), config.get_db_settings() is db_settings)
+"""
+
+
+def test_settings_are_built_on_first_access_only():
+    out = subprocess.run(
+        [sys.executable, "-c", _SCRIPT],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+
+    assert out[0] == "[]", "config import 만으로는 설정을 만들지 않아야 함"
+    assert out[1] == "['db_settings'] True", "접근한 블록만 한 번 만들어 getter 와 공유해야 함"
+
+
+def test_env_file_is_parsed_once_without_exporting_and_real_environment_wins(tmp_path):
+    """.env 는 한 번만 파싱해 모든 블록이 공유하고, os.environ 에는 올리지 않으며,
+    이미 있는 환경변수가 .env 보다 우선한다."""
+    (tmp_path / ".env").write_text("TIME_ZONE=UTC\nPROJECT_NAME=from-dotenv\n", encoding="utf-8")
+    env = {**os.environ, "PYTHONPATH": str(PROJECT_ROOT), "PROJECT_NAME": "from-environ"}
+    env.pop("TIME_ZONE", None)
+    script = (
+        "import os; from config import app_settings, timezone_settings; "
+        "print(timezone_settings.TIME_ZONE, app_settings.PROJECT_NAME, 'TIME_ZONE' in os.environ); "
+        "import config; print(config._dotenv_vars.cache_info().misses)"
+    )
+
+    out = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+
+    assert out[:3] == ["UTC", "from-environ", "False"], ".env 값이 프로세스 환경변수로 새면 안 됨"
+    assert out[3] == "1", "설정 블록이 여럿이어도 .env 는 한 번만 파싱해야 함"
+
+
+def test_redis_url_is_built_once_with_escaped_password():
+    settings = config.RedisSettings(REDIS_PASSWORD="p@ss/word", REDIS_HOST="cache", REDIS_DB=2)
+
+    assert settings.REDIS_URL == "redis://:p%40ss%2Fword@cache:6379/2"
+    assert settings.REDIS_URL is settings.REDIS_URL
+
+
+def test_unknown_attribute_still_raises():
+    with pytest.raises(AttributeError):
+        config.no_such_settings  # noqa: B018
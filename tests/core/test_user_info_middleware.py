@@ -0,0 +1,255 @@
+"""UserInfoMiddleware 경로 필터·수집 로직 단위 테스트."""
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from app.core.middlewares import user_info_middleware
+from app.core.middlewares.access_log_record import AccessLogRecord
+from app.core.middlewares.correlation import get_correlation_id
+from app.core.middlewares.user_info_middleware import (
+    UserInfoMiddleware,
+    setup_user_info_middleware,
+)
+from config import middleware_settings
+
+
+def _middleware() -> UserInfoMiddleware:
+    return UserInfoMiddleware(
+        FastAPI(),
+        exclude_paths=["/health", "/metrics/*"],
+        exclude_extensions=[".css", ".js"],
+    )
+
+
+def test_should_skip_excluded_path_and_extensions() -> None:
+    middleware = _middleware()
+
+    assert middleware._should_skip("/health")
+    assert middleware._should_skip("/static/app.css")
+    assert middleware._should_skip("/static/app.js")
+    assert middleware._should_skip("/metrics/cpu")
+    assert middleware._should_skip("/metrics/")
+
+
+def test_should_not_skip_regular_paths() -> None:
+    middleware = _middleware()
+
+    assert not middleware._should_skip("/api/v1/home/access-logs")
+    assert not middleware._should_skip("/health/deep")
+    assert not middleware._should_skip("/static/app.jsx")
+    assert not middleware._should_skip("/metrics")
+    assert not middleware._should_skip("/api/healthz")
+
+
+def test_should_not_skip_anything_without_exclusions() -> None:
+    middleware = UserInfoMiddleware(FastAPI(), exclude_paths=[], exclude_extensions=[])
+
+    assert not middleware._should_skip("/health")
+
+
+CHROME_UA = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+def test_parse_user_agent_is_cached_per_string() -> None:
+    middleware = _middleware()
+
+    first = middleware._parse_user_agent(CHROME_UA)
+    second = middleware._parse_user_agent(CHROME_UA)
+
+    assert first is second, "같은 UA 문자열은 캐시된 결과를 재사용해야 함"
+    assert first["browser_name"] == "Chrome"
+    assert first["device_type"] == "desktop"
+
+
+def test_parse_user_agent_without_header_returns_empty_fields() -> None:
+    middleware = _middleware()
+
+    info = middleware._parse_user_agent(None)
+
+    assert info["os_name"] is None
+    assert info["is_bot"] is False
+
+
+def test_setup_skips_registration_when_disabled(monkeypatch) -> None:
+    monkeypatch.setattr(middleware_settings, "ACCESS_LOG_ENABLED", False)
+    app = FastAPI()
+
+    setup_user_info_middleware(app)
+
+    assert not any(m.cls is UserInfoMiddleware for m in app.user_middleware)
+
+
+def test_setup_registers_middleware_when_enabled(monkeypatch) -> None:
+    monkeypatch.setattr(middleware_settings, "ACCESS_LOG_ENABLED", True)
+    app = FastAPI()
+
+    setup_user_info_middleware(app)
+
+    assert any(m.cls is UserInfoMiddleware for m in app.user_middleware)
+
+
+async def test_request_info_is_collected_after_response(monkeypatch) -> None:
+    captured: list[AccessLogRecord] = []
+    monkeypatch.setattr(user_info_middleware.access_log_batcher, "enqueue", captured.append)
+    app = FastAPI()
+    app.add_middleware(UserInfoMiddleware)
+
+    @app.get("/me")
+    async def me(request: Request) -> dict:
+        request.state.user_id = "user-1"
+        return {}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/me?x=1", headers={"User-Agent": CHROME_UA})
+
+    assert len(captured) == 1
+    record = captured[0]
+    assert record.user_id == "user-1", "핸들러가 설정한 상태까지 수집해야 함"
+    assert record.request_path == "/me"
+    assert record.query_string == "x=1"
+    assert record.response_status == 200
+    assert record.browser_name == "Chrome"
+
+
+async def test_correlation_id_is_visible_in_handler_and_stamped_on_record(monkeypatch) -> None:
+    captured: list[AccessLogRecord] = []
+    monkeypatch.setattr(user_info_middleware.access_log_batcher, "enqueue", captured.append)
+    app = FastAPI()
+    app.add_middleware(UserInfoMiddleware)
+    seen: list[str] = []
+
+    @app.get("/trace")
+    async def trace() -> dict:
+        seen.append(get_correlation_id())
+        return {}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/trace", headers={"X-Request-ID": "req-42"})
+
+    assert seen == ["req-42"], "핸들러에서 상관관계 ID 를 조회할 수 있어야 함"
+    assert captured[0].correlation_id == "req-42", "접속로그 레코드에 같은 ID 가 기록되어야 함"
+    assert get_correlation_id() == "", "요청이 끝나면 컨텍스트가 복원되어야 함"
+
+
+def _scope(headers: list[tuple[bytes, bytes]], client=("10.0.0.9", 5000)) -> dict:
+    return {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/items",
+        "query_string": b"",
+        "headers": headers,
+        "client": client,
+    }
+
+
+def test_collect_request_info_reads_raw_scope_headers() -> None:
+    middleware = _middleware()
+    scope = _scope(
+        [
+            (b"x-forwarded-for", b"1.1.1.1, 2.2.2.2"),
+            (b"x-real-ip", b"3.3.3.3"),
+            (b"referer", b"https://example.com/"),
+            (b"accept-language", b"ko-KR"),
+            (b"cookie", b"theme=dark; session_id=abc123; xsession_id=nope"),
+        ]
+    )
+
+    record = middleware._collect_request_info(scope)
+
+    assert record.ip_address == "1.1.1.1"
+    assert record.forwarded_for == "1.1.1.1, 2.2.2.2"
+    assert record.real_ip == "3.3.3.3"
+    assert record.referer == "https://example.com/"
+    assert record.accept_language == "ko-KR"
+    assert record.session_id == "abc123"
+    assert record.request_method == "POST"
+    assert record.query_string is None
+    assert record.user_agent is None
+
+
+def test_collect_request_info_unquotes_session_cookie_like_request_cookies() -> None:
+    middleware = _middleware()
+    quoted = _scope([(b"cookie", b'theme=dark; session_id="a\\"b\\073c"')])
+    repeated = _scope([(b"cookie", b"session_id=first; session_id=last")])
+
+    for scope in (quoted, repeated):
+        expected = Request(scope).cookies["session_id"]
+        assert middleware._collect_request_info(scope).session_id == expected
+
+    assert middleware._collect_request_info(quoted).session_id == 'a"b;c'
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("abc123", "abc123"),
+        ('"abc123"', "abc123"),
+        ('"a\\"b"', 'a"b'),
+        ('"a\\073b\\054c"', "a;b,c"),
+        ('"a\\\\b"', "a\\b"),
+        ('"\\400"', "400"),
+        ('"', '"'),
+        ('abc"', 'abc"'),
+        ('""', ""),
+    ],
+)
+def test_unquote_cookie_pins_quoting_rules(raw: str, expected: str) -> None:
+    """표준 라이브러리 내부 함수에 기대지 않는 쿠키 값 unquote 규칙."""
+    assert user_info_middleware._unquote_cookie(raw) == expected
+
+
+def test_collect_request_info_normalizes_query_string_like_query_params() -> None:
+    middleware = _middleware()
+    scope = {**_scope([]), "query_string": b"q=a%20b&empty=&tag=%ED%95%9C"}
+
+    record = middleware._collect_request_info(scope)
+
+    assert record.query_string == str(Request(scope).query_params) == "q=a+b&empty=&tag=%ED%95%9C"
+
+
+def test_collect_request_info_clips_client_values_to_column_lengths() -> None:
+    """긴 헤더·경로를 보낸 요청이 배치 저장을 깨뜨리지 않도록 컬럼 길이로 자른다."""
+    middleware = _middleware()
+    scope = {
+        **_scope(
+            [
+                (b"x-forwarded-for", b"9" * 300),
+                (b"x-real-ip", b"8" * 100),
+                (b"accept-language", b"k" * 300),
+                (b"cookie", b"session_id=" + b"s" * 300),
+            ]
+        ),
+        "path": "/" + "p" * 5000,
+    }
+
+    record = middleware._collect_request_info(scope)
+
+    assert len(record.ip_address) == 45
+    assert len(record.forwarded_for) == 255
+    assert len(record.real_ip) == 45
+    assert len(record.accept_language) == 255
+    assert len(record.session_id) == 100
+    assert len(record.request_path) == 2048
+
+
+def test_collect_request_info_falls_back_to_client_address() -> None:
+    middleware = _middleware()
+
+    assert middleware._collect_request_info(_scope([])).ip_address == "10.0.0.9"
+    assert middleware._collect_request_info(_scope([], client=None)).ip_address == "unknown"
+
+
+def test_client_ip_prefers_forwarded_then_real_ip() -> None:
+    middleware = _middleware()
+    scope = _scope([])
+
+    assert middleware._get_client_ip(" 1.1.1.1 ,2.2.2.2", "3.3.3.3", scope) == "1.1.1.1"
+    assert middleware._get_client_ip(None, "3.3.3.3", scope) == "3.3.3.3"
+    assert middleware._get_client_ip(",", "3.3.3.3", scope) == "3.3.3.3"
+    assert middleware._get_client_ip(None, None, scope) == "10.0.0.9"
@@ -0,0 +1,74 @@
+"""UserAccessLogAdmin 목록 개수 상한 테스트.
+
+SQLAdmin 이 만든 개수 쿼리를 정렬 없이 ``ADMIN_COUNT_CAP`` 건까지만 세도록
+바꾸는지, 필터·검색 조건은 유지하는지 검증한다.
+"""
+
+from sqlalchemy import func, select
+from starlette.requests import Request
+
+from app.domains.home.admin import ADMIN_COUNT_CAP, UserAccessLogAdmin
+from app.domains.home.models.models import UserAccessLog
+
+
+async def test_count_is_bounded_and_unordered(monkeypatch) -> None:
+    view = UserAccessLogAdmin()
+    captured = []
+
+    async def run_query(stmt):
+        captured.append(stmt)
+        return [7]
+
+    monkeypatch.setattr(view, "_run_query", run_query)
+    listing = (
+        select(UserAccessLog)
+        .where(UserAccessLog.is_bot.is_(False))
+        .order_by(UserAccessLog.created_at.desc())
+    )
+
+    count = await view.count(None, select(func.count()).select_from(listing.subquery()))
+
+    sql = str(captured[0].compile(compile_kwargs={"literal_binds": True}))
+    assert count == 7
+    assert f"LIMIT {ADMIN_COUNT_CAP}" in sql
+    assert "ORDER BY" not in sql, "개수 쿼리에는 정렬이 필요 없음"
+    assert "is_bot IS false" in sql, "필터 조건은 유지되어야 함"
+    assert "user_agent" not in sql, "개수에는 id 만 읽어야 함"
+
+
+async def test_count_bounds_the_statement_built_by_sqladmin_list(monkeypatch) -> None:
+    """SQLAdmin ``list()`` 가 실제로 만든 개수 쿼리에도 상한이 적용된다."""
+    view = UserAccessLogAdmin()
+    captured = []
+
+    async def run_query(stmt):
+        captured.append(stmt)
+        return [3] if len(captured) == 1 else []
+
+    monkeypatch.setattr(view, "_run_query", run_query)
+    # 개수 쿼리 형태만 보므로 컬럼 필터는 건너뛴다 (검색 조건으로 WHERE 유지를 확인)
+    monkeypatch.setattr(view, "get_filters", list)
+    request = Request({"type": "http", "query_string": b"search=10.0.0", "headers": []})
+
+    pagination = await view.list(request)
+
+    sql = str(captured[0].compile(compile_kwargs={"literal_binds": True}))
+    assert pagination.count == 3
+    assert f"LIMIT {ADMIN_COUNT_CAP}" in sql
+    assert "ORDER BY" not in sql
+    assert "10.0.0" in sql, "검색 조건은 유지되어야 함"
+
+
+async def test_count_falls_back_for_unexpected_statement_shape(monkeypatch) -> None:
+    view = UserAccessLogAdmin()
+    captured = []
+
+    async def run_query(stmt):
+        captured.append(stmt)
+        return [5]
+
+    monkeypatch.setattr(view, "_run_query", run_query)
+    stmt = select(func.count(UserAccessLog.id)).select_from(UserAccessLog)
+
+    assert await view.count(None, stmt) == 5
+    assert captured == [stmt], "서브쿼리 하나가 아닌 쿼리는 그대로 세야 함"
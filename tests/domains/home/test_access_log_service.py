@@ -3,13 +3,19 @@
 in-memory sqlite 로 service → repository → ORM CRUD 흐름을 검증한다.
 """
 
+import asyncio
+from datetime import datetime
+
 import pytest
 import pytest_asyncio
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from app.core.db.session import Base
+from app.domains.home.exceptions import InvalidCursorException
 from app.domains.home.models.models import UserAccessLog  # noqa: F401  (register table)
 from app.domains.home.services.user_access_log_service import UserAccessLogService
+from app.utils.pagination import encode_cursor
 
 
 @pytest_asyncio.fixture
@@ -53,3 +59,315 @@ async def test_stats_counts_device_type(session):
     stats = await service.get_stats()
     assert stats.total_count == 1
     assert any(d.device_type == "desktop" and d.count == 1 for d in stats.device_types)
+
+
+async def test_stats_aggregates_every_dimension_in_one_query(session):
+    """집계 테이블이 비어 있으면 원본 로그를 UNION ALL 한 번으로 직접 집계한다."""
+    service = UserAccessLogService(session)
+    await service.create_access_logs(
+        [
+            {
+                "ip_address": "1.1.1.1",
+                "request_path": "/a",
+                "request_method": "GET",
+                "device_type": "mobile",
+                "os_name": "iOS",
+                "browser_name": "Safari",
+            },
+            {"ip_address": "2.2.2.2", "request_path": "/b", "request_method": "GET"},
+        ]
+    )
+    await session.commit()
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(session.bind.sync_engine, "before_cursor_execute", record)
+    try:
+        stats = await service.get_stats()
+    finally:
+        event.remove(session.bind.sync_engine, "before_cursor_execute", record)
+
+    assert len(statements) == 2, "집계 테이블 조회 + 원본 직접 집계 한 번이어야 함"
+    assert stats.total_count == 2
+    assert {(d.device_type, d.count) for d in stats.device_types} == {("mobile", 1), ("unknown", 1)}
+    assert {(o.os_name, o.count) for o in stats.os_list} == {("iOS", 1), ("unknown", 1)}
+    assert {(b.browser_name, b.count) for b in stats.browsers} == {("Safari", 1), ("unknown", 1)}
+
+
+async def test_stats_reads_rollup_after_refresh(session):
+    service = UserAccessLogService(session)
+    await service.create_access_logs(
+        [
+            {"ip_address": "1.1.1.1", "request_path": "/a", "request_method": "GET"},
+            {
+                "ip_address": "2.2.2.2",
+                "request_path": "/b",
+                "request_method": "GET",
+                "device_type": "desktop",
+            },
+        ]
+    )
+    await service.refresh_stats()
+    await session.commit()
+    # 집계 이후 적재된 로그는 다음 갱신 전까지 통계에 반영되지 않는다
+    await service.create_access_logs(
+        [{"ip_address": "3.3.3.3", "request_path": "/c", "request_method": "GET"}]
+    )
+    await session.commit()
+
+    stats = await service.get_stats()
+
+    assert stats.total_count == 2
+    assert {(d.device_type, d.count) for d in stats.device_types} == {
+        ("desktop", 1),
+        ("unknown", 1),
+    }
+
+    await service.refresh_stats()
+    await session.commit()
+    assert (await service.get_stats()).total_count == 3, "재집계 시 이전 집계를 교체해야 함"
+
+
+async def test_refresh_stats_reads_source_with_plain_select(session):
+    """원본 집계는 잠금 없는 SELECT 로 읽고, 집계 테이블에는 결과 행만 INSERT 한다."""
+    service = UserAccessLogService(session)
+    await service.create_access_logs(
+        [{"ip_address": "1.1.1.1", "request_path": "/a", "request_method": "GET"}]
+    )
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(" ".join(statement.split()).upper())
+
+    sync_engine = session.get_bind()
+    event.listen(sync_engine, "before_cursor_execute", _record)
+    try:
+        await service.refresh_stats()
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", _record)
+
+    assert statements[0].startswith("SELECT") and "USER_ACCESS_LOGS" in statements[0]
+    inserts = [s for s in statements if s.startswith("INSERT")]
+    assert inserts and all("USER_ACCESS_LOGS " not in s and " SELECT " not in s for s in inserts)
+
+
+@pytest.mark.asyncio
+async def test_create_access_logs_bulk_inserts_rows(session):
+    service = UserAccessLogService(session)
+    await service.create_access_logs(
+        [
+            {"ip_address": f"10.0.0.{i}", "request_path": f"/{i}", "request_method": "GET"}
+            for i in range(3)
+        ]
+    )
+    await session.commit()
+
+    logs, total = await service.get_access_logs()
+    assert total == 3
+    assert len({log.id for log in logs}) == 3  # 행마다 고유 id
+    assert all(len(log.id) == 32 for log in logs)  # 컬럼 기본값(하이픈 없는 hex)
+    assert all(log.created_at is not None for log in logs)  # 컬럼 기본값 적용
+
+
+async def test_cursor_pages_cover_every_row_once_even_with_equal_timestamps(session):
+    service = UserAccessLogService(session)
+    same_time = datetime(2026, 1, 1, 12, 0, 0)
+    await service.create_access_logs(
+        [
+            {
+                "ip_address": "1.1.1.1",
+                "request_path": f"/{i}",
+                "request_method": "GET",
+                "created_at": same_time,
+            }
+            for i in range(5)
+        ]
+    )
+    await session.commit()
+
+    seen: list[str] = []
+    cursor = None
+    while True:
+        logs, total = await service.stream_access_logs(limit=2, ip_address="1.1.1.1", cursor=cursor)
+        page = [log async for log in logs]
+        seen.extend(log.id for log in page)
+        if len(page) < 2:
+            break
+        cursor = encode_cursor(page[-1].created_at, page[-1].id)
+
+    assert total == 5
+    assert len(seen) == 5 and len(set(seen)) == 5, "같은 시각 행도 id 로 이어 읽어야 함"
+    assert seen == sorted(seen, reverse=True)
+
+
+async def test_invalid_cursor_is_rejected(session):
+    service = UserAccessLogService(session)
+
+    with pytest.raises(InvalidCursorException):
+        await service.stream_access_logs(cursor="not-a-cursor")
+
+
+def test_list_columns_match_response_schema():
+    from app.domains.home.repositories.user_access_log_repository import LIST_COLUMNS
+    from app.domains.home.schemas.user_access_log_schema import UserAccessLogResponse
+
+    assert set(LIST_COLUMNS) == set(UserAccessLogResponse.model_fields)
+
+
+async def test_list_queries_skip_columns_not_in_response(session):
+    service = UserAccessLogService(session)
+    await service.create_access_log(
+        {
+            "ip_address": "1.2.3.4",
+            "request_path": "/x",
+            "request_method": "GET",
+            "user_agent": "Mozilla/5.0",
+        }
+    )
+    await session.commit()
+    session.expunge_all()
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(session.bind.sync_engine, "before_cursor_execute", record)
+    try:
+        logs = await service.get_recent_logs()
+        await service.get_logs_by_date_range(datetime(2000, 1, 1), datetime(2100, 1, 1))
+    finally:
+        event.remove(session.bind.sync_engine, "before_cursor_execute", record)
+
+    assert logs[0].request_path == "/x"
+    assert statements and all("user_agent" not in s for s in statements)
+    assert len(session.identity_map) == 0, "목록 조회는 ORM 인스턴스를 만들지 않아야 함"
+
+
+async def test_cached_stats_skip_db_until_refresh(session):
+    service = UserAccessLogService(session)
+    service.invalidate_stats_cache()
+    await service.create_access_log(
+        {"ip_address": "1.1.1.1", "request_path": "/a", "request_method": "GET"}
+    )
+    await session.commit()
+    first = await service.get_cached_stats()
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(session.bind.sync_engine, "before_cursor_execute", record)
+    try:
+        second = await service.get_cached_stats()
+    finally:
+        event.remove(session.bind.sync_engine, "before_cursor_execute", record)
+    await service.refresh_stats()
+
+    assert second is first
+    assert statements == [], "TTL 안의 반복 조회는 DB 를 읽지 않아야 함"
+    assert await service.get_cached_stats() is not first, "집계 갱신 후에는 캐시를 버려야 함"
+
+
+async def test_concurrent_list_requests_share_one_count(session):
+    service = UserAccessLogService(session)
+    service.invalidate_stats_cache()
+    await service.create_access_log(
+        {"ip_address": "1.1.1.1", "request_path": "/a", "request_method": "GET"}
+    )
+    await session.commit()
+    counts: list[str] = []
+
+    def record(conn, cursor, statement, *args) -> None:
+        if "count(" in statement.lower():
+            counts.append(statement)
+
+    event.listen(session.bind.sync_engine, "before_cursor_execute", record)
+    try:
+        results = await asyncio.gather(
+            *(service.stream_access_logs(ip_address="1.1.1.1") for _ in range(5))
+        )
+        _, again = await service.stream_access_logs(ip_address="1.1.1.1")
+        _, other = await service.stream_access_logs(ip_address="9.9.9.9")
+    finally:
+        event.remove(session.bind.sync_engine, "before_cursor_execute", record)
+
+    assert [total for _, total in results] == [1] * 5
+    assert again == 1 and other == 0
+    assert len(counts) == 2, "같은 필터의 동시 요청 · TTL 안 재요청은 COUNT 를 한 번만 실행해야 함"
+
+
+async def test_count_cache_stays_bounded_under_distinct_filters(session, monkeypatch):
+    from app.domains.home.services import user_access_log_service as module
+
+    monkeypatch.setattr(module, "_COUNT_CACHE_MAX", 3)
+    service = UserAccessLogService(session)
+    service.invalidate_stats_cache()
+
+    for i in range(10):
+        await service.stream_access_logs(ip_address=f"10.0.0.{i}")
+
+    assert len(module._count_cache) == 3, "요청마다 다른 필터로도 캐시가 커지지 않아야 함"
+    assert ("ip_address", "10.0.0.9") in next(reversed(module._count_cache))
+
+
+async def test_date_range_pages_with_cursor_on_shared_template(session):
+    from app.domains.home.repositories.user_access_log_repository import (
+        UserAccessLogRepository,
+        _list_template,
+    )
+
+    service = UserAccessLogService(session)
+    await service.create_access_logs(
+        [
+            {
+                "ip_address": "1.1.1.1",
+                "request_path": f"/{i}",
+                "request_method": "GET",
+                "created_at": datetime(2026, 1, 1, 12, 0, i),
+            }
+            for i in range(4)
+        ]
+    )
+    await session.commit()
+    repo = UserAccessLogRepository(session)
+    start, end = datetime(2026, 1, 1, 12, 0, 1), datetime(2026, 1, 1, 12, 0, 3)
+
+    first = await repo.get_by_date_range(start, end, limit=2)
+    cursor = (first[-1].created_at, first[-1].id)
+    second = await repo.get_by_date_range(start, end, limit=2, cursor=cursor)
+
+    assert [log.request_path for log in first] == ["/3", "/2"]
+    assert [log.request_path for log in second] == ["/1"]
+    assert _list_template(False, False, True, True) is _list_template(False, False, True, True)
+
+
+async def test_count_by_device_type_groups_null_as_unknown_in_sql(session):
+    from app.domains.home.repositories.user_access_log_repository import UserAccessLogRepository
+
+    await UserAccessLogService(session).create_access_logs(
+        [
+            {"ip_address": "1.1.1.1", "request_path": "/a", "request_method": "GET"},
+            {
+                "ip_address": "2.2.2.2",
+                "request_path": "/b",
+                "request_method": "GET",
+                "device_type": "desktop",
+            },
+        ]
+    )
+    await session.commit()
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(session.bind.sync_engine, "before_cursor_execute", record)
+    try:
+        counts = await UserAccessLogRepository(session).count_by_device_type()
+    finally:
+        event.remove(session.bind.sync_engine, "before_cursor_execute", record)
+
+    assert counts == {"unknown": 1, "desktop": 1}
+    assert "coalesce" in statements[0].lower()
@@ -0,0 +1,90 @@
+"""HomeAccessLogSink 저장 테스트.
+
+sink 가 백그라운드 세션 팩토리의 begin() 트랜잭션으로 저장해,
+명시적 commit 없이도 행이 반영되고 실패 시에는 반영되지 않는지 검증한다.
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.db.session import Base
+from app.core.exception import DuplicateException
+from app.core.middlewares.access_log_batcher import AccessLogBatcher
+from app.core.middlewares.access_log_record import AccessLogRecord
+from app.core.middlewares.access_log_sink import get_access_log_sink, set_access_log_sink
+from app.domains.home import access_log_sink
+from app.domains.home.access_log_sink import HomeAccessLogSink
+from app.domains.home.models.models import UserAccessLog
+
+
+def _row(path: str) -> dict:
+    return {"ip_address": "1.2.3.4", "request_path": path, "request_method": "GET"}
+
+
+@pytest_asyncio.fixture
+async def maker(monkeypatch):
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(access_log_sink, "BackgroundSessionLocal", factory)
+    yield factory
+    await engine.dispose()
+
+
+async def _count(maker) -> int:
+    async with maker() as session:
+        return await session.scalar(select(func.count(UserAccessLog.id)))
+
+
+async def test_save_many_commits_without_explicit_commit(maker) -> None:
+    await HomeAccessLogSink().save_many([_row("/a"), _row("/b")])
+    await HomeAccessLogSink().save(_row("/c"))
+
+    assert await _count(maker) == 3
+
+
+async def test_save_many_rolls_back_on_failure(maker) -> None:
+    duplicate = {**_row("/a"), "id": "same-id"}
+
+    with pytest.raises(DuplicateException):
+        await HomeAccessLogSink().save_many([_row("/ok"), duplicate, duplicate])
+
+    assert await _count(maker) == 0
+
+
+def _with_duplicate_id(row: dict) -> dict:
+    return {**row, "id": "same-id"} if row["request_path"] == "/dup" else row
+
+
+class DuplicateIdSink(HomeAccessLogSink):
+    """``/dup`` 행마다 같은 id 를 붙여 배치를 중복 키로 깨뜨린다."""
+
+    async def save(self, data: dict) -> None:
+        await super().save(_with_duplicate_id(data))
+
+    async def save_many(self, rows: list[dict]) -> None:
+        await super().save_many([_with_duplicate_id(row) for row in rows])
+
+
+async def test_batcher_keeps_good_rows_when_one_row_breaks_the_batch(maker) -> None:
+    """일괄 저장은 한 트랜잭션이라 통째로 롤백되지만, 배치 수집기가 건별로 다시 저장한다."""
+    original = get_access_log_sink()
+    set_access_log_sink(DuplicateIdSink())
+    batcher = AccessLogBatcher(max_batch=10, max_wait=0.01)
+    batcher.start()
+    try:
+        for path in ("/a", "/dup", "/dup", "/b"):
+            batcher.enqueue(AccessLogRecord(ip_address="1.2.3.4", request_path=path))
+        await batcher.stop(timeout=1.0)
+    finally:
+        set_access_log_sink(original)
+
+    assert await _count(maker) == 3, "중복 행 하나만 버리고 나머지 3건은 저장해야 함"
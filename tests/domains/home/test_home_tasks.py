@@ -6,3 +6,12 @@ def test_aggregate_task_registered():
     from app.celery.app import celery_app
 
     assert "home.aggregate_access_stats" in celery_app.tasks
+
+
+def test_stats_rollup_refresh_is_scheduled_on_beat():
+    from app.celery.app import celery_app
+    from config import middleware_settings
+
+    entry = celery_app.conf.beat_schedule["home.aggregate_access_stats"]
+    assert entry["task"] == "home.aggregate_access_stats"
+    assert entry["schedule"] == middleware_settings.ACCESS_LOG_STATS_REFRESH_SECONDS
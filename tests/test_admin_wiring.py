@@ -17,7 +17,7 @@ import pytest
 
 DOMAINS_WITH_ADMIN = ("blog", "home", "reply", "sns", "user")
 
-EXPECTED_MANAGED_MODELS = {"Post", "Reply", "SnsPost", "User", "UserAccessLog"}
+EXPECTED_MANAGED_MODELS = {"Post", "Reply", "SnsPost", "User", "UserAccessLog", "UserAccessLogStat"}
 
 
 @pytest.mark.parametrize("domain", DOMAINS_WITH_ADMIN)
@@ -5,6 +5,68 @@ def test_main_app_boots_and_serves_health():
     import main
 
     client = TestClient(main.app)
-    assert client.get("/health").status_code == 200
+    health = client.get("/health")
+    assert health.status_code == 200
+    assert health.json() == {"status": "healthy", "version": main.app_settings.VERSION}
     paths = {r.path for r in main.app.routes}
     assert any(p.startswith("/api/v1/home") for p in paths)
+
+
+def test_app_exception_handler_serves_default_and_custom_payloads():
+    from fastapi import FastAPI
+
+    import main
+    from app.core.exception import NotFoundException
+
+    app = FastAPI()
+    main._register_exception_handlers(app)
+
+    @app.get("/default")
+    async def default():
+        raise NotFoundException()
+
+    @app.get("/custom")
+    async def custom():
+        raise NotFoundException(message="게시글 없음", detail={"id": 1})
+
+    client = TestClient(app)
+
+    resp = client.get("/default")
+    assert resp.status_code == 404
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.json() == {
+        "error_code": "NOT_FOUND",
+        "message": NotFoundException.message,
+        "detail": None,
+    }
+
+    resp = client.get("/custom")
+    assert resp.status_code == 404
+    assert resp.json() == {"error_code": "NOT_FOUND", "message": "게시글 없음", "detail": {"id": 1}}
+
+
+def test_http_exception_handler_reuses_body_and_keeps_headers():
+    from fastapi import FastAPI
+
+    import main
+
+    app = FastAPI()
+    main._register_exception_handlers(app)
+
+    @app.get("/only-get")
+    async def only_get():
+        return {}
+
+    client = TestClient(app)
+    main._http_error_body.cache_clear()
+
+    missing = [client.get("/nope"), client.get("/nope-again")]
+    wrong_method = client.post("/only-get")
+
+    assert [r.json() for r in missing] == [
+        {"error_code": "HTTP_404", "message": "Not Found", "detail": None}
+    ] * 2
+    assert missing[0].headers["content-type"] == "application/json"
+    assert main._http_error_body.cache_info().hits == 1, "같은 404 본문은 한 번만 직렬화해야 함"
+    assert wrong_method.status_code == 405
+    assert wrong_method.headers["allow"] == "GET", "405 의 Allow 헤더를 잃지 않아야 함"
@@ -11,6 +11,7 @@ from collections import defaultdict
 EXPECTED: dict[str, frozenset[str]] = {
     "/health": frozenset({"GET"}),
     "/api/v1/home/access-logs": frozenset({"GET"}),
+    "/api/v1/home/access-logs/export": frozenset({"GET"}),
     "/api/v1/home/access-logs/recent": frozenset({"GET"}),
     "/api/v1/home/access-logs/by-ip/{ip_address}": frozenset({"GET"}),
     "/api/v1/home/access-logs/by-user/{user_id}": frozenset({"GET"}),
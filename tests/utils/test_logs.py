@@ -45,6 +45,7 @@ def test_mixin_injects_classname():
         pass
 
     assert _Svc().log.extra["classname"] == "_Svc"
+    assert _Svc().log is _Svc().log, "어댑터는 클래스마다 한 번만 만들어야 함"
 
 
 def test_format_contains_all_fields():
@@ -72,3 +73,131 @@ def test_get_logger_end_to_end():
     text = buf.getvalue()
     assert "hello world" in text
     assert "app=" in text
+    assert get_logger("test.e2e") is logger is logging.getLogger("test.e2e")
+
+
+class _FileLoggingCaller:
+    def run(self) -> None:
+        get_logger("test.file_queue").error("queued boom")
+
+
+def test_file_handlers_are_written_by_queue_listener(monkeypatch, tmp_path):
+    """운영 파일 로깅은 root 의 QueueHandler 로만 들어가고 리스너 스레드가 파일에 쓴다."""
+    from logging.handlers import QueueHandler, RotatingFileHandler
+
+    from app.utils.logs import config as log_config
+    from app.utils.logs import setup
+    from config import log_settings
+
+    monkeypatch.setattr(log_config, "_env", lambda: "production")
+    monkeypatch.setattr(log_settings, "LOG_FILE_ENABLED", True)
+    monkeypatch.setattr(type(log_settings), "get_log_dir", lambda self: tmp_path)
+    try:
+        setup.configure_logging(force=True)
+        root_handlers = logging.getLogger().handlers
+        _FileLoggingCaller().run()
+        setup._stop_listener()  # 큐에 남은 레코드를 모두 쓰고 멈춤
+
+        assert any(isinstance(h, QueueHandler) for h in root_handlers)
+        assert not any(isinstance(h, RotatingFileHandler) for h in root_handlers)
+        written = "".join(p.read_text(encoding="utf-8") for p in tmp_path.iterdir())
+        assert "queued boom" in written
+        assert ":_FileLoggingCaller:run:" in written, "classname 은 호출 스레드에서 채워야 함"
+    finally:
+        monkeypatch.undo()
+        setup.configure_logging(force=True)
+
+
+def test_buffered_file_handler_defers_flush_until_error(tmp_path):
+    from app.utils.logs.handlers import BufferedRotatingFileHandler
+
+    path = tmp_path / "app.log"
+    handler = BufferedRotatingFileHandler(path, encoding="utf-8", flush_interval=3600)
+    handler.setFormatter(logging.Formatter("{message}", style="{"))
+    logger = logging.getLogger("test.buffered_file")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        logger.warning("buffered line")
+        after_warning = path.read_text(encoding="utf-8")
+        logger.error("error line")
+        after_error = path.read_text(encoding="utf-8")
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = True
+        handler.close()
+
+    assert after_warning == "", "ERROR 미만 레코드는 버퍼에 모아 두어야 함"
+    assert after_error == "buffered line\nerror line\n"
+
+
+def test_buffered_file_handler_rotates_by_bytes_written_without_flushing(tmp_path):
+    """회전 판단이 tell() 로 버퍼를 flush 하지 않고, 쓴 바이트 수로 회전한다."""
+    from app.utils.logs.handlers import BufferedRotatingFileHandler
+
+    path = tmp_path / "app.log"
+    handler = BufferedRotatingFileHandler(
+        path, maxBytes=50, backupCount=1, encoding="utf-8", flush_interval=3600
+    )
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger = logging.getLogger("test.rotating_file")
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        # 한 줄 19바이트(한글 3자 = 9바이트): 세 번째 줄에서 50바이트를 넘는다
+        logger.warning("가나다 line one")
+        logger.warning("가나다 line two")
+        before_rotation = path.read_text(encoding="utf-8")
+        logger.warning("가나다 line three")
+        rotated = (tmp_path / "app.log.1").read_text(encoding="utf-8")
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = True
+        handler.close()
+
+    assert before_rotation == "", "maxBytes 가 있어도 ERROR 미만 레코드는 버퍼에 남아야 함"
+    assert rotated == "가나다 line one\n가나다 line two\n"
+    assert path.read_text(encoding="utf-8") == "가나다 line three\n"
+
+
+def test_buffered_file_handler_switches_date_file_at_midnight(tmp_path):
+    """파일명의 {date} 는 레코드 날짜로 채우고, 자정 이후 레코드는 새 날짜 파일에 쓴다."""
+    from datetime import datetime, timedelta
+
+    from app.utils.logs.handlers import BufferedRotatingFileHandler
+    from config import timezone_settings
+
+    handler = BufferedRotatingFileHandler(tmp_path / "{date}_app.log", encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    today = timezone_settings.now().date()
+    tomorrow = today + timedelta(days=1)
+    try:
+        handler.emit(logging.makeLogRecord({"msg": "today"}))
+        next_day = logging.makeLogRecord({"msg": "tomorrow"})
+        next_day.created = datetime.combine(
+            tomorrow, datetime.min.time(), timezone_settings.tz
+        ).timestamp()
+        handler.emit(next_day)
+    finally:
+        handler.close()
+
+    assert (tmp_path / f"{today.isoformat()}_app.log").read_text(encoding="utf-8") == "today\n"
+    assert (tmp_path / f"{tomorrow.isoformat()}_app.log").read_text(encoding="utf-8") == (
+        "tomorrow\n"
+    )
+
+
+def test_file_queue_drops_records_below_file_level(monkeypatch, tmp_path):
+    """어느 파일에도 쓰이지 않을 레코드는 QueueHandler 에서 포맷·큐잉 전에 걸러진다."""
+    from app.utils.logs import config as log_config
+    from config import log_settings
+
+    monkeypatch.setattr(log_config, "_env", lambda: "production")
+    monkeypatch.setattr(log_settings, "LOG_FILE_ENABLED", True)
+    monkeypatch.setattr(log_settings, "LOG_FILE_LEVEL", "WARNING")
+    monkeypatch.setattr(type(log_settings), "get_log_dir", lambda self: tmp_path)
+
+    handlers = log_config.build_dictconfig()["handlers"]
+
+    assert handlers["file_queue"]["level"] == logging.WARNING
+    assert "filters" not in handlers["file"], "ContextFilter 는 호출 스레드에서 한 번만 실행"
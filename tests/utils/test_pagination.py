@@ -1,6 +1,10 @@
 """Pagination 데이터클래스 유틸 테스트."""
 
-from app.utils.pagination import Pagination
+from datetime import datetime
+
+import pytest
+
+from app.utils.pagination import Pagination, decode_cursor, encode_cursor
 
 
 def test_create_computes_derived_fields():
@@ -56,3 +60,24 @@ def test_zero_total_yields_single_page():
     """total 이 0이어도 total_pages 는 최소 1이다(0 나눗셈 방지)."""
     page = Pagination.create(items=[], total=0, page=1, page_size=20)
     assert page.total_pages == 1
+
+
+def test_total_pages_is_exact_for_huge_totals():
+    """total_pages 는 정수 연산이라 float 정밀도를 넘는 total 에서도 정확하다."""
+    page = Pagination.create(items=[], total=2**53 + 1, page=1, page_size=1)
+    assert page.total_pages == 2**53 + 1
+
+
+def test_cursor_round_trips_sort_key():
+    """encode_cursor() 로 만든 커서는 같은 (created_at, id) 로 복원된다."""
+    created_at = datetime(2026, 1, 2, 3, 4, 5, 678901)
+    cursor = encode_cursor(created_at, "abc|def")
+    assert "=" not in cursor  # URL 쿼리에 그대로 실을 수 있다
+    assert decode_cursor(cursor) == (created_at, "abc|def")
+
+
+@pytest.mark.parametrize("cursor", ["", "%%%", encode_cursor(datetime(2026, 1, 1), "x")[:-4]])
+def test_decode_cursor_rejects_malformed_input(cursor):
+    """형식이 깨진 커서는 ValueError 로 알린다."""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)